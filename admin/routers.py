@@ -1,17 +1,22 @@
 # routes/admin.py
 from fastapi import APIRouter, Depends, Request, HTTPException
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from fastapi.routing import APIRoute
 from starlette.responses import HTMLResponse
 from starlette.templating import Jinja2Templates
 
 from feedback.models import Feedback
+from common.cache_utils import get_all_cache_stats
 from common.dependencies import get_admin
 from tortoise.expressions import Q
 
+from notifications.dto import NotificationGlobalCreateDto
+from notifications.models import NotificationArchiveRun
+from notifications.service import NotificationService
 from parties.models import PartyParticipant, Party
 from users.models import User
+from users.cache import invalidate_auth_user
 from tortoise.functions import Count
 
 admin_router: APIRouter = APIRouter(
@@ -151,4 +156,42 @@ async def toggle_user_active(user_id: int) -> Dict[str, Any]:
 
     user.is_active = not user.is_active
     await user.save()
+    await invalidate_auth_user(user.id)
     return {"success": True, "is_active": user.is_active}
+
+
+@admin_router.get("/cache-stats")
+async def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """캐시별 적중/미스 수 (요청을 처리한 워커 프로세스 기준)"""
+    return get_all_cache_stats()
+
+
+@admin_router.post("/notifications/global")
+async def create_global_notification(
+    notification_data: NotificationGlobalCreateDto,
+) -> Dict[str, Any]:
+    """전체 공지 알림 발송 (사용자 수와 무관하게 한 건만 저장)"""
+    notification = await NotificationService.create_global_notification(
+        notification_data
+    )
+    return {"success": True, "id": notification.id}
+
+
+@admin_router.get("/notifications/archive-runs")
+async def list_notification_archive_runs(limit: int = 30) -> List[Dict[str, Any]]:
+    """알림 보관 작업 실행 기록 (최근 순)"""
+    return await (
+        NotificationArchiveRun.all()
+        .order_by("-id")
+        .limit(limit)
+        .values(
+            "id",
+            "created_at",
+            "finished_at",
+            "cutoff_at",
+            "archived_count",
+            "deleted_read_count",
+            "batch_count",
+            "error",
+        )
+    )
@@ -0,0 +1,193 @@
+"""
+API 로깅 벤치마크: /api/party/list 호출 시 이전 LoggingAPIRoute 와 현재 구현의 지연 시간 비교.
+
+    APP_ENV=test SECRET_KEY=bench python -m benchmarks.api_logging --requests 500
+
+같은 엔드포인트를 라우트 클래스만 바꿔 등록하고, 로그는 포맷까지만 수행하는 핸들러로 받습니다.
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Awaitable, List, Type
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+from starlette.requests import Request
+from starlette.responses import Response
+
+import common.logging_configs as logging_configs
+from common.config import logger
+from common.logging_configs import LoggingAPIRoute
+from common.middlewares import AuthMiddleware
+from common.test_config import close_db, db_init
+from parties.dtos import PartyListDetail
+from parties.models import Party
+from parties.routers import get_party_list
+from users.models import Sport, User
+
+
+def legacy_request_log(request: Request) -> None:
+    extra = {
+        "httpMethod": request.method,
+        "url": request.url.path,
+        "headers": str(dict(request.headers)),
+        "queryParams": str(request.query_params),
+        "body": "",
+    }
+    logger.info(f"Request Info: {extra}")
+
+
+def legacy_response_log(request: Request, response: Response) -> None:
+    extra = {
+        "httpMethod": request.method,
+        "url": request.url.path,
+        "headers": str(dict(request.headers)),
+        "queryParams": str(request.query_params),
+        "body": response.body.decode("UTF-8") if response.body else "",
+    }
+    logger.info(f"Response Info: {extra}")
+
+
+class LegacyLoggingAPIRoute(APIRoute):
+    """이전 구현: 모든 헤더와 전체 본문을 매 요청마다 문자열로 기록"""
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            legacy_request_log(request)
+            response: Response = await original_route_handler(request)
+            legacy_response_log(request, response)
+            return response
+
+        return custom_route_handler
+
+
+class FormattingHandler(logging.Handler):
+    """메시지 포맷까지만 수행하고 버리는 핸들러 (Mongo 핸들러의 emit 비용 근사)"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record.getMessage()
+
+
+def build_app(route_class: Type[APIRoute]) -> FastAPI:
+    router = APIRouter(prefix="/api/party", route_class=route_class)
+    router.add_api_route(
+        "/list", get_party_list, response_model=List[PartyListDetail], methods=["GET"]
+    )
+    application = FastAPI()
+    application.include_router(router)
+    application.add_middleware(AuthMiddleware)
+    return application
+
+
+async def seed() -> None:
+    organizer = await User.create(name="bench", profile_image="bench")
+    sport = await Sport.create(name="프리다이빙")
+    now = datetime.now(UTC)
+    await Party.bulk_create(
+        [
+            Party(
+                title=f"파티 {index}",
+                body="긴 본문 " * 300,
+                place_name="딥스테이션",
+                address="address",
+                organizer_user=organizer,
+                sport=sport,
+                gather_at=now + timedelta(days=1),
+                longitude=127.0,
+                latitude=37.0,
+            )
+            for index in range(100)
+        ]
+    )
+
+
+async def measure(label: str, application: FastAPI, requests: int) -> None:
+    headers = {"Authorization": "", "User-Agent": "bench", "Cookie": "a" * 500}
+    async with AsyncClient(app=application, base_url="http://bench") as client:
+        for _ in range(20):
+            await client.get("/api/party/list", headers=headers)
+        elapsed_ms = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            await client.get("/api/party/list", headers=headers)
+            elapsed_ms.append((time.perf_counter() - started) * 1000)
+    print(f"{label:<24} median {statistics.median(elapsed_ms):8.3f} ms/request")
+
+
+async def measure_logging_only(response_body: bytes, iterations: int) -> None:
+    """DB 조회를 제외한 로깅 코드만의 요청당 비용"""
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/party/list",
+            "query_string": b"page=1",
+            "headers": [
+                (b"authorization", b"Bearer " + b"t" * 200),
+                (b"user-agent", b"bench"),
+                (b"cookie", b"a" * 500),
+            ],
+        }
+    )
+    response = Response(content=response_body, media_type="application/json")
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        legacy_request_log(request)
+        legacy_response_log(request, response)
+    legacy_us = (time.perf_counter() - started) * 1e6 / iterations
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await LoggingAPIRoute._request_log(request)
+        LoggingAPIRoute._response_log(request, response)
+    current_us = (time.perf_counter() - started) * 1e6 / iterations
+
+    print(f"response body {len(response_body)} bytes, logging cost per request:")
+    print(f"{'legacy':<24} {legacy_us:8.1f} us")
+    print(f"{'current (rate=1.0)':<24} {current_us:8.1f} us")
+
+
+async def main(requests: int) -> None:
+    await db_init("sqlite://:memory:")
+    try:
+        await seed()
+        await run(requests)
+    finally:
+        await close_db()
+
+
+async def run(requests: int) -> None:
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(FormattingHandler())
+    logger.propagate = False
+
+    baseline_app = build_app(APIRoute)
+    legacy_app = build_app(LegacyLoggingAPIRoute)
+    current_app = build_app(LoggingAPIRoute)
+    logging_configs.API_LOG_ROUTE_SAMPLE_RATES["/api/party/list"] = 0.1
+    sampled_app = build_app(LoggingAPIRoute)
+    # 실행 순서에 따른 편차를 줄이기 위해 번갈아 여러 번 측정
+    for _ in range(3):
+        await measure("no logging", baseline_app, requests)
+        await measure("legacy", legacy_app, requests)
+        await measure("current (rate=1.0)", current_app, requests)
+        await measure("current (rate=0.1)", sampled_app, requests)
+
+    async with AsyncClient(app=baseline_app, base_url="http://bench") as client:
+        response = await client.get("/api/party/list")
+    await measure_logging_only(response.content, requests * 10)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    args: Any = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,106 @@
+"""
+미들웨어 벤치마크: BaseHTTPMiddleware 기반(이전 구현)과 순수 ASGI 구현의 초당 요청 수 비교.
+
+    APP_ENV=test SECRET_KEY=bench python -m benchmarks.middleware --requests 5000
+
+네트워크 없이 httpx ASGI 전송으로 같은 앱 구성(업로드 제한 + CORS + 인증)을 호출하므로
+측정값은 미들웨어 스택 자체의 비용만 반영합니다.
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Type
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from httpx import AsyncClient
+from jose import JWTError, jwt, ExpiredSignatureError
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware
+
+from common.config import ALGORITHM, SECRET_KEY
+from common.middlewares import AuthMiddleware, LimitUploadSizeMiddleware
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """이전 구현 (토큰 없는 요청 경로만 측정하므로 사용자 조회는 생략)"""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        token = request.headers.get("Authorization")
+        request.state.user = None
+        if token and token.startswith("Bearer "):
+            try:
+                jwt.decode(token.split(" ")[1], SECRET_KEY, algorithms=[ALGORITHM])
+            except ExpiredSignatureError:
+                return JSONResponse(
+                    status_code=403, content={"detail": "Token has expired"}
+                )
+            except JWTError as e:
+                return JSONResponse(
+                    status_code=403,
+                    content={"detail": f"Could not validate credentials: {str(e)}"},
+                )
+        return await call_next(request)
+
+
+class LegacyLimitUploadSizeMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: FastAPI, max_upload_size: int) -> None:
+        super().__init__(app)
+        self.max_upload_size = max_upload_size
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        content_length = request.headers.get("content-length")
+        if content_length and int(content_length) > self.max_upload_size:
+            return Response(content="파일 크기가 너무 큽니다.", status_code=413)
+        return await call_next(request)
+
+
+def build_app(auth_middleware: Type[Any], upload_middleware: Type[Any]) -> FastAPI:
+    application = FastAPI()
+
+    @application.get("/api/health")
+    async def health() -> str:
+        return "ok"
+
+    application.add_middleware(upload_middleware, max_upload_size=10 * 1024 * 1024)
+    application.add_middleware(
+        CORSMiddleware, allow_origins=["http://localhost:3000"], allow_methods=["*"]
+    )
+    application.add_middleware(auth_middleware)
+    return application
+
+
+async def measure(label: str, application: FastAPI, requests: int) -> float:
+    async with AsyncClient(app=application, base_url="http://bench") as client:
+        for _ in range(100):
+            await client.get("/api/health")
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/api/health")
+        elapsed = time.perf_counter() - started
+    requests_per_second = requests / elapsed
+    print(f"{label:<10} {requests_per_second:10.1f} req/s")
+    return requests_per_second
+
+
+async def main(requests: int) -> None:
+    before = await measure(
+        "before",
+        build_app(LegacyAuthMiddleware, LegacyLimitUploadSizeMiddleware),
+        requests,
+    )
+    after = await measure(
+        "after", build_app(AuthMiddleware, LimitUploadSizeMiddleware), requests
+    )
+    print(f"speedup    {after / before:10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
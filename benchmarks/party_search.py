@@ -0,0 +1,119 @@
+"""
+파티 검색 벤치마크: 기존 4중 icontains OR 쿼리와 전문 검색(FTS) 경로 비교.
+
+    APP_ENV=test python -m benchmarks.party_search --parties 20000 --repeat 50
+
+SQLite(FTS5 trigram) 기준으로 측정하며, MySQL(FULLTEXT ngram)에서는
+같은 스크립트를 DB_* 환경변수로 실제 DB 에 연결해 실행하면 됩니다.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Any, Awaitable, Callable
+
+from tortoise.expressions import Q
+
+from common.test_config import close_db, db_init
+from parties.models import Party
+from parties.services import PartyListService
+from users.models import Sport, User
+
+WORDS = [
+    "프리다이빙",
+    "스쿠버",
+    "펀다이빙",
+    "강습",
+    "수영장",
+    "바다",
+    "초보",
+    "환영",
+    "주말",
+    "정기",
+    "모임",
+    "장비",
+    "대여",
+    "제주",
+    "딥스테이션",
+]
+
+# 전체의 0.1% 에만 등장하는 검색어 (LIKE 검색은 끝까지 스캔해야 함)
+RARE_WORD = "우도투어"
+RARE_WORD_INTERVAL = 1000
+
+
+async def seed(party_count: int) -> None:
+    organizer = await User.create(name="bench", profile_image="bench")
+    sports = [
+        await Sport.create(name=name) for name in ("프리다이빙", "스쿠버다이빙", "서핑")
+    ]
+    now = datetime.now(UTC)
+    batch = []
+    for index in range(party_count):
+        batch.append(
+            Party(
+                title=" ".join(random.sample(WORDS, 3))
+                + (f" {RARE_WORD}" if index % RARE_WORD_INTERVAL == 0 else ""),
+                body=" ".join(random.choices(WORDS, k=30)),
+                place_name=random.choice(WORDS),
+                address="address",
+                organizer_user=organizer,
+                sport=random.choice(sports),
+                gather_at=now + timedelta(days=index % 30),
+                longitude=127.0,
+                latitude=37.0,
+            )
+        )
+        if len(batch) == 1000:
+            await Party.bulk_create(batch)
+            batch = []
+    if batch:
+        await Party.bulk_create(batch)
+
+
+async def legacy_search(search_query: str) -> Any:
+    return (
+        await Party.filter(
+            Q(title__icontains=search_query)
+            | Q(place_name__icontains=search_query)
+            | Q(body__icontains=search_query)
+            | Q(sport__name__icontains=search_query)
+        )
+        .select_related("sport", "organizer_user")
+        .order_by("-id")
+        .limit(8)
+    )
+
+
+async def fulltext_search(search_query: str) -> Any:
+    return await PartyListService().get_party_list(search_query=search_query)
+
+
+async def measure(
+    label: str, func: Callable[[str], Awaitable[Any]], keyword: str, repeat: int
+) -> None:
+    await func(keyword)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await func(keyword)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+    print(f"{label:<10} query={keyword!r:<14} {elapsed_ms:8.2f} ms/query")
+
+
+async def main(party_count: int, repeat: int) -> None:
+    await db_init("sqlite://:memory:")
+    await seed(party_count)
+    print(f"parties={party_count}, repeat={repeat}")
+    for keyword in (RARE_WORD, "없는검색어", "딥스테이션", "서핑"):
+        await measure("legacy", legacy_search, keyword, repeat)
+        await measure("fulltext", fulltext_search, keyword, repeat)
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--parties", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.parties, args.repeat))
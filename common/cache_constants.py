@@ -1,5 +1,31 @@
 # CACHE KEY
 CACHE_KEY_LOGIN_REDIRECT_UUID = "redirect_str:{uuid}"
+CACHE_KEY_PARTY_DETAIL = "party_detail:{party_id}"
+CACHE_KEY_PARTY_CARD = "party_card:{party_id}"
+CACHE_KEY_PARTY_DETAIL_VERSION = "party_detail_version:{party_id}"
+CACHE_KEY_AUTH_USER = "auth_user:{user_id}"
+CACHE_KEY_NOTIFICATION_UNREAD = "notification_unread:{user_id}"
+CACHE_KEY_NOTIFICATION_GLOBAL_SEQ = "notification_global_seq"
+CACHE_KEY_USER_PARTY_STATISTICS = "user_party_statistics:{user_id}"
+CACHE_KEY_PARTY_LIST_DAY = "party_list:{scope}:{sport_id}:{day}"
+CACHE_KEY_PARTY_LIST_VERSION = "party_list_version"
+CACHE_KEY_PARTY_LIST_PAGE = "party_list_page:{version}:{params}"
 
 # DURATION
 DURATION_LOGIN_REDIRECT_UUID = 60
+DURATION_PARTY_DETAIL = 60 * 10
+# fresh 기간 이후 갱신하는 동안 이전 값을 응답하는 시간
+DURATION_PARTY_DETAIL_STALE = 60 * 5
+# 상세 캐시가 남아 있는 동안 ETag 버전 유지
+DURATION_PARTY_DETAIL_VERSION = DURATION_PARTY_DETAIL + DURATION_PARTY_DETAIL_STALE
+DURATION_PARTY_CARD = 60 * 10
+DURATION_AUTH_USER = 60 * 5
+DURATION_NOTIFICATION_UNREAD = 60 * 60
+DURATION_USER_PARTY_STATISTICS = 60 * 60 * 24
+DURATION_PARTY_LIST_DAY = 60 * 60 * 24 * 7
+DURATION_PARTY_LIST_PAGE = 30
+DURATION_PARTY_LIST_PAGE_STALE = 30
+
+# PUB/SUB CHANNEL
+PUBSUB_CHANNEL_NOTIFICATION_USER = "notification_events:{user_id}"
+PUBSUB_CHANNEL_NOTIFICATION_GLOBAL = "notification_events:global"
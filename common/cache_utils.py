@@ -1,49 +1,445 @@
+import asyncio
 import json
+import time
+import uuid
+from collections import OrderedDict
 
-import redis
-import fakeredis
-from contextlib import contextmanager
-from typing import Any, Iterator
+import fakeredis.aioredis
+from redis import asyncio as aioredis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from os import getenv
-from common.config import IS_TEST
+from common.config import IS_TEST, logger
+
+REDIS_HOST = getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(getenv("REDIS_PORT", 6379))
+REDIS_DB = int(getenv("REDIS_DB", 0))
+REDIS_MAX_CONNECTIONS = int(getenv("REDIS_MAX_CONNECTIONS", 50))
+
+DEFAULT_EXPIRE_SECONDS = 60 * 60 * 7
+
+# 다른 워커가 같은 키를 불러오는 중일 때 캐시 저장을 기다리는 최대 시간(초)
+SINGLE_FLIGHT_WAIT_TIMEOUT = float(getenv("SINGLE_FLIGHT_WAIT_TIMEOUT", 2))
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+# 불러오던 워커가 죽어도 잠금이 풀리도록 하는 만료 시간(초)
+SINGLE_FLIGHT_LOCK_TTL = 10
+# 다시 계산한 카운터에, 계산 전에 커밋된 변경의 증감이 늦게 도착할 수 있는 시간(초)
+COUNTER_REBUILD_SETTLE_SECONDS = float(getenv("COUNTER_REBUILD_SETTLE_SECONDS", 10))
+# 카운터를 DB 기준으로 다시 계산한 시각을 저장하는 hash 필드
+FIELD_REBUILT_AT = "rebuilt_at"
+
+T = TypeVar("T")
+# 세대를 읽지 못한 경우 (불러온 값을 저장하지 않음)
+_UNKNOWN_GENERATION = object()
+
+# 앱 전역에서 공유하는 Redis 클라이언트 (내부에 커넥션 풀 보유)
+_redis_client: Optional[aioredis.Redis] = None  # type: ignore[type-arg]
+
+
+def get_redis_client() -> aioredis.Redis:  # type: ignore[type-arg]
+    """
+    앱 전역 Redis 클라이언트를 반환합니다.
+    lifespan 에서 init_redis 로 생성하며, 그 전에 호출되면 처음 호출 시 생성합니다.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = (
+            fakeredis.aioredis.FakeRedis()
+            if IS_TEST
+            else aioredis.Redis(
+                host=REDIS_HOST,
+                port=REDIS_PORT,
+                db=REDIS_DB,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                # decode_responses=True
+            )
+        )
+    return _redis_client
+
+
+async def init_redis() -> None:
+    """앱 시작 시 커넥션 풀 생성"""
+    get_redis_client()
+
+
+async def close_redis() -> None:
+    """앱 종료 시 커넥션 풀 정리"""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+def reset_redis_client() -> None:
+    """
+    클라이언트 참조를 초기화합니다.
+    커넥션은 생성된 이벤트 루프에 묶이므로, 루프가 바뀌는 테스트에서 사용합니다.
+    """
+    global _redis_client
+    _redis_client = None
+
+
+class CacheStats:
+    """프로세스(워커) 단위 캐시 적중/미스 카운터"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self) -> None:
+        self.hits += 1
+
+    def miss(self) -> None:
+        self.misses += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_cache_stats: Dict[str, CacheStats] = {}
+
+
+def get_cache_stats(name: str) -> CacheStats:
+    """이름별 캐시 카운터 (없으면 생성)"""
+    if name not in _cache_stats:
+        _cache_stats[name] = CacheStats(name)
+    return _cache_stats[name]
+
+
+def get_all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: stats.snapshot() for name, stats in _cache_stats.items()}
+
+
+def is_recently_rebuilt(rebuilt_at: Optional[Any]) -> bool:
+    """
+    카운터를 다시 계산한 직후인지 확인
+    이 기간에 도착한 증감은 이미 집계에 포함된 변경일 수 있으므로, 호출하는 쪽에서 카운터를 삭제합니다.
+    """
+    return (
+        rebuilt_at is not None
+        and time.time() - float(rebuilt_at) < COUNTER_REBUILD_SETTLE_SECONDS
+    )
+
+
+class LocalTTLCache:
+    """
+    프로세스 내 LRU + TTL 캐시
+    최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class RedisManager:
     """Redis 클라이언트 관리자 클래스"""
 
     def __init__(self) -> None:
-        self.redis_host = getenv("REDIS_HOST", "localhost")
-        self.redis_port = int(getenv("REDIS_PORT", 6379))
-        self.redis_db = int(getenv("REDIS_DB", 0))
-
-    @contextmanager
-    def _get_redis_client(self) -> Iterator[redis.Redis]:  # type: ignore[type-arg]
-        client = (
-            fakeredis.FakeRedis()
-            if IS_TEST
-            else redis.Redis(
-                host=self.redis_host,
-                port=self.redis_port,
-                db=self.redis_db,
-                # decode_responses=True
+        self.client = get_redis_client()
+
+    def pipeline(self, transaction: bool = False) -> Pipeline:  # type: ignore[type-arg]
+        return self.client.pipeline(transaction=transaction)
+
+    async def set_value(
+        self, key: str, value: Any, expire: int = DEFAULT_EXPIRE_SECONDS
+    ) -> None:
+        await self.client.set(key, json.dumps(value), ex=expire)
+
+    async def get_value(self, key: str) -> Any:
+        value = await self.client.get(key)
+        return json.loads(value) if value else None
+
+    async def delete_value(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+    async def get_values(self, keys: Sequence[str]) -> List[Any]:
+        """MGET 으로 여러 키를 한 번에 조회 (없는 키는 None)"""
+        if not keys:
+            return []
+        values = await self.client.mget(keys)
+        return [json.loads(value) if value else None for value in values]
+
+    async def set_values(
+        self, mapping: Dict[str, Any], expire: int = DEFAULT_EXPIRE_SECONDS
+    ) -> None:
+        """여러 키를 만료 시간과 함께 한 번의 왕복(pipeline)으로 저장"""
+        if not mapping:
+            return
+        pipe = self.pipeline()
+        for key, value in mapping.items():
+            pipe.set(key, json.dumps(value), ex=expire)
+        await pipe.execute()
+
+
+class SingleFlight:
+    """
+    워커 내에서 같은 키의 동시 로드를 하나의 작업으로 합칩니다.
+    로드는 별도 task 로 실행하므로 먼저 요청한 쪽이 취소되어도 기다리던 요청은 결과를 받습니다.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, "asyncio.Task[Any]"] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._tasks
+
+    async def do(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외 미확인 경고가 남지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    Redis 캐시 + single-flight 로드
+    - fresh_ttl 이 지난 값은 stale_ttl 까지 그대로 응답하고, 한 작업만 백그라운드에서 갱신합니다.
+    - 캐시가 없으면 워커 내 동시 요청은 한 번만 불러오고,
+      워커 간에는 Redis 잠금을 얻은 워커가 불러오는 동안 나머지는 저장되기를 기다립니다.
+    - 키별 세대(generation)를 불러오기 전에 읽고, 그 사이 invalidate 로 세대가 바뀌면
+      불러온 값을 저장하지 않습니다. (삭제 전에 시작한 로드가 이전 값을 다시 쓰지 않음)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fresh_ttl: int,
+        stale_ttl: int,
+        dumps: Callable[[T], Any],
+        loads: Callable[[Any], T],
+    ) -> None:
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.dumps = dumps
+        self.loads = loads
+        self.stats = get_cache_stats(name)
+        self._single_flight = SingleFlight()
+        self._refresh_tasks: Set["asyncio.Task[Any]"] = set()
+
+    async def get(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        entry = await self.get_entry(key)
+        if entry is None:
+            self.stats.miss()
+            return await self._single_flight.do(
+                key, lambda: self._load_with_lock(key, load)
+            )
+
+        self.stats.hit()
+        value, fresh_until = entry
+        if fresh_until <= time.time():
+            self._refresh_in_background(key, load)
+        return value
+
+    async def get_entry(self, key: str) -> Optional[Tuple[T, float]]:
+        """캐시된 (값, 갱신 시각), 없거나 Redis 오류면 None"""
+        try:
+            cached = await RedisManager().get_value(key)
+        except Exception as e:
+            logger.error(f"[{self.stats.name} cache] get error, key:{key}, msg:{e}")
+            return None
+        if cached is None:
+            return None
+        return self.loads(cached["value"]), cached["fresh_until"]
+
+    async def set(self, key: str, value: T) -> None:
+        try:
+            await RedisManager().set_value(
+                key, self._entry(value), expire=self.fresh_ttl + self.stale_ttl
+            )
+        except Exception as e:
+            logger.error(f"[{self.stats.name} cache] set error, key:{key}, msg:{e}")
+
+    def add_invalidation(
+        self,
+        pipe: Pipeline,  # type: ignore[type-arg]
+        key: str,
+    ) -> None:
+        """캐시 삭제와 세대 증가를 pipeline 에 추가 (다른 키 삭제와 한 번에 실행)"""
+        generation_key = self._generation_key(key)
+        pipe.incr(generation_key)
+        # 진행 중인 로드보다 오래 유지되면 충분
+        pipe.expire(generation_key, self.fresh_ttl + self.stale_ttl)
+        pipe.delete(key)
+
+    async def invalidate(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            pipe = RedisManager().pipeline()
+            for key in keys:
+                self.add_invalidation(pipe, key)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"[{self.stats.name} cache] invalidate error, msg:{e}")
+
+    def _entry(self, value: T) -> Dict[str, Any]:
+        return {
+            "value": self.dumps(value),
+            "fresh_until": time.time() + self.fresh_ttl,
+        }
+
+    @staticmethod
+    def _generation_key(key: str) -> str:
+        return f"{key}:generation"
+
+    async def _get_generation(self, key: str) -> Any:
+        try:
+            return await RedisManager().client.get(self._generation_key(key))
+        except Exception as e:
+            logger.error(
+                f"[{self.stats.name} cache] generation error, key:{key}, msg:{e}"
             )
+            return _UNKNOWN_GENERATION
+
+    async def _set_if_generation(self, key: str, value: T, generation: Any) -> bool:
+        """
+        로드 전에 읽은 세대가 그대로일 때만 저장합니다.
+        WATCH 로 세대 확인과 저장 사이의 invalidate 도 감지합니다.
+        :return: 저장 여부
+        """
+        if generation is _UNKNOWN_GENERATION:
+            return False
+        generation_key = self._generation_key(key)
+        try:
+            async with RedisManager().pipeline(transaction=True) as pipe:
+                await pipe.watch(generation_key)
+                if await pipe.get(generation_key) != generation:
+                    return False
+                pipe.multi()
+                pipe.set(
+                    key,
+                    json.dumps(self._entry(value)),
+                    ex=self.fresh_ttl + self.stale_ttl,
+                )
+                await pipe.execute()
+                return True
+        except WatchError:
+            return False
+        except Exception as e:
+            logger.error(f"[{self.stats.name} cache] set error, key:{key}, msg:{e}")
+            return False
+
+    def _refresh_in_background(
+        self, key: str, load: Callable[[], Awaitable[T]]
+    ) -> None:
+        refresh_key = f"{key}:refresh"
+        if self._single_flight.in_flight(refresh_key):
+            return
+        task = asyncio.ensure_future(
+            self._single_flight.do(refresh_key, lambda: self._refresh(key, load))
         )
+        # 응답 후에도 갱신이 끝날 때까지 task 참조를 유지
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
 
+    async def _refresh(self, key: str, load: Callable[[], Awaitable[T]]) -> None:
+        lock_key, token = f"{key}:lock", uuid.uuid4().hex
+        # 다른 워커가 갱신 중이면 건너뜀
+        if not await self._acquire_lock(lock_key, token):
+            return
         try:
-            yield client
+            generation = await self._get_generation(key)
+            await self._set_if_generation(key, await load(), generation)
+        except Exception as e:
+            logger.error(f"[{self.stats.name} cache] refresh error, key:{key}, msg:{e}")
         finally:
-            # 필요에 따라 연결 해제 또는 추가 정리 작업을 수행
-            client.close()
+            await self._release_lock(lock_key, token)
 
-    def set_value(self, key: str, value: Any, expire: int = 60 * 60 * 7) -> None:
-        with self._get_redis_client() as client:
-            client.set(key, json.dumps(value), ex=expire)
+    async def _load_with_lock(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        lock_key, token = f"{key}:lock", uuid.uuid4().hex
+        acquired = await self._acquire_lock(lock_key, token)
+        if not acquired:
+            # 다른 워커가 불러오는 중이면 저장될 때까지 기다리고, 늦어지면 직접 불러옴
+            deadline = time.monotonic() + SINGLE_FLIGHT_WAIT_TIMEOUT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+                entry = await self.get_entry(key)
+                if entry is not None:
+                    return entry[0]
+        try:
+            generation = await self._get_generation(key)
+            value = await load()
+            # 로드 중 삭제되었으면 이 요청에만 응답하고 캐시에는 저장하지 않음
+            await self._set_if_generation(key, value, generation)
+            return value
+        finally:
+            if acquired:
+                await self._release_lock(lock_key, token)
 
-    def get_value(self, key: str) -> Any:
-        with self._get_redis_client() as client:
-            value = client.get(key)
-            return json.loads(value) if value else None
+    async def _acquire_lock(self, lock_key: str, token: str) -> bool:
+        try:
+            return bool(
+                await RedisManager().client.set(
+                    lock_key, token, nx=True, ex=SINGLE_FLIGHT_LOCK_TTL
+                )
+            )
+        except Exception as e:
+            # Redis 장애 시에는 워커 내 single-flight 만으로 불러옴
+            logger.error(f"[{self.stats.name} cache] lock error, msg:{e}")
+            return True
 
-    def delete_value(self, key: str) -> None:
-        with self._get_redis_client() as client:
-            client.delete(key)
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            client = RedisManager().client
+            # 만료 후 다른 워커가 얻은 잠금은 지우지 않음
+            if await client.get(lock_key) == token.encode():
+                await client.delete(lock_key)
+        except Exception as e:
+            logger.error(f"[{self.stats.name} cache] unlock error, msg:{e}")
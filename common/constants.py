@@ -4,6 +4,23 @@ AUTH_PLATFORM_NAVER = "naver"
 AUTH_PLATFORM_KAKAO = "kakao"
 
 
+# HTTP HEADER
+HEADER_NEXT_CURSOR = "X-Next-Cursor"
+HEADER_ETAG = "ETag"
+HEADER_LAST_MODIFIED = "Last-Modified"
+HEADER_CACHE_CONTROL = "Cache-Control"
+HEADER_VARY = "Vary"
+HEADER_IF_NONE_MATCH = "If-None-Match"
+HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
+
+
+# HTTP CACHE CONTROL
+# 조회자별로 다른 응답: 클라이언트만 저장하고 매번 ETag 로 재검증
+CACHE_CONTROL_PRIVATE_REVALIDATE = "private, no-cache"
+# 종목, 자격증 등 관리자만 수정하는 기준 데이터: nginx/클라이언트가 5분간 재사용
+CACHE_CONTROL_REFERENCE_DATA = "public, max-age=300"
+
+
 # DATETIME FORMAT
 FORMAT_YYYY_MM_DD = "%Y-%m-%d"
 FORMAT_YYYYMMDD = "%Y%m%d"
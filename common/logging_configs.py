@@ -1,4 +1,8 @@
-from typing import Callable, Awaitable
+import json
+import logging
+import random
+from os import getenv
+from typing import Any, Callable, Awaitable, Dict, FrozenSet
 
 from fastapi.routing import APIRoute
 from starlette.requests import Request
@@ -6,15 +10,39 @@ from starlette.responses import Response
 
 from common.config import logger
 
+# 기본 샘플링 비율 (0 ~ 1)
+API_LOG_SAMPLE_RATE = float(getenv("API_LOG_SAMPLE_RATE", 1))
+# 경로별 샘플링 비율, 예) '{"/api/party/list": 0.1}'
+API_LOG_ROUTE_SAMPLE_RATES: Dict[str, float] = json.loads(
+    getenv("API_LOG_ROUTE_SAMPLE_RATES", "{}")
+)
+# 요청/응답 본문 최대 기록 길이(bytes)
+API_LOG_BODY_MAX_LENGTH = int(getenv("API_LOG_BODY_MAX_LENGTH", 2000))
+# 기록할 헤더 (Authorization 등 토큰이 로그에 남지 않도록 허용 목록만 기록)
+API_LOG_HEADER_ALLOWLIST: FrozenSet[str] = frozenset(
+    getenv(
+        "API_LOG_HEADER_ALLOWLIST",
+        "user-agent,content-type,content-length,origin,referer,x-forwarded-for",
+    ).split(",")
+)
+
 
 class LoggingAPIRoute(APIRoute):
     def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
         original_route_handler = super().get_route_handler()
+        sample_rate = API_LOG_ROUTE_SAMPLE_RATES.get(self.path, API_LOG_SAMPLE_RATE)
 
         async def custom_route_handler(request: Request) -> Response:
-            await self._request_log(request)
+            if not logger.isEnabledFor(logging.INFO):
+                return await original_route_handler(request)
+
+            is_sampled = sample_rate >= 1 or random.random() < sample_rate
+            if is_sampled:
+                await self._request_log(request)
             response: Response = await original_route_handler(request)
-            self._response_log(request, response)  # 수정된 부분
+            # 샘플링되지 않은 요청도 실패 응답은 기록
+            if is_sampled or response.status_code >= 400:
+                self._response_log(request, response)  # 수정된 부분
             return response
 
         return custom_route_handler
@@ -28,30 +56,48 @@ class LoggingAPIRoute(APIRoute):
             return True
         return False
 
-    async def _request_log(self, request: Request) -> None:
-        body = ""
-        if self._has_json_body(request):
-            request_body = await request.body()
-            body = request_body.decode("UTF-8")
+    @staticmethod
+    def _truncate_body(body: bytes) -> str:
+        if len(body) <= API_LOG_BODY_MAX_LENGTH:
+            return body.decode("UTF-8", errors="replace")
+        return (
+            body[:API_LOG_BODY_MAX_LENGTH].decode("UTF-8", errors="ignore")
+            + f"...(truncated, {len(body)} bytes)"
+        )
 
-        headers = dict(request.headers)
+    @staticmethod
+    def _allowed_headers(request: Request) -> Dict[str, str]:
+        return {
+            key: value
+            for key, value in request.headers.items()
+            if key in API_LOG_HEADER_ALLOWLIST
+        }
+
+    @classmethod
+    async def _request_log(cls, request: Request) -> None:
+        body = ""
+        if cls._has_json_body(request):
+            # FastAPI 가 캐시된 본문을 다시 사용하므로 두 번 읽지 않음
+            body = cls._truncate_body(await request.body())
 
-        extra = {
+        extra: Dict[str, Any] = {
             "httpMethod": request.method,
             "url": request.url.path,
-            "headers": str(headers),
+            "headers": cls._allowed_headers(request),
             "queryParams": str(request.query_params),
             "body": body,
         }
-        logger.info(f"Request Info: {extra}")
+        logger.info("Request Info: %s", extra)
 
-    @staticmethod
-    def _response_log(request: Request, response: Response) -> None:
-        extra = {
+    @classmethod
+    def _response_log(cls, request: Request, response: Response) -> None:
+        extra: Dict[str, Any] = {
             "httpMethod": request.method,
             "url": request.url.path,
-            "headers": str(dict(request.headers)),
+            "statusCode": response.status_code,
+            "headers": cls._allowed_headers(request),
             "queryParams": str(request.query_params),
-            "body": response.body.decode("UTF-8") if response.body else "",
+            # StreamingResponse 등 body 가 없는 응답은 기록하지 않음
+            "body": cls._truncate_body(getattr(response, "body", b"") or b""),
         }
-        logger.info(f"Response Info: {extra}")
+        logger.info("Response Info: %s", extra)
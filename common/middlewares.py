@@ -1,18 +1,44 @@
-from fastapi import Request, Response, FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware
-from users.models import User
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from users.cache import get_auth_user
 
 # from jwt import decode, PyJWTError
 from jose import JWTError, jwt, ExpiredSignatureError
 from common.config import SECRET_KEY, ALGORITHM
-from typing import Callable, Awaitable
 from fastapi.responses import JSONResponse
 
+MESSAGE_UPLOAD_TOO_LARGE = "파일 크기가 너무 큽니다."
+
+
+class AuthMiddleware:
+    """
+    Bearer 토큰의 사용자를 request.state.user 에 설정하는 ASGI 미들웨어
+    BaseHTTPMiddleware 의 응답 래핑(별도 task, 스트림) 비용 없이 동작합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        error_response = await self.authenticate(Request(scope))
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def authenticate(request: Request) -> Optional[Response]:
+        """
+        토큰 검증 후 state 에 사용자 정보를 설정합니다.
+        :return: 인증 실패 시 403 응답, 성공(또는 토큰 없음) 시 None
+        """
         token = request.headers.get("Authorization")
         request.state.user = None
         if token and token.startswith("Bearer "):
@@ -21,7 +47,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
                 user_id = payload.get("user_id")
                 if user_id:
-                    request.state.user = await User.get_or_none(id=user_id)
+                    request.state.user = await get_auth_user(user_id)
             # except PyJWTError as e:
             # except JWTError as e:
             #     raise HTTPException(
@@ -42,24 +68,70 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 )
             # except Exception as e:
             #     raise HTTPException(status_code=403, detail=str(e))
-        response = await call_next(request)
-        return response
+        return None
+
+
+class UploadTooLargeError(HTTPException):
+    """
+    content-length 없이(chunked) 전송된 본문이 제한을 넘은 경우
+    FastAPI 의 본문 파싱 단계에서 400 으로 바뀌지 않도록 HTTPException 으로 정의
+    """
 
+    def __init__(self) -> None:
+        super().__init__(status_code=413, detail=MESSAGE_UPLOAD_TOO_LARGE)
 
-class LimitUploadSizeMiddleware(BaseHTTPMiddleware):
+
+class LimitUploadSizeMiddleware:
     # 파일 용량 제한 미들웨어 정의
-    def __init__(self, app: FastAPI, max_upload_size: int) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, max_upload_size: int) -> None:
+        self.app = app
         self.max_upload_size = max_upload_size
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        content_length = request.headers.get("content-length")
+    @staticmethod
+    def _too_large_response() -> JSONResponse:
+        # 라우트에서 UploadTooLargeError 로 응답하는 경우와 같은 {"detail": ...} 형식
+        return JSONResponse(
+            status_code=413,  # Payload Too Large
+            content={"detail": MESSAGE_UPLOAD_TOO_LARGE},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
         if content_length:
             if int(content_length) > self.max_upload_size:
-                return Response(
-                    content="파일 크기가 너무 큽니다.",
-                    status_code=413,  # Payload Too Large
-                )
-        return await call_next(request)
+                await self._too_large_response()(scope, receive, send)
+                return
+            # content-length 가 제한 이내면 본문을 셀 필요 없음
+            await self.app(scope, receive, send)
+            return
+
+        # chunked 업로드: 실제로 받은 본문 크기를 누적해서 검사
+        received_size = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received_size
+            message = await receive()
+            if message["type"] == "http.request":
+                received_size += len(message.get("body", b""))
+                if received_size > self.max_upload_size:
+                    raise UploadTooLargeError()
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except UploadTooLargeError:
+            # 라우트 밖에서 본문을 읽다 초과한 경우
+            if response_started:
+                raise
+            await self._too_large_response()(scope, receive, send)
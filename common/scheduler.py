@@ -1,6 +1,13 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from parties.utils import inactive_expired_parties
+from apscheduler.triggers.interval import IntervalTrigger
+from notifications.outbox import (
+    NOTIFICATION_OUTBOX_IN_APP,
+    NOTIFICATION_OUTBOX_POLL_INTERVAL,
+    process_notification_outbox,
+)
+from notifications.utils import archive_old_notifications, compact_notification_reads
+from parties.utils import inactive_expired_parties, repair_party_counters
 
 scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
 
@@ -13,4 +20,35 @@ def start_scheduler() -> None:
         name="Inactivate expired parties",
         replace_existing=True,
     )
+    scheduler.add_job(
+        repair_party_counters,
+        CronTrigger(hour=4, minute=0),  # 매일 새벽 4시에 실행
+        id="repair_party_counters",
+        name="Repair denormalized party counters",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        archive_old_notifications,
+        CronTrigger(hour=3, minute=30),  # 매일 새벽 3시 30분에 실행
+        id="archive_old_notifications",
+        name="Archive notifications past the retention period",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        compact_notification_reads,
+        CronTrigger(hour=4, minute=30),  # 매일 새벽 4시 30분에 실행
+        id="compact_notification_reads",
+        name="Compact notification read state into watermarks",
+        replace_existing=True,
+    )
+    if NOTIFICATION_OUTBOX_IN_APP:
+        scheduler.add_job(
+            process_notification_outbox,
+            IntervalTrigger(seconds=NOTIFICATION_OUTBOX_POLL_INTERVAL),
+            id="process_notification_outbox",
+            name="Expand notification outbox events",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
     scheduler.start()
@@ -15,7 +15,10 @@ async def db_init(
     await Tortoise.init(db_url=database_url, modules={"models": models_path})
 
     if generate_schema:
+        from parties.search import ensure_party_search_index
+
         await Tortoise.generate_schemas()
+        await ensure_party_search_index()
 
 
 async def drop_databases() -> None:
@@ -1,18 +1,43 @@
+import base64
+import binascii
+import hashlib
+import json
 import os
 import uuid
-from datetime import datetime
+from datetime import datetime, UTC
+from email.utils import format_datetime, parsedate_to_datetime
 from zoneinfo import ZoneInfo
-from typing import Optional, Any
+from typing import Optional, Any, Awaitable, Dict, List, Sequence, Tuple, TypeVar
 
 import aioboto3
 import asyncio
 import bcrypt
-from fastapi import UploadFile
-from common.config import logger, airtake_ins, IS_TEST, mixpanel_ins as mp
-from common.constants import FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ
+from fastapi import Request, Response, UploadFile, status
+from tortoise.functions import Count, Max
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+from common.config import (
+    logger,
+    airtake_ins,
+    IS_TEST,
+    mixpanel_ins as mp,
+    DB_POOL_MAX_SIZE,
+)
+from common.constants import (
+    FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ,
+    HEADER_CACHE_CONTROL,
+    HEADER_ETAG,
+    HEADER_IF_MODIFIED_SINCE,
+    HEADER_IF_NONE_MATCH,
+    HEADER_LAST_MODIFIED,
+    HEADER_VARY,
+)
 from common.mixpanel_constants import MIXPANEL_PROPERTY_KEY_USER_ID
 
 
+MODEL = TypeVar("MODEL", bound=Model)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> Any:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
@@ -25,6 +50,143 @@ def convert_string_to_datetime(string_datetime: str) -> Optional[datetime]:
         return None
 
 
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """페이지네이션 커서를 클라이언트에 노출할 불투명 문자열로 인코딩"""
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """encode_cursor 로 만든 커서를 복원합니다. 잘못된 커서는 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(payload, dict):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return payload
+
+
+def paginate_by_id(
+    queryset: QuerySet[MODEL],
+    page: int = 1,
+    page_size: int = 10,
+    cursor: Optional[str] = None,
+) -> QuerySet[MODEL]:
+    """
+    id 내림차순 페이지네이션.
+    커서가 있으면 keyset(id < 마지막 id) 방식으로, 없으면 offset 방식으로 조회합니다.
+    """
+    if cursor:
+        last_id = decode_cursor(cursor).get("id")
+        if not isinstance(last_id, int):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        queryset = queryset.filter(id__lt=last_id)
+    else:
+        queryset = queryset.offset((page - 1) * page_size)
+    return queryset.order_by("-id").limit(page_size)
+
+
+def get_next_cursor(rows: Sequence[Model], page_size: int) -> Optional[str]:
+    """마지막 페이지가 아니면 다음 페이지 조회용 커서를 반환"""
+    if len(rows) < page_size:
+        return None
+    return encode_cursor({"id": rows[-1].pk})
+
+
+def get_next_cursor_from_ids(ids: Sequence[int], page_size: int) -> Optional[str]:
+    """get_next_cursor 와 같은 커서를 id 목록(내림차순)으로 반환"""
+    if len(ids) < page_size:
+        return None
+    return encode_cursor({"id": ids[-1]})
+
+
+async def gather_queries(
+    *queries: Awaitable[Any], limit: int = DB_POOL_MAX_SIZE
+) -> List[Any]:
+    """
+    서로 독립적인 ORM 쿼리를 동시에 실행하고 결과를 순서대로 반환합니다.
+    동시에 실행하는 쿼리 수는 커넥션 풀 크기(limit) 이내로 제한합니다.
+    트랜잭션 안에서는 커넥션 하나를 공유하므로 순서대로 실행됩니다.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(query: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await query
+
+    return list(await asyncio.gather(*(run(query) for query in queries)))
+
+
+def build_etag(*versions: Any) -> str:
+    """버전 값(updated_at, 버전 카운터 등)으로 만든 weak ETag (응답 본문은 직렬화하지 않음)"""
+    digest = hashlib.sha1("|".join(map(str, versions)).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+async def get_table_version(
+    queryset: QuerySet[MODEL],
+) -> Tuple[int, Optional[datetime]]:
+    """기준 데이터 ETag 용 (행 수, 마지막 수정 시각)을 집계 쿼리 한 번으로 조회"""
+    rows = await queryset.annotate(
+        row_count=Count("id"), last_modified=Max("updated_at")
+    ).values_list("row_count", "last_modified")
+    row_count, last_modified = rows[0] if rows else (0, None)
+    return row_count, last_modified
+
+
+def _is_not_modified(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime]
+) -> bool:
+    # If-None-Match 가 있으면 If-Modified-Since 는 무시 (RFC 9110)
+    if_none_match = request.headers.get(HEADER_IF_NONE_MATCH)
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get(HEADER_IF_MODIFIED_SINCE)
+    if last_modified is None or not if_modified_since:
+        return False
+    try:
+        modified_since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if modified_since.tzinfo is None:
+        modified_since = modified_since.replace(tzinfo=UTC)
+    # HTTP 날짜는 초 단위
+    return last_modified.replace(microsecond=0) <= modified_since
+
+
+def get_not_modified_response(
+    request: Request,
+    response: Response,
+    etag: Optional[str],
+    cache_control: str,
+    last_modified: Optional[datetime] = None,
+    vary: Optional[str] = None,
+) -> Optional[Response]:
+    """
+    조건부 GET 처리 (서비스 로직 실행 전에 호출)
+    클라이언트가 가진 응답이 최신이면 304 응답을, 아니면 응답 헤더만 설정하고 None 을 반환합니다.
+    """
+    headers: Dict[str, str] = {HEADER_CACHE_CONTROL: cache_control}
+    if etag is not None:
+        headers[HEADER_ETAG] = etag
+    if last_modified is not None:
+        headers[HEADER_LAST_MODIFIED] = format_datetime(
+            last_modified.astimezone(UTC), usegmt=True
+        )
+    if vary is not None:
+        headers[HEADER_VARY] = vary
+    if _is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 async def s3_upload_file(folder: str, file: UploadFile) -> str:
     # 파일의 원본 이름에서 확장자 추출
     _, ext = os.path.splitext(file.filename)
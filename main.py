@@ -11,9 +11,12 @@ from tortoise import Tortoise
 from fastapi.openapi.utils import get_openapi
 
 from admin.routers import admin_router
-from common.config import TORTOISE_ORM
+from common.cache_utils import init_redis, close_redis
+from common.config import TORTOISE_ORM, close_log_handlers
+from common.constants import HEADER_NEXT_CURSOR
 from common.dependencies import get_admin
 from common.middlewares import AuthMiddleware, LimitUploadSizeMiddleware
+from notifications.pubsub import close_notification_broker
 from notifications.routers import notification_router
 from parties.routers import party_router
 from users.routers import user_router
@@ -25,10 +28,14 @@ from common.scheduler import scheduler, start_scheduler
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     await Tortoise.init(config=TORTOISE_ORM, timezone="Asia/Seoul")
+    await init_redis()
     start_scheduler()
     yield
     scheduler.shutdown()
+    await close_notification_broker()
+    await close_redis()
     await Tortoise.close_connections()
+    close_log_handlers()
 
 
 app = FastAPI(lifespan=lifespan, docs_url=None)
@@ -57,6 +64,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[HEADER_NEXT_CURSOR],
 )
 app.add_middleware(AuthMiddleware)
 
@@ -0,0 +1,33 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` ADD `approved_count` INT NOT NULL  COMMENT '승인된 참가자 수' DEFAULT 0;
+        ALTER TABLE `parties` ADD `pending_count` INT NOT NULL  COMMENT '승인 대기 참가자 수' DEFAULT 0;
+        ALTER TABLE `parties` ADD `like_count` INT NOT NULL  COMMENT '좋아요 수' DEFAULT 0;
+        UPDATE `parties` AS `p`
+            LEFT JOIN (
+                SELECT `party_id`,
+                    SUM(`status` = 1) AS `approved_count`,
+                    SUM(`status` = 0) AS `pending_count`
+                FROM `party_participants`
+                WHERE `party_id` IS NOT NULL
+                GROUP BY `party_id`
+            ) AS `pp` ON `pp`.`party_id` = `p`.`id`
+            LEFT JOIN (
+                SELECT `party_id`, COUNT(*) AS `like_count`
+                FROM `party_likes`
+                WHERE `party_id` IS NOT NULL
+                GROUP BY `party_id`
+            ) AS `pl` ON `pl`.`party_id` = `p`.`id`
+        SET `p`.`approved_count` = COALESCE(`pp`.`approved_count`, 0),
+            `p`.`pending_count` = COALESCE(`pp`.`pending_count`, 0),
+            `p`.`like_count` = COALESCE(`pl`.`like_count`, 0);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `parties` DROP COLUMN `approved_count`;
+        ALTER TABLE `parties` DROP COLUMN `pending_count`;
+        ALTER TABLE `parties` DROP COLUMN `like_count`;"""
@@ -0,0 +1,22 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 기존 notifications_read 데이터는 사용자별로 처음 조회할 때(또는 매일
+    # compact_notification_reads 작업에서) watermark 로 압축됩니다.
+    return """
+        CREATE TABLE IF NOT EXISTS `notification_read_watermarks` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `last_read_notification_id` BIGINT NOT NULL  COMMENT '이 ID 이하의 알림은 모두 읽음' DEFAULT 0,
+    `user_id` INT UNIQUE,
+    CONSTRAINT `fk_notifica_users_17efa510` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE SET NULL
+) CHARACTER SET utf8mb4 COMMENT='사용자별 알림 읽음 기준점';
+        CREATE INDEX `idx_notificatio_user_id_be185d` ON `notifications_read` (`user_id`, `notification_id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX `idx_notificatio_user_id_be185d` ON `notifications_read`;
+        DROP TABLE IF EXISTS `notification_read_watermarks`;"""
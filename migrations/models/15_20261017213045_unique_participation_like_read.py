@@ -0,0 +1,62 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 유니크 키 추가 전 중복 데이터 정리
+    # - 참가 신청: 상태 변경에 사용하던 가장 최근 신청만 남김
+    # - 좋아요/알림 읽음: 가장 먼저 생성된 기록만 남김
+    # 정리 후 파티의 참가자/좋아요 카운터를 다시 계산합니다.
+    return """
+        DELETE `pp` FROM `party_participants` AS `pp`
+            JOIN `party_participants` AS `newer`
+                ON `newer`.`participant_user_id` = `pp`.`participant_user_id`
+                AND `newer`.`party_id` = `pp`.`party_id`
+                AND `newer`.`id` > `pp`.`id`;
+        DELETE `pl` FROM `party_likes` AS `pl`
+            JOIN `party_likes` AS `older`
+                ON `older`.`user_id` = `pl`.`user_id`
+                AND `older`.`party_id` = `pl`.`party_id`
+                AND `older`.`id` < `pl`.`id`;
+        DELETE `nr` FROM `notifications_read` AS `nr`
+            JOIN `notifications_read` AS `older`
+                ON `older`.`user_id` = `nr`.`user_id`
+                AND `older`.`notification_id` = `nr`.`notification_id`
+                AND `older`.`id` < `nr`.`id`;
+        UPDATE `parties` AS `p`
+            LEFT JOIN (
+                SELECT `party_id`,
+                    SUM(`status` = 1) AS `approved_count`,
+                    SUM(`status` = 0) AS `pending_count`
+                FROM `party_participants`
+                WHERE `party_id` IS NOT NULL
+                GROUP BY `party_id`
+            ) AS `pp` ON `pp`.`party_id` = `p`.`id`
+            LEFT JOIN (
+                SELECT `party_id`, COUNT(*) AS `like_count`
+                FROM `party_likes`
+                WHERE `party_id` IS NOT NULL
+                GROUP BY `party_id`
+            ) AS `pl` ON `pl`.`party_id` = `p`.`id`
+        SET `p`.`approved_count` = COALESCE(`pp`.`approved_count`, 0),
+            `p`.`pending_count` = COALESCE(`pp`.`pending_count`, 0),
+            `p`.`like_count` = COALESCE(`pl`.`like_count`, 0);
+        ALTER TABLE `party_participants` ADD UNIQUE INDEX `uid_party_parti_partici_ac3853` (`participant_user_id`, `party_id`);
+        CREATE INDEX `idx_party_parti_party_i_afdb43` ON `party_participants` (`party_id`, `status`);
+        CREATE INDEX `idx_party_parti_partici_a176fd` ON `party_participants` (`participant_user_id`, `status`);
+        ALTER TABLE `party_likes` ADD UNIQUE INDEX `uid_party_likes_user_id_883ea6` (`user_id`, `party_id`);
+        CREATE INDEX `idx_notificatio_target__83dc24` ON `notifications` (`target_user_id`, `id`);
+        CREATE INDEX `idx_notificatio_is_glob_023320` ON `notifications` (`is_global`, `id`);
+        ALTER TABLE `notifications_read` ADD UNIQUE INDEX `uid_notificatio_user_id_be185d` (`user_id`, `notification_id`);
+        DROP INDEX `idx_notificatio_user_id_be185d` ON `notifications_read`;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX `idx_notificatio_user_id_be185d` ON `notifications_read` (`user_id`, `notification_id`);
+        ALTER TABLE `notifications_read` DROP INDEX `uid_notificatio_user_id_be185d`;
+        DROP INDEX `idx_notificatio_is_glob_023320` ON `notifications`;
+        DROP INDEX `idx_notificatio_target__83dc24` ON `notifications`;
+        ALTER TABLE `party_likes` DROP INDEX `uid_party_likes_user_id_883ea6`;
+        DROP INDEX `idx_party_parti_partici_a176fd` ON `party_participants`;
+        DROP INDEX `idx_party_parti_party_i_afdb43` ON `party_participants`;
+        ALTER TABLE `party_participants` DROP INDEX `uid_party_parti_partici_ac3853`;"""
@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `notification_outbox` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `event_type` VARCHAR(100) NOT NULL,
+    `payload` JSON NOT NULL,
+    `status` SMALLINT NOT NULL  COMMENT 'PENDING: 0\nDONE: 1\nDEAD: 2' DEFAULT 0,
+    `last_target_user_id` BIGINT NOT NULL  COMMENT '이 사용자 ID 까지 알림 생성 완료' DEFAULT 0,
+    `attempts` INT NOT NULL  COMMENT '실패 횟수' DEFAULT 0,
+    `last_error` LONGTEXT,
+    `available_at` DATETIME(6) NOT NULL  COMMENT '다음 처리 가능 시각' DEFAULT CURRENT_TIMESTAMP(6),
+    KEY `idx_notificatio_status_e21f90` (`status`, `available_at`)
+) CHARACTER SET utf8mb4 COMMENT='알림 발송 이벤트 (transactional outbox)';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `notification_outbox`;"""
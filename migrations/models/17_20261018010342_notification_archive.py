@@ -0,0 +1,38 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # notifications 는 외래 키(target_user_id, notifications_read.notification_id)가 있어
+    # MySQL 파티셔닝을 적용할 수 없으므로, created_at 인덱스로 오래된 알림을 배치 단위로 옮깁니다.
+    return """
+        CREATE INDEX `idx_notificatio_created_5f34f1` ON `notifications` (`created_at`);
+        CREATE TABLE IF NOT EXISTS `notifications_archive` (
+    `id` INT NOT NULL  PRIMARY KEY,
+    `created_at` DATETIME(6) NOT NULL,
+    `updated_at` DATETIME(6) NOT NULL,
+    `type` VARCHAR(100),
+    `classification` VARCHAR(100)   DEFAULT '',
+    `related_id` BIGINT,
+    `message` LONGTEXT,
+    `is_global` BOOL NOT NULL  DEFAULT 0,
+    `target_user_id` INT,
+    `archived_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6)
+) CHARACTER SET utf8mb4 COMMENT='보관 기간이 지나 notifications 에서 옮긴 알림 (ID, 생성 시각 유지)';
+        CREATE TABLE IF NOT EXISTS `notification_archive_runs` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `cutoff_at` DATETIME(6) NOT NULL  COMMENT '이 시각 이전 알림을 보관',
+    `finished_at` DATETIME(6),
+    `archived_count` INT NOT NULL  DEFAULT 0,
+    `deleted_read_count` INT NOT NULL  DEFAULT 0,
+    `batch_count` INT NOT NULL  DEFAULT 0,
+    `error` LONGTEXT
+) CHARACTER SET utf8mb4 COMMENT='알림 보관 작업 실행 기록 (관리자 리포트)';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `notification_archive_runs`;
+        DROP TABLE IF EXISTS `notifications_archive`;
+        DROP INDEX `idx_notificatio_created_5f34f1` ON `notifications`;"""
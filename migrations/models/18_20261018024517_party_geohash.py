@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 좌표가 없는 파티가 있어 SPATIAL 인덱스(NOT NULL POINT 필요) 대신
+    # geohash prefix 범위를 B-tree 인덱스로 조회합니다. 기존 파티는 ST_GeoHash 로 채웁니다.
+    return """
+        ALTER TABLE `parties` ADD `geohash` VARCHAR(12)   COMMENT '근처 파티 조회용 좌표 geohash';
+        CREATE INDEX `idx_parties_geohash_913ef9` ON `parties` (`geohash`);
+        UPDATE `parties` SET `geohash` = ST_GeoHash(`longitude`, `latitude`, 9)
+        WHERE `longitude` IS NOT NULL AND `latitude` IS NOT NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX `idx_parties_geohash_913ef9` ON `parties`;
+        ALTER TABLE `parties` DROP COLUMN `geohash`;"""
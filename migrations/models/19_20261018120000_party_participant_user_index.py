@@ -0,0 +1,12 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 알림 outbox 가 파티원을 사용자 ID 순으로 배치 조회 (ORDER BY ... LIMIT)
+    return """
+        CREATE INDEX `idx_party_parti_party_i_af1c5b` ON `party_participants` (`party_id`, `participant_user_id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX `idx_party_parti_party_i_af1c5b` ON `party_participants`;"""
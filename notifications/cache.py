@@ -0,0 +1,180 @@
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from redis.exceptions import WatchError
+
+from common.cache_constants import (
+    CACHE_KEY_NOTIFICATION_GLOBAL_SEQ,
+    CACHE_KEY_NOTIFICATION_UNREAD,
+    DURATION_NOTIFICATION_UNREAD,
+)
+from common.cache_utils import (
+    FIELD_REBUILT_AT,
+    RedisManager,
+    get_cache_stats,
+    is_recently_rebuilt,
+)
+from common.config import logger
+
+# 사용자별 카운터 hash 필드
+FIELD_UNREAD_COUNT = "count"
+FIELD_GLOBAL_SEQ = "global_seq"
+UNREAD_COUNT_REBUILD_RETRIES = 3
+
+notification_unread_cache_stats = get_cache_stats("notification_unread")
+
+
+def _unread_key(user_id: int) -> str:
+    return CACHE_KEY_NOTIFICATION_UNREAD.format(user_id=user_id)
+
+
+async def increment_unread_counts(user_ids: Iterable[int]) -> None:
+    """
+    개인 알림 생성 시 대상 사용자의 읽지 않은 알림 수 증가
+    카운터가 없는 사용자는 불완전한 hash 가 생기지만, 조회 시 다시 계산됩니다.
+    다시 계산한 직후의 카운터는 이 알림이 이미 집계되었을 수 있으므로 삭제합니다.
+    """
+    counts = Counter(user_ids)
+    if not counts:
+        return
+    try:
+        pipe = RedisManager().pipeline()
+        for user_id, count in counts.items():
+            pipe.hincrby(_unread_key(user_id), FIELD_UNREAD_COUNT, count)
+            pipe.hget(_unread_key(user_id), FIELD_REBUILT_AT)
+        results = await pipe.execute()
+        rebuilt_keys = [
+            _unread_key(user_id)
+            for user_id, rebuilt_at in zip(counts, results[1::2])
+            if is_recently_rebuilt(rebuilt_at)
+        ]
+        if rebuilt_keys:
+            await RedisManager().delete_value(*rebuilt_keys)
+    except Exception as e:
+        logger.error(f"[Notification Unread] increment error, msg:{e}")
+
+
+async def increment_global_sequence(count: int) -> None:
+    """전체 알림 생성 시 공용 시퀀스 증가 (사용자별 global_seq 와 비교)"""
+    if count <= 0:
+        return
+    try:
+        await RedisManager().client.incrby(CACHE_KEY_NOTIFICATION_GLOBAL_SEQ, count)
+    except Exception as e:
+        logger.error(f"[Notification Unread] global sequence error, msg:{e}")
+
+
+async def decrement_unread_count(user_id: int, count: int) -> Optional[int]:
+    """
+    새로 읽음 처리된 알림 수만큼 감소 (이미 읽은 알림은 호출 전에 제외)
+    :return: 감소 후 읽지 않은 알림 수, 카운터가 없거나 불완전하면 None
+    """
+    try:
+        pipe = RedisManager().pipeline()
+        pipe.hincrby(_unread_key(user_id), FIELD_UNREAD_COUNT, -count)
+        pipe.hmget(_unread_key(user_id), FIELD_GLOBAL_SEQ, FIELD_REBUILT_AT)
+        pipe.get(CACHE_KEY_NOTIFICATION_GLOBAL_SEQ)
+        unread_count, (user_global_seq, rebuilt_at), global_seq = await pipe.execute()
+        if is_recently_rebuilt(rebuilt_at):
+            # 다시 계산할 때 이 읽음이 이미 반영되었을 수 있으므로 카운터 삭제
+            await RedisManager().delete_value(_unread_key(user_id))
+            return None
+    except Exception as e:
+        logger.error(f"[Notification Unread] decrement error, msg:{e}")
+        return None
+    return _unread_count_from_fields(unread_count, user_global_seq, global_seq)
+
+
+def _unread_count_from_fields(
+    unread_count: Optional[Any],
+    user_global_seq: Optional[Any],
+    global_seq: Optional[Any],
+) -> Optional[int]:
+    """
+    카운터 필드로 읽지 않은 알림 수 계산
+    카운터가 불완전하거나 음수(중복 감소)면 None 을 반환해 DB 기준으로 다시 계산하게 합니다.
+    """
+    global_seq = int(global_seq or 0)
+    if (
+        unread_count is None
+        or user_global_seq is None
+        or int(user_global_seq) > global_seq
+        or int(unread_count) < 0
+    ):
+        return None
+    # 카운터 이후 생성된 전체 알림 수를 더함
+    return int(unread_count) + global_seq - int(user_global_seq)
+
+
+async def get_cached_unread_count(user_id: int) -> Optional[int]:
+    """
+    Redis 만으로 읽지 않은 알림 수를 계산합니다.
+    :return: 읽지 않은 알림 수, 카운터가 없거나 불완전하면 None
+    """
+    try:
+        pipe = RedisManager().pipeline()
+        pipe.hmget(_unread_key(user_id), FIELD_UNREAD_COUNT, FIELD_GLOBAL_SEQ)
+        pipe.get(CACHE_KEY_NOTIFICATION_GLOBAL_SEQ)
+        (unread_count, user_global_seq), global_seq = await pipe.execute()
+    except Exception as e:
+        logger.error(f"[Notification Unread] get error, user_id:{user_id}, msg:{e}")
+        return None
+
+    unread_count = _unread_count_from_fields(unread_count, user_global_seq, global_seq)
+    if unread_count is None:
+        notification_unread_cache_stats.miss()
+        return None
+    notification_unread_cache_stats.hit()
+    return unread_count
+
+
+async def rebuild_unread_count(
+    user_id: int, count_from_db: Callable[[], Awaitable[int]]
+) -> int:
+    """
+    DB 기준으로 카운터를 다시 계산해 저장합니다.
+    계산 중 알림이 생성/읽음 처리되면(WATCH 키 변경) 다시 계산하고,
+    저장 이후 늦게 도착한 증감은 계산 시각(rebuilt_at)을 보고 카운터를 삭제합니다.
+    """
+    key = _unread_key(user_id)
+    unread_count: Optional[int] = None
+    for _ in range(UNREAD_COUNT_REBUILD_RETRIES):
+        try:
+            async with RedisManager().pipeline(transaction=True) as pipe:
+                await pipe.watch(key, CACHE_KEY_NOTIFICATION_GLOBAL_SEQ)
+                global_seq = int(await pipe.get(CACHE_KEY_NOTIFICATION_GLOBAL_SEQ) or 0)
+                unread_count = await count_from_db()
+                pipe.multi()
+                pipe.delete(key)
+                pipe.hset(
+                    key,
+                    mapping={
+                        FIELD_UNREAD_COUNT: unread_count,
+                        FIELD_GLOBAL_SEQ: global_seq,
+                        FIELD_REBUILT_AT: time.time(),
+                    },
+                )
+                pipe.expire(key, DURATION_NOTIFICATION_UNREAD)
+                await pipe.execute()
+                return unread_count
+        except WatchError:
+            continue
+        except Exception as e:
+            logger.error(
+                f"[Notification Unread] rebuild error, user_id:{user_id}, msg:{e}"
+            )
+            break
+    # 저장하지 못한 경우에도 마지막으로 계산한 DB 값을 반환
+    return unread_count if unread_count is not None else await count_from_db()
+
+
+async def invalidate_unread_counts(user_ids: Iterable[int]) -> None:
+    """알림이 삭제(보관)되어 카운터가 맞지 않는 사용자의 카운터 삭제 (조회 시 다시 계산)"""
+    keys = [_unread_key(user_id) for user_id in set(user_ids)]
+    if not keys:
+        return
+    try:
+        await RedisManager().delete_value(*keys)
+    except Exception as e:
+        logger.error(f"[Notification Unread] invalidate error, msg:{e}")
@@ -10,6 +10,13 @@ class NotificationBaseDto(BaseModel):
     is_global: bool
 
 
+class NotificationGlobalCreateDto(BaseModel):
+    type: str
+    classification: Optional[str] = None
+    related_id: Optional[int] = None
+    message: str
+
+
 class NotificationSpecificDto(NotificationBaseDto):
     target_user_id: int
 
@@ -28,7 +35,8 @@ class NotificationReadDto(BaseModel):
 
 class NotificationListDto(BaseModel):
     notifications: List[NotificationDto]
-    total_pages: int
+    # cursor 모드에서는 계산하지 않음
+    total_pages: Optional[int] = None
 
 
 class NotificationUnreadCountDto(BaseModel):
@@ -1,4 +1,7 @@
+from enum import IntEnum
+
 from tortoise import fields
+from tortoise.models import Model
 from common.models import BaseModel
 
 
@@ -17,6 +20,39 @@ class Notification(BaseModel):
 
     class Meta:
         table = "notifications"
+        indexes = (("target_user", "id"), ("is_global", "id"), ("created_at",))
+
+
+class NotificationArchive(Model):
+    """보관 기간이 지나 notifications 에서 옮긴 알림 (ID, 생성 시각 유지)"""
+
+    id = fields.IntField(pk=True, generated=False)
+    created_at = fields.DatetimeField()
+    updated_at = fields.DatetimeField()
+    type = fields.CharField(max_length=100, null=True)
+    classification = fields.CharField(max_length=100, default="", null=True)
+    related_id = fields.BigIntField(null=True)
+    message = fields.TextField(null=True)
+    is_global = fields.BooleanField(default=False)
+    target_user_id = fields.IntField(null=True)
+    archived_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "notifications_archive"
+
+
+class NotificationArchiveRun(BaseModel):
+    """알림 보관 작업 실행 기록 (관리자 리포트)"""
+
+    cutoff_at = fields.DatetimeField(description="이 시각 이전 알림을 보관")
+    finished_at = fields.DatetimeField(null=True)
+    archived_count = fields.IntField(default=0)
+    deleted_read_count = fields.IntField(default=0)
+    batch_count = fields.IntField(default=0)
+    error = fields.TextField(null=True)
+
+    class Meta:
+        table = "notification_archive_runs"
 
 
 class NotificationRead(BaseModel):
@@ -35,3 +71,55 @@ class NotificationRead(BaseModel):
 
     class Meta:
         table = "notifications_read"
+        unique_together = (("user", "notification"),)
+
+
+class NotificationReadWatermark(BaseModel):
+    """
+    사용자별 알림 읽음 기준점
+    last_read_notification_id 이하의 알림은 모두 읽음으로 보고,
+    그보다 큰 ID 중 먼저 읽은 알림만 notifications_read 에 남깁니다.
+    """
+
+    user = fields.OneToOneField(
+        "models.User",
+        related_name="notification_watermark",
+        null=True,
+        on_delete=fields.SET_NULL,
+    )
+    last_read_notification_id = fields.BigIntField(
+        default=0, description="이 ID 이하의 알림은 모두 읽음"
+    )
+
+    class Meta:
+        table = "notification_read_watermarks"
+
+
+class OutboxStatus(IntEnum):
+    PENDING = 0
+    DONE = 1
+    DEAD = 2
+
+
+class NotificationOutbox(BaseModel):
+    """
+    알림 발송 이벤트 (transactional outbox)
+    도메인 변경과 같은 트랜잭션에서 이벤트 하나만 기록하고,
+    워커가 대상 사용자별 알림으로 나누어 생성합니다.
+    """
+
+    event_type = fields.CharField(max_length=100)
+    payload = fields.JSONField()
+    status = fields.IntEnumField(OutboxStatus, default=OutboxStatus.PENDING)
+    last_target_user_id = fields.BigIntField(
+        default=0, description="이 사용자 ID 까지 알림 생성 완료"
+    )
+    attempts = fields.IntField(default=0, description="실패 횟수")
+    last_error = fields.TextField(null=True)
+    available_at = fields.DatetimeField(
+        auto_now_add=True, description="다음 처리 가능 시각"
+    )
+
+    class Meta:
+        table = "notification_outbox"
+        indexes = (("status", "available_at"),)
@@ -0,0 +1,177 @@
+from datetime import datetime, timedelta, UTC
+from os import getenv
+from typing import Any, Dict, Iterable, List, Optional
+
+from tortoise.transactions import in_transaction
+
+from common.config import logger
+from notifications.dto import NotificationBaseDto
+from notifications.models import Notification, NotificationOutbox, OutboxStatus
+from notifications.service import NotificationService
+from parties.models import ParticipationStatus, PartyParticipant
+
+# 파티 참가자(및 추가 대상)에게 같은 알림을 보내는 이벤트
+EVENT_PARTY_PARTICIPANTS = "party_participants"
+
+# 한 트랜잭션에서 생성할 알림 수
+NOTIFICATION_OUTBOX_BATCH_SIZE = int(getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", 500))
+# 한 번에 처리할 이벤트 수
+NOTIFICATION_OUTBOX_EVENT_LIMIT = int(getenv("NOTIFICATION_OUTBOX_EVENT_LIMIT", 100))
+# 이 횟수만큼 실패하면 DEAD(dead-letter) 상태로 변경
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = int(getenv("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", 5))
+# 재시도 대기 시간(초), 실패할 때마다 두 배씩 증가
+NOTIFICATION_OUTBOX_RETRY_DELAY = float(getenv("NOTIFICATION_OUTBOX_RETRY_DELAY", 10))
+# 이벤트 확인 주기(초)
+NOTIFICATION_OUTBOX_POLL_INTERVAL = float(
+    getenv("NOTIFICATION_OUTBOX_POLL_INTERVAL", 2)
+)
+# false 면 앱 프로세스에서는 처리하지 않음 (python -m notifications.worker 로 별도 실행)
+NOTIFICATION_OUTBOX_IN_APP = getenv("NOTIFICATION_OUTBOX_IN_APP", "true") == "true"
+
+
+async def enqueue_party_notification(
+    notification: NotificationBaseDto,
+    party_id: int,
+    participant_statuses: Iterable[ParticipationStatus],
+    extra_user_ids: Iterable[Optional[int]] = (),
+    exclude_user_id: Optional[int] = None,
+) -> NotificationOutbox:
+    """
+    파티 참가자 알림 이벤트를 기록합니다.
+    도메인 변경과 같은 트랜잭션 안에서 호출하면 변경이 커밋될 때만 알림이 발송됩니다.
+    :param notification: 대상 사용자를 제외한 알림 내용
+    :param party_id: 파티 ID
+    :param participant_statuses: 알림을 받을 참가 상태
+    :param extra_user_ids: 참가자 외 추가 대상 (예: 파티장)
+    :param exclude_user_id: 제외할 사용자 (예: 댓글 작성자 본인)
+    """
+    return await NotificationOutbox.create(
+        event_type=EVENT_PARTY_PARTICIPANTS,
+        payload={
+            "notification": notification.model_dump(),
+            "party_id": party_id,
+            "participant_statuses": [int(status) for status in participant_statuses],
+            "extra_user_ids": [
+                user_id for user_id in extra_user_ids if user_id is not None
+            ],
+            "exclude_user_id": exclude_user_id,
+        },
+    )
+
+
+async def _get_party_target_user_ids(
+    payload: Dict[str, Any], after_user_id: int, limit: int
+) -> List[int]:
+    """after_user_id 이후의 대상 사용자 ID (오름차순, 최대 limit 개)"""
+    # 정렬과 배치 크기를 SQL 로 처리해 큰 파티도 배치마다 limit 개만 읽음
+    # ((party, participant_user) 인덱스 범위 조회)
+    participants = PartyParticipant.filter(
+        party_id=payload["party_id"],
+        status__in=payload["participant_statuses"],
+        participant_user_id__gt=after_user_id,
+    )
+    if payload["exclude_user_id"] is not None:
+        participants = participants.exclude(
+            participant_user_id=payload["exclude_user_id"]
+        )
+    participant_user_ids = (
+        await participants.order_by("participant_user_id")
+        .limit(limit)
+        .values_list("participant_user_id", flat=True)
+    )
+    # 추가 대상(파티장 등)은 소수이므로 합친 뒤 다시 limit 개로 자름
+    target_user_ids = {
+        user_id
+        for user_id in [*participant_user_ids, *payload["extra_user_ids"]]
+        if user_id > after_user_id and user_id != payload["exclude_user_id"]
+    }
+    return sorted(target_user_ids)[:limit]
+
+
+async def _process_event_batch(event_id: int, batch_size: int) -> Optional[int]:
+    """
+    이벤트의 다음 배치를 처리합니다.
+    알림 생성과 진행 위치 갱신을 한 트랜잭션으로 묶어, 실패한 배치만 다시 처리합니다.
+    :return: 생성한 알림 수, 처리할 이벤트가 없으면(완료/다른 워커가 처리 중) None
+    """
+    async with in_transaction():
+        event = await NotificationOutbox.select_for_update(
+            skip_locked=True
+        ).get_or_none(id=event_id, status=OutboxStatus.PENDING)
+        if event is None:
+            return None
+
+        target_user_ids = await _get_party_target_user_ids(
+            event.payload, event.last_target_user_id, batch_size
+        )
+        if not target_user_ids:
+            event.status = OutboxStatus.DONE
+            await event.save(update_fields=["status", "updated_at"])
+            return None
+
+        notifications = [
+            Notification(**event.payload["notification"], target_user_id=user_id)
+            for user_id in target_user_ids
+        ]
+        await Notification.bulk_create(notifications)
+        event.last_target_user_id = target_user_ids[-1]
+        await event.save(update_fields=["last_target_user_id", "updated_at"])
+
+    # 커밋된 알림만 카운터에 반영
+    await NotificationService.after_notifications_created(notifications)
+    return len(notifications)
+
+
+async def _record_failure(event_id: int, error: Exception) -> None:
+    event = await NotificationOutbox.get(id=event_id)
+    event.attempts += 1
+    event.last_error = str(error)
+    if event.attempts >= NOTIFICATION_OUTBOX_MAX_ATTEMPTS:
+        event.status = OutboxStatus.DEAD
+        logger.error(
+            f"[Notification Outbox] moved to dead-letter, event_id:{event_id}, msg:{error}"
+        )
+    else:
+        delay = NOTIFICATION_OUTBOX_RETRY_DELAY * 2 ** (event.attempts - 1)
+        event.available_at = datetime.now(UTC) + timedelta(seconds=delay)
+        logger.warning(
+            f"[Notification Outbox] retry in {delay}s, event_id:{event_id}, msg:{error}"
+        )
+    await event.save(
+        update_fields=["attempts", "last_error", "status", "available_at", "updated_at"]
+    )
+
+
+async def process_notification_outbox(
+    batch_size: int = NOTIFICATION_OUTBOX_BATCH_SIZE,
+    event_limit: int = NOTIFICATION_OUTBOX_EVENT_LIMIT,
+) -> int:
+    """
+    처리 가능한 알림 이벤트를 대상 사용자별 알림으로 나누어 생성합니다.
+    :return: 생성한 알림 수
+    """
+    event_ids = (
+        await NotificationOutbox.filter(
+            status=OutboxStatus.PENDING, available_at__lte=datetime.now(UTC)
+        )
+        .order_by("id")
+        .limit(event_limit)
+        .values_list("id", flat=True)
+    )
+    created_count = 0
+    for event_id in event_ids:
+        try:
+            while (
+                batch_count := await _process_event_batch(event_id, batch_size)
+            ) is not None:
+                created_count += batch_count
+        except Exception as e:
+            await _record_failure(event_id, e)
+    return created_count
+
+
+async def retry_dead_notification_events(event_ids: Iterable[int]) -> int:
+    """dead-letter 이벤트를 다시 처리 대기 상태로 변경 (이미 생성된 배치는 건너뜀)"""
+    return await NotificationOutbox.filter(
+        id__in=list(event_ids), status=OutboxStatus.DEAD
+    ).update(status=OutboxStatus.PENDING, attempts=0, available_at=datetime.now(UTC))
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from collections import Counter, defaultdict
+from os import getenv
+from typing import Any, Dict, Iterable, Optional, Set
+
+from redis.asyncio.client import PubSub
+
+from common.cache_constants import (
+    PUBSUB_CHANNEL_NOTIFICATION_GLOBAL,
+    PUBSUB_CHANNEL_NOTIFICATION_USER,
+)
+from common.cache_utils import RedisManager
+from common.config import logger
+
+# 연결별 대기 이벤트 최대 개수 (초과하면 쌓인 이벤트를 버리고 다시 동기화)
+NOTIFICATION_STREAM_QUEUE_SIZE = int(getenv("NOTIFICATION_STREAM_QUEUE_SIZE", 100))
+
+# 알림 생성/읽음 이벤트
+EVENT_NOTIFICATION_CREATED = "created"
+EVENT_NOTIFICATION_READ = "read"
+# 대기 이벤트가 넘친 연결에 전달하는 이벤트 (알림 수/목록을 다시 조회)
+EVENT_NOTIFICATION_RESYNC = "resync"
+
+
+def _user_channel(user_id: int) -> str:
+    return PUBSUB_CHANNEL_NOTIFICATION_USER.format(user_id=user_id)
+
+
+async def publish_notifications_created(
+    user_ids: Iterable[int], global_count: int = 0
+) -> None:
+    """
+    알림 생성 이벤트 발행
+    알림 내용 대신 개수만 보내고, 연결에서 마지막으로 보낸 알림 이후를 조회합니다.
+    """
+    counts = Counter(user_ids)
+    if not counts and global_count <= 0:
+        return
+    try:
+        pipe = RedisManager().pipeline()
+        for user_id, count in counts.items():
+            pipe.publish(
+                _user_channel(user_id),
+                json.dumps({"event": EVENT_NOTIFICATION_CREATED, "count": count}),
+            )
+        if global_count > 0:
+            pipe.publish(
+                PUBSUB_CHANNEL_NOTIFICATION_GLOBAL,
+                json.dumps(
+                    {"event": EVENT_NOTIFICATION_CREATED, "count": global_count}
+                ),
+            )
+        await pipe.execute()
+    except Exception as e:
+        logger.error(f"[Notification PubSub] publish error, msg:{e}")
+
+
+async def publish_notifications_read(user_id: int, count: int) -> None:
+    """읽음 처리 이벤트 발행 (같은 사용자의 다른 기기에 알림 수 반영)"""
+    if count <= 0:
+        return
+    try:
+        await RedisManager().client.publish(
+            _user_channel(user_id),
+            json.dumps({"event": EVENT_NOTIFICATION_READ, "count": count}),
+        )
+    except Exception as e:
+        logger.error(f"[Notification PubSub] publish error, msg:{e}")
+
+
+class NotificationBroker:
+    """
+    워커 프로세스당 Redis 구독 연결 하나로 받은 이벤트를 이 프로세스에 연결된 클라이언트에게 전달합니다.
+    사용자 채널은 해당 사용자의 첫 연결에서 구독하고 마지막 연결이 끊기면 해제합니다.
+    """
+
+    def __init__(self, queue_size: int = NOTIFICATION_STREAM_QUEUE_SIZE) -> None:
+        self.queue_size = queue_size
+        self._queues: Dict[int, Set["asyncio.Queue[Dict[str, Any]]"]] = defaultdict(set)
+        self._pubsub: Optional[PubSub] = None
+        self._listener: Optional["asyncio.Task[None]"] = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self, user_id: int) -> "asyncio.Queue[Dict[str, Any]]":
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(self.queue_size)
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = RedisManager().client.pubsub()
+                await self._pubsub.subscribe(PUBSUB_CHANNEL_NOTIFICATION_GLOBAL)
+                self._listener = asyncio.create_task(self._listen(self._pubsub))
+            if not self._queues[user_id]:
+                await self._pubsub.subscribe(_user_channel(user_id))
+            self._queues[user_id].add(queue)
+        return queue
+
+    async def disconnect(
+        self, user_id: int, queue: "asyncio.Queue[Dict[str, Any]]"
+    ) -> None:
+        async with self._lock:
+            queues = self._queues.get(user_id)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if not queues:
+                del self._queues[user_id]
+                if self._pubsub is not None:
+                    await self._pubsub.unsubscribe(_user_channel(user_id))
+
+    async def close(self) -> None:
+        """앱 종료 시 구독 연결 정리"""
+        async with self._lock:
+            if self._listener is not None:
+                self._listener.cancel()
+                self._listener = None
+            if self._pubsub is not None:
+                await self._pubsub.aclose()
+                self._pubsub = None
+            self._queues.clear()
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        while True:
+            try:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 연결이 끊긴 경우 redis-py 가 다음 호출에서 재연결 후 다시 구독
+                logger.error(f"[Notification PubSub] listen error, msg:{e}")
+                await asyncio.sleep(1)
+                continue
+            if message is not None:
+                self._dispatch(message)
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        channel = message["channel"].decode()
+        event = json.loads(message["data"])
+        if channel == PUBSUB_CHANNEL_NOTIFICATION_GLOBAL:
+            targets = [queue for queues in self._queues.values() for queue in queues]
+        else:
+            user_id = int(channel.rsplit(":", 1)[1])
+            targets = list(self._queues.get(user_id, ()))
+        for queue in targets:
+            self._put(queue, event)
+
+    @staticmethod
+    def _put(queue: "asyncio.Queue[Dict[str, Any]]", event: Dict[str, Any]) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 연결: 쌓인 이벤트를 버리고 다시 동기화하도록 해 메모리를 제한
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"event": EVENT_NOTIFICATION_RESYNC})
+
+
+notification_broker = NotificationBroker()
+
+
+async def close_notification_broker() -> None:
+    await notification_broker.close()
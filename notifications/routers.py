@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from starlette import status
 from common.config import logger
+from common.constants import HEADER_NEXT_CURSOR
 from common.dependencies import get_current_user
 from common.logging_configs import LoggingAPIRoute
 from common.mixpanel_constants import (
@@ -10,6 +14,7 @@ from common.mixpanel_constants import (
 from common.utils import track_analytics
 from notifications.dto import NotificationUnreadCountDto, NotificationListDto
 from notifications.service import NotificationService
+from notifications.stream import notification_event_stream
 from users.dto.request import NotificationReadRequest
 from users.models import User
 
@@ -25,27 +30,55 @@ notification_router = APIRouter(
     status_code=status.HTTP_200_OK,
 )
 async def get_user_notifications(
+    response: Response,
     user: User = Depends(get_current_user),
     page: int = 1,
+    cursor: Optional[str] = None,
 ) -> NotificationListDto:
+    """
+    알림 목록 api.
+    cursor 를 전달하면 page 대신 keyset 페이지네이션을 사용하며(total_pages 는 null),
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환합니다.
+    """
     service = NotificationService(user)
-    notification_list = await service.get_user_notifications(page=page)
+    try:
+        notification_list = await service.get_user_notifications(
+            page=page, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if service.next_cursor:
+        response.headers[HEADER_NEXT_CURSOR] = service.next_cursor
     # analytics 트래킹
     await track_analytics(event_name=MIXPANEL_EVENT_VIEW_NOTIFICATIONS, user_id=user.id)
     return notification_list
 
 
 @notification_router.post(
-    "/read", response_model=None, status_code=status.HTTP_201_CREATED
+    "/read",
+    response_model=NotificationUnreadCountDto,
+    status_code=status.HTTP_201_CREATED,
 )
 async def read_user_notifications(
     body: NotificationReadRequest, user: User = Depends(get_current_user)
-) -> str:
+) -> NotificationUnreadCountDto:
+    """
+    알림 읽음 처리 api.
+    read_up_to_id 를 전달하면 해당 ID 이하의 알림을 모두 읽음 처리하며,
+    처리 후 읽지 않은 알림 수를 반환합니다.
+    """
     service = NotificationService(user)
-    await service.mark_notifications_as_read(body.read_notification_list)
+    if body.read_up_to_id is not None:
+        unread_count = await service.mark_notifications_as_read_up_to(
+            body.read_up_to_id
+        )
+    if body.read_notification_list or body.read_up_to_id is None:
+        unread_count = await service.mark_notifications_as_read(
+            body.read_notification_list
+        )
     # analytics 트래킹
     await track_analytics(event_name=MIXPANEL_EVENT_READ_NOTIFICATIONS, user_id=user.id)
-    return "Notifications successfully read"
+    return NotificationUnreadCountDto(count=unread_count)
 
 
 @notification_router.get(
@@ -67,3 +100,24 @@ async def get_notification_count(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         )
+
+
+@notification_router.get("/stream", status_code=status.HTTP_200_OK)
+async def stream_user_notifications(
+    user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    알림 실시간 수신 api (Server-Sent Events).
+    - unread_count: 연결 시(및 이벤트 유실 시) 읽지 않은 알림 수
+    - notification: 새 알림
+    - unread_count_delta: 읽지 않은 알림 수 변화량
+    """
+    return StreamingResponse(
+        notification_event_stream(user),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx 가 응답을 버퍼링하지 않도록 설정
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -1,20 +1,43 @@
-from typing import Optional, Sequence
+import heapq
+from itertools import islice
+from typing import List, Optional, Sequence, Set
 
 from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
 
 from common.constants import FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ
+from common.utils import gather_queries, get_next_cursor, paginate_by_id
+from notifications.cache import (
+    decrement_unread_count,
+    get_cached_unread_count,
+    increment_global_sequence,
+    increment_unread_counts,
+    rebuild_unread_count,
+)
 from notifications.dto import (
     NotificationDto,
     NotificationBaseDto,
+    NotificationGlobalCreateDto,
     NotificationListDto,
 )
-from notifications.models import Notification, NotificationRead
+from notifications.pubsub import (
+    publish_notifications_created,
+    publish_notifications_read,
+)
+from notifications.models import (
+    Notification,
+    NotificationRead,
+    NotificationReadWatermark,
+)
 from users.models import User
 
 
 class NotificationService:
     def __init__(self, user: Optional[User] = None) -> None:
         self.user = user
+        # 마지막 조회 결과 이후 페이지를 가리키는 커서 (마지막 페이지면 None)
+        self.next_cursor: Optional[str] = None
 
     @staticmethod
     async def create_notifications(
@@ -26,41 +49,263 @@ class NotificationService:
         """
         notifications = [Notification(**data.dict()) for data in notifications_data]
         await Notification.bulk_create(notifications)
+        await NotificationService.after_notifications_created(notifications)
 
-    async def mark_notifications_as_read(self, notification_ids: list[int]) -> None:
-        read_notifications = [
-            NotificationRead(user=self.user, notification_id=notification_id)
-            for notification_id in notification_ids
+    @staticmethod
+    async def after_notifications_created(notifications: List[Notification]) -> None:
+        """생성(커밋)된 알림만큼 읽지 않은 알림 카운터 갱신 후 연결된 클라이언트에 알림"""
+        target_user_ids = [
+            notification.target_user_id
+            for notification in notifications
+            if not notification.is_global and notification.target_user_id
+        ]
+        global_count = sum(
+            1 for notification in notifications if notification.is_global
+        )
+        await increment_unread_counts(target_user_ids)
+        await increment_global_sequence(global_count)
+        await publish_notifications_created(target_user_ids, global_count)
+
+    @staticmethod
+    async def create_global_notification(
+        notification_data: NotificationGlobalCreateDto,
+    ) -> Notification:
+        """
+        전체 알림 생성
+        사용자 수와 무관하게 알림 한 건만 저장하고, 조회 시 개인 알림과 병합합니다.
+        """
+        notification = await Notification.create(
+            **notification_data.model_dump(), is_global=True
+        )
+        await increment_global_sequence(1)
+        await publish_notifications_created([], global_count=1)
+        return notification
+
+    def _visible_query(self) -> Q:
+        """사용자에게 보이는 알림 (개인 알림 + 전체 알림)"""
+        return Q(target_user=self.user) | Q(is_global=True)
+
+    def _notification_streams(self) -> List[QuerySet[Notification]]:
+        """
+        사용자에게 보이는 알림을 인덱스를 각각 타는 두 스트림으로 나눔
+        (target_user_id, id) / (is_global, id) 인덱스로 OR 조건 없이 조회합니다.
+        """
+        return [
+            Notification.filter(target_user=self.user),
+            Notification.filter(is_global=True),
         ]
-        await NotificationRead.bulk_create(read_notifications)
+
+    @staticmethod
+    def _merge_streams(
+        streams: Sequence[List[Notification]],
+        offset: int,
+        limit: int,
+        descending: bool = True,
+    ) -> List[Notification]:
+        """id 순으로 정렬된 스트림들을 k-way merge 후 [offset, offset + limit)"""
+        merged = heapq.merge(
+            *streams, key=lambda notification: notification.id, reverse=descending
+        )
+        return list(islice(merged, offset, offset + limit))
+
+    async def _get_read_ids_after(self, watermark_id: int) -> Set[int]:
+        """watermark 이후(ID 가 더 큰) 알림 중 읽은 알림 ID"""
+        return set(
+            await NotificationRead.filter(
+                user=self.user, notification_id__gt=watermark_id
+            ).values_list("notification_id", flat=True)
+        )
+
+    async def _get_watermark_id(self) -> int:
+        watermark = await NotificationReadWatermark.get_or_none(user=self.user)
+        if watermark is None:
+            # 기존 notifications_read 데이터만 있는 사용자는 처음 조회할 때 압축
+            return await self.compact_read_state()
+        return watermark.last_read_notification_id
+
+    async def compact_read_state(self) -> int:
+        """
+        watermark 를 읽지 않은 가장 오래된 알림 직전까지 올리고,
+        watermark 이하가 된 읽음 기록은 삭제합니다.
+        :return: 갱신된 watermark
+        """
+        async with in_transaction():
+            watermark, _ = await NotificationReadWatermark.get_or_create(user=self.user)
+            watermark = await NotificationReadWatermark.select_for_update().get(
+                id=watermark.id
+            )
+            watermark_id = watermark.last_read_notification_id
+            read_ids = await self._get_read_ids_after(watermark_id)
+            if not read_ids:
+                return watermark_id
+
+            oldest_unread_ids = [
+                notification_id
+                for stream in self._notification_streams()
+                for notification_id in await stream.filter(id__gt=watermark_id)
+                .exclude(id__in=list(read_ids))
+                .order_by("id")
+                .limit(1)
+                .values_list("id", flat=True)
+            ]
+            oldest_unread_id = min(oldest_unread_ids, default=None)
+            new_watermark_id = max(
+                (
+                    read_id
+                    for read_id in read_ids
+                    if oldest_unread_id is None or read_id < oldest_unread_id
+                ),
+                default=watermark_id,
+            )
+            if new_watermark_id > watermark_id:
+                watermark.last_read_notification_id = new_watermark_id
+                await watermark.save(
+                    update_fields=["last_read_notification_id", "updated_at"]
+                )
+                await NotificationRead.filter(
+                    user=self.user, notification_id__lte=new_watermark_id
+                ).delete()
+            return new_watermark_id
+
+    async def mark_notifications_as_read(self, notification_ids: List[int]) -> int:
+        """
+        주어진 알림 읽음 처리 (여러 번 호출해도 결과가 같음)
+        :return: 읽음 처리 후 읽지 않은 알림 수
+        """
+        watermark_id = await self._get_watermark_id()
+        # watermark 이하이거나 이미 읽은 알림은 다시 기록하지 않음
+        new_read_ids = {
+            notification_id
+            for notification_id in notification_ids
+            if notification_id > watermark_id
+        } - await self._get_read_ids_after(watermark_id)
+        if not new_read_ids:
+            return await self.get_unread_notification_count()
+
+        # 사용자에게 보이는 알림만 읽음 처리 (잘못된 ID 로 watermark 가 앞서 나가지 않도록)
+        visible_ids = await Notification.filter(
+            self._visible_query(), id__in=list(new_read_ids)
+        ).values_list("id", flat=True)
+        if not visible_ids:
+            return await self.get_unread_notification_count()
+        async with in_transaction():
+            # 사용자별 watermark 행 잠금으로 같은 사용자의 읽음 처리를 순서대로 실행
+            # (동시 요청이 같은 알림을 각각 새로 읽은 것으로 세지 않도록)
+            await NotificationReadWatermark.get_or_create(user=self.user)
+            await (
+                NotificationReadWatermark.filter(user=self.user)
+                .select_for_update()
+                .first()
+            )
+            inserted_ids = set(visible_ids) - await self._get_read_ids_in(
+                list(visible_ids)
+            )
+            await NotificationRead.bulk_create(
+                [
+                    NotificationRead(user=self.user, notification_id=notification_id)
+                    for notification_id in inserted_ids
+                ],
+                # 잠금 밖에서 기록된 읽음은 유니크 키로 무시 (INSERT IGNORE)
+                ignore_conflicts=True,
+            )
+        if not inserted_ids:
+            return await self.get_unread_notification_count()
+        # 실제로 기록한 읽음 수만큼 감소 (카운터가 없거나 맞지 않을 때만 다시 계산)
+        unread_count = await decrement_unread_count(self.user.id, len(inserted_ids))
+        await publish_notifications_read(self.user.id, len(inserted_ids))
+        await self.compact_read_state()
+        if unread_count is None:
+            unread_count = await self.get_unread_notification_count()
+        return unread_count
+
+    async def mark_notifications_as_read_up_to(self, notification_id: int) -> int:
+        """
+        notification_id 이하의 알림을 모두 읽음 처리 (watermark 를 한 번에 갱신)
+        :return: 읽음 처리 후 읽지 않은 알림 수
+        """
+        # 아직 생성되지 않은 알림까지 읽음 처리되지 않도록 최신 알림 ID 로 제한
+        read_up_to_id = min(notification_id, await self.get_latest_notification_id())
+        previous_unread_count = await get_cached_unread_count(self.user.id)
+        async with in_transaction():
+            await NotificationReadWatermark.get_or_create(user=self.user)
+            advanced = await NotificationReadWatermark.filter(
+                user=self.user, last_read_notification_id__lt=read_up_to_id
+            ).update(last_read_notification_id=read_up_to_id)
+            if advanced:
+                await NotificationRead.filter(
+                    user=self.user, notification_id__lte=read_up_to_id
+                ).delete()
+        if not advanced:
+            return await self.get_unread_notification_count()
+
+        # 남은 읽지 않은 알림은 watermark 이후 범위만 다시 count
+        await self.compact_read_state()
+        unread_count = await rebuild_unread_count(
+            self.user.id, self._count_unread_from_db
+        )
+        if previous_unread_count is not None:
+            await publish_notifications_read(
+                self.user.id, previous_unread_count - unread_count
+            )
+        return unread_count
+
+    async def _get_read_ids_in(self, notification_ids: List[int]) -> Set[int]:
+        """주어진 알림 중 읽음 기록이 있는 알림 ID"""
+        if not notification_ids:
+            return set()
+        return set(
+            await NotificationRead.filter(
+                user=self.user, notification_id__in=notification_ids
+            ).values_list("notification_id", flat=True)
+        )
 
     async def get_user_notifications(
-        self, page: int = 1, page_size: int = 10
+        self, page: int = 1, page_size: int = 10, cursor: Optional[str] = None
     ) -> NotificationListDto:
-        # 페이징 계산
-        offset = (page - 1) * page_size
-        limit = page_size
-
-        # 총 페이지 수 계산
-        total_notifications = await Notification.filter(
-            Q(target_user=self.user) | Q(is_global=True)
-        ).count()
-        total_pages = (total_notifications + page_size - 1) // page_size
-
-        notifications_query = (
-            Notification.filter(Q(target_user=self.user) | Q(is_global=True))
-            .offset(offset)
-            .limit(limit)
-            .order_by("-id")
-        )
+        """
+        알림 목록 조회
+        cursor 를 전달하면 keyset 페이지네이션을 사용하고 전체 페이지 수(count)는 계산하지 않습니다.
+        """
+        streams = self._notification_streams()
+        # 각 스트림에서 현재 페이지까지만 가져와 병합 (offset 모드는 앞 페이지 포함)
+        offset = 0 if cursor else (page - 1) * page_size
+        stream_queries = [
+            paginate_by_id(stream, page_size=offset + page_size, cursor=cursor)
+            for stream in streams
+        ]
+        watermark_id = await self._get_watermark_id()
 
-        read_notifications_ids = {
-            nr.notification_id for nr in await NotificationRead.filter(user=self.user)
-        }
+        total_pages: Optional[int] = None
+        if cursor:
+            stream_rows = await gather_queries(*stream_queries)
+        else:
+            # 페이지 조회와 총 개수 계산을 동시에 실행
+            *stream_rows, personal_count, global_count = await gather_queries(
+                *stream_queries, *(stream.count() for stream in streams)
+            )
+            total_pages = (personal_count + global_count + page_size - 1) // page_size
+        notifications = self._merge_streams(stream_rows, offset, page_size)
+        self.next_cursor = get_next_cursor(notifications, page_size)
 
-        notifications = await notifications_query
+        notification_list = await self._build_notification_dtos(
+            notifications, watermark_id
+        )
+        return NotificationListDto(
+            notifications=notification_list, total_pages=total_pages
+        )
 
-        notification_list = [
+    async def _build_notification_dtos(
+        self, notifications: List[Notification], watermark_id: int
+    ) -> List[NotificationDto]:
+        # 읽음 여부는 주어진 알림 중 watermark 이후 알림만 확인
+        read_notifications_ids = await self._get_read_ids_in(
+            [
+                notification.id
+                for notification in notifications
+                if notification.id > watermark_id
+            ]
+        )
+        return [
             NotificationDto(
                 id=notification.id,
                 created_at=notification.created_at.strftime(
@@ -71,24 +316,59 @@ class NotificationService:
                 related_id=notification.related_id,
                 message=notification.message,
                 is_global=notification.is_global,
-                is_read=notification.id in read_notifications_ids,
+                is_read=notification.id <= watermark_id
+                or notification.id in read_notifications_ids,
             )
             for notification in notifications
         ]
-        return NotificationListDto(
-            notifications=notification_list, total_pages=total_pages
+
+    async def get_latest_notification_id(self) -> int:
+        """사용자에게 보이는 가장 최근 알림 ID (없으면 0)"""
+        latest_ids = await gather_queries(
+            *(
+                stream.order_by("-id").limit(1).values_list("id", flat=True)
+                for stream in self._notification_streams()
+            )
+        )
+        return max((ids[0] for ids in latest_ids if ids), default=0)
+
+    async def get_notifications_after(
+        self, notification_id: int, limit: int
+    ) -> List[NotificationDto]:
+        """notification_id 이후 생성된 알림 (오래된 순, 최대 limit 개)"""
+        stream_rows = await gather_queries(
+            *(
+                stream.filter(id__gt=notification_id).order_by("id").limit(limit)
+                for stream in self._notification_streams()
+            )
+        )
+        notifications = self._merge_streams(
+            stream_rows, offset=0, limit=limit, descending=False
+        )
+        if not notifications:
+            return []
+        return await self._build_notification_dtos(
+            notifications, await self._get_watermark_id()
         )
 
     async def get_unread_notification_count(self) -> int:
-        # Get IDs of notifications that the user has read
-        read_notification_ids = await NotificationRead.filter(
-            user=self.user
-        ).values_list("notification_id", flat=True)
-
-        # Count notifications that are either targeted to the user or global, and not in the read list
-        unread_count = await Notification.filter(
-            (Q(target_user=self.user) | Q(is_global=True))
-            & ~Q(id__in=read_notification_ids)
-        ).count()
-
-        return unread_count or 0
+        """Redis 카운터로 응답하고, 카운터가 없으면 DB 기준으로 다시 계산"""
+        unread_count = await get_cached_unread_count(self.user.id)
+        if unread_count is not None:
+            return unread_count
+        return await rebuild_unread_count(self.user.id, self._count_unread_from_db)
+
+    async def _count_unread_from_db(self) -> int:
+        # watermark 이후 알림 중 먼저 읽은 알림(압축 후 남은 소수)만 제외하고 범위 count
+        watermark_id = await self._get_watermark_id()
+        read_ids = await self._get_read_ids_after(watermark_id)
+        unread_counts = await gather_queries(
+            *(
+                stream.filter(id__gt=watermark_id)
+                .exclude(id__in=list(read_ids))
+                .count()
+                for stream in self._notification_streams()
+            )
+        )
+
+        return sum(unread_counts)
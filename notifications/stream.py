@@ -0,0 +1,91 @@
+import asyncio
+import json
+import time
+from os import getenv
+from typing import Any, AsyncIterator
+
+from notifications.pubsub import (
+    EVENT_NOTIFICATION_CREATED,
+    EVENT_NOTIFICATION_READ,
+    EVENT_NOTIFICATION_RESYNC,
+    NotificationBroker,
+    notification_broker,
+)
+from notifications.service import NotificationService
+from users.models import User
+
+# 이벤트가 없을 때 연결 유지를 위해 보내는 주석 간격(초)
+NOTIFICATION_STREAM_HEARTBEAT = float(getenv("NOTIFICATION_STREAM_HEARTBEAT", 15))
+# 연결 최대 유지 시간(초), 이후 클라이언트가 재연결하며 인증을 다시 확인
+NOTIFICATION_STREAM_MAX_DURATION = float(
+    getenv("NOTIFICATION_STREAM_MAX_DURATION", 60 * 30)
+)
+# 생성 이벤트 한 번에 전달하는 최대 알림 수
+NOTIFICATION_STREAM_MAX_ITEMS = int(getenv("NOTIFICATION_STREAM_MAX_ITEMS", 20))
+# 연결이 끊긴 뒤 클라이언트(EventSource)의 재연결 대기 시간(ms)
+NOTIFICATION_STREAM_RETRY_MS = 3000
+
+# 클라이언트에 보내는 SSE 이벤트
+SSE_EVENT_NOTIFICATION = "notification"
+SSE_EVENT_UNREAD_COUNT = "unread_count"
+SSE_EVENT_UNREAD_COUNT_DELTA = "unread_count_delta"
+SSE_HEARTBEAT = ": heartbeat\n\n"
+
+
+def format_sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def notification_event_stream(
+    user: User, broker: NotificationBroker = notification_broker
+) -> AsyncIterator[str]:
+    """
+    알림 SSE 스트림
+    연결 시 읽지 않은 알림 수를 보내고, 이후 새 알림과 알림 수 변화량을 전달합니다.
+    """
+    service = NotificationService(user)
+    queue = await broker.connect(user.id)
+    try:
+        last_notification_id = await service.get_latest_notification_id()
+        yield f"retry: {NOTIFICATION_STREAM_RETRY_MS}\n" + format_sse(
+            SSE_EVENT_UNREAD_COUNT,
+            {"count": await service.get_unread_notification_count()},
+        )
+
+        deadline = time.monotonic() + NOTIFICATION_STREAM_MAX_DURATION
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), min(NOTIFICATION_STREAM_HEARTBEAT, remaining)
+                )
+            except asyncio.TimeoutError:
+                yield SSE_HEARTBEAT
+                continue
+
+            if event["event"] == EVENT_NOTIFICATION_READ:
+                yield format_sse(
+                    SSE_EVENT_UNREAD_COUNT_DELTA, {"delta": -event["count"]}
+                )
+                continue
+
+            # 마지막으로 보낸 알림 이후만 조회 (여러 생성 이벤트가 쌓여도 한 번에 전달)
+            notifications = await service.get_notifications_after(
+                last_notification_id, NOTIFICATION_STREAM_MAX_ITEMS
+            )
+            for notification in notifications:
+                yield format_sse(SSE_EVENT_NOTIFICATION, notification.model_dump())
+            if notifications:
+                last_notification_id = notifications[-1].id
+
+            if event["event"] == EVENT_NOTIFICATION_CREATED:
+                yield format_sse(
+                    SSE_EVENT_UNREAD_COUNT_DELTA, {"delta": event["count"]}
+                )
+            elif event["event"] == EVENT_NOTIFICATION_RESYNC:
+                # 버려진 이벤트가 있으므로 알림 수를 다시 보냄
+                yield format_sse(
+                    SSE_EVENT_UNREAD_COUNT,
+                    {"count": await service.get_unread_notification_count()},
+                )
+    finally:
+        await broker.disconnect(user.id, queue)
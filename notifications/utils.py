@@ -0,0 +1,140 @@
+import asyncio
+from datetime import datetime, timedelta, UTC
+from os import getenv
+from typing import Set
+
+from tortoise.transactions import in_transaction
+
+from common.config import logger
+from notifications.cache import invalidate_unread_counts
+from notifications.models import (
+    Notification,
+    NotificationArchive,
+    NotificationArchiveRun,
+    NotificationRead,
+)
+from notifications.service import NotificationService
+from users.models import User
+
+# 이 기간(일)이 지난 알림은 notifications_archive 로 이동
+NOTIFICATION_RETENTION_DAYS = int(getenv("NOTIFICATION_RETENTION_DAYS", 180))
+# 한 트랜잭션에서 옮길 알림 수
+NOTIFICATION_ARCHIVE_BATCH_SIZE = int(getenv("NOTIFICATION_ARCHIVE_BATCH_SIZE", 1000))
+# 한 번 실행에서 처리할 최대 배치 수 (남은 알림은 다음 실행에서 처리)
+NOTIFICATION_ARCHIVE_MAX_BATCHES = int(getenv("NOTIFICATION_ARCHIVE_MAX_BATCHES", 100))
+# 배치 사이 대기 시간(초)
+NOTIFICATION_ARCHIVE_BATCH_PAUSE = float(
+    getenv("NOTIFICATION_ARCHIVE_BATCH_PAUSE", 0.1)
+)
+# 읽음 기록 압축 시 한 번에 조회할 사용자 수
+NOTIFICATION_READ_COMPACT_BATCH_SIZE = int(
+    getenv("NOTIFICATION_READ_COMPACT_BATCH_SIZE", 500)
+)
+
+
+async def compact_notification_reads(
+    batch_size: int = NOTIFICATION_READ_COMPACT_BATCH_SIZE,
+) -> int:
+    """
+    읽음 기록이 남아 있는 사용자의 watermark 를 갱신하고 기록을 압축합니다.
+    기존 notifications_read 데이터를 watermark 방식으로 옮기는 작업도 겸합니다.
+    사용자 ID 순으로 batch_size 명씩 나누어 처리합니다.
+    :return: 처리한 사용자 수
+    """
+    compacted_count = 0
+    last_user_id = 0
+    while True:
+        user_ids = (
+            await NotificationRead.filter(user_id__gt=last_user_id)
+            .distinct()
+            .order_by("user_id")
+            .limit(batch_size)
+            .values_list("user_id", flat=True)
+        )
+        if not user_ids:
+            break
+        last_user_id = user_ids[-1]
+
+        for user in await User.filter(id__in=list(user_ids)):
+            await NotificationService(user).compact_read_state()
+            compacted_count += 1
+        # 다른 요청이 잠금을 얻을 수 있도록 배치 사이에 양보
+        await asyncio.sleep(NOTIFICATION_ARCHIVE_BATCH_PAUSE)
+
+    if compacted_count:
+        logger.info(f"[Notification] compacted read state of {compacted_count} users")
+    return compacted_count
+
+
+async def archive_old_notifications(
+    retention_days: int = NOTIFICATION_RETENTION_DAYS,
+    batch_size: int = NOTIFICATION_ARCHIVE_BATCH_SIZE,
+    max_batches: int = NOTIFICATION_ARCHIVE_MAX_BATCHES,
+) -> NotificationArchiveRun:
+    """
+    보관 기간이 지난 알림을 notifications_archive 로 옮기고 읽음 기록은 삭제합니다.
+    잠금 시간을 줄이기 위해 batch_size 건씩 짧은 트랜잭션으로 나누어 처리합니다.
+    :return: 실행 기록 (관리자 리포트)
+    """
+    run = await NotificationArchiveRun.create(
+        cutoff_at=datetime.now(UTC) - timedelta(days=retention_days)
+    )
+    affected_user_ids: Set[int] = set()
+    try:
+        for _ in range(max_batches):
+            notifications = (
+                await Notification.filter(created_at__lt=run.cutoff_at)
+                .order_by("created_at")
+                .limit(batch_size)
+            )
+            if not notifications:
+                break
+            notification_ids = [notification.id for notification in notifications]
+            async with in_transaction():
+                # 이전 실행이 중간에 실패했어도 다시 옮길 수 있도록 중복은 무시
+                await NotificationArchive.bulk_create(
+                    [
+                        NotificationArchive(
+                            id=notification.id,
+                            created_at=notification.created_at,
+                            updated_at=notification.updated_at,
+                            type=notification.type,
+                            classification=notification.classification,
+                            related_id=notification.related_id,
+                            message=notification.message,
+                            is_global=notification.is_global,
+                            target_user_id=notification.target_user_id,
+                        )
+                        for notification in notifications
+                    ],
+                    ignore_conflicts=True,
+                )
+                run.deleted_read_count += await NotificationRead.filter(
+                    notification_id__in=notification_ids
+                ).delete()
+                run.archived_count += await Notification.filter(
+                    id__in=notification_ids
+                ).delete()
+            run.batch_count += 1
+            affected_user_ids.update(
+                notification.target_user_id
+                for notification in notifications
+                if notification.target_user_id
+            )
+            # 다른 요청이 잠금을 얻을 수 있도록 배치 사이에 양보
+            await asyncio.sleep(NOTIFICATION_ARCHIVE_BATCH_PAUSE)
+    except Exception as e:
+        run.error = str(e)
+        logger.error(f"[Notification] archive error, run_id:{run.id}, msg:{e}")
+    finally:
+        # 보관된 읽지 않은 알림이 카운터에 남지 않도록 다시 계산
+        # (전체 알림 카운터는 DURATION_NOTIFICATION_UNREAD 이후 다시 계산됨)
+        await invalidate_unread_counts(affected_user_ids)
+        run.finished_at = datetime.now(UTC)
+        await run.save()
+
+    logger.info(
+        f"[Notification] archived {run.archived_count} notifications "
+        f"({run.deleted_read_count} read markers) in {run.batch_count} batches"
+    )
+    return run
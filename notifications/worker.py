@@ -0,0 +1,40 @@
+"""
+알림 outbox 워커 (앱 프로세스와 분리해서 실행할 때 사용)
+
+    NOTIFICATION_OUTBOX_IN_APP=false  # 앱 프로세스의 스케줄러 작업 비활성화
+    python -m notifications.worker
+"""
+import asyncio
+
+from tortoise import Tortoise
+
+from common.cache_utils import close_redis, init_redis
+from common.config import TORTOISE_ORM, close_log_handlers, logger
+from notifications.outbox import (
+    NOTIFICATION_OUTBOX_POLL_INTERVAL,
+    process_notification_outbox,
+)
+
+
+async def run_worker() -> None:
+    await Tortoise.init(config=TORTOISE_ORM, timezone="Asia/Seoul")
+    await init_redis()
+    logger.info("[Notification Outbox] worker started")
+    try:
+        while True:
+            try:
+                created_count = await process_notification_outbox()
+            except Exception as e:
+                logger.error(f"[Notification Outbox] worker error, msg:{e}")
+                created_count = 0
+            # 처리할 이벤트가 남아 있을 수 있으므로 생성한 알림이 있으면 바로 다시 확인
+            if not created_count:
+                await asyncio.sleep(NOTIFICATION_OUTBOX_POLL_INTERVAL)
+    finally:
+        await close_redis()
+        await Tortoise.close_connections()
+        close_log_handlers()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from common.cache_constants import (
+    CACHE_KEY_PARTY_CARD,
+    CACHE_KEY_PARTY_DETAIL,
+    CACHE_KEY_PARTY_DETAIL_VERSION,
+    CACHE_KEY_PARTY_LIST_PAGE,
+    CACHE_KEY_PARTY_LIST_VERSION,
+    DURATION_PARTY_CARD,
+    DURATION_PARTY_DETAIL,
+    DURATION_PARTY_DETAIL_STALE,
+    DURATION_PARTY_DETAIL_VERSION,
+    DURATION_PARTY_LIST_PAGE,
+    DURATION_PARTY_LIST_PAGE_STALE,
+)
+from common.cache_utils import (
+    RedisManager,
+    StaleWhileRevalidateCache,
+    get_cache_stats,
+)
+from common.config import logger
+from parties.dtos import PartyDetail, PartyListDetail
+
+party_detail_cache: StaleWhileRevalidateCache[PartyDetail] = StaleWhileRevalidateCache(
+    "party_detail",
+    fresh_ttl=DURATION_PARTY_DETAIL,
+    stale_ttl=DURATION_PARTY_DETAIL_STALE,
+    dumps=PartyDetail.model_dump,
+    loads=PartyDetail.model_validate,
+)
+party_detail_cache_stats = party_detail_cache.stats
+
+
+class PartyListPage(NamedTuple):
+    """목록 한 페이지 (조회자와 무관한 파티 ID 와 다음 페이지 커서)"""
+
+    party_ids: List[int]
+    next_cursor: Optional[str]
+
+
+party_list_cache: StaleWhileRevalidateCache[PartyListPage] = StaleWhileRevalidateCache(
+    "party_list",
+    fresh_ttl=DURATION_PARTY_LIST_PAGE,
+    stale_ttl=DURATION_PARTY_LIST_PAGE_STALE,
+    dumps=PartyListPage._asdict,
+    loads=lambda cached: PartyListPage(**cached),
+)
+party_card_cache_stats = get_cache_stats("party_card")
+
+
+async def get_party_detail(
+    party_id: int, load: Callable[[], Awaitable[PartyDetail]]
+) -> PartyDetail:
+    """
+    파티 상세 정보(조회자와 무관한 부분)를 캐시에서 읽고, 없으면 load 로 한 번만 불러옵니다.
+    fresh 기간이 지난 정보는 그대로 응답하고 백그라운드에서 갱신합니다.
+    """
+    return await party_detail_cache.get(
+        CACHE_KEY_PARTY_DETAIL.format(party_id=party_id), load
+    )
+
+
+async def get_cached_party_detail(party_id: int) -> Optional[PartyDetail]:
+    """캐시된 파티 상세 정보 (갱신 시점이 지났어도 반환), 없으면 None"""
+    entry = await party_detail_cache.get_entry(
+        CACHE_KEY_PARTY_DETAIL.format(party_id=party_id)
+    )
+    return entry[0] if entry else None
+
+
+async def get_party_detail_version(
+    party_id: int, party_exists: Callable[[], Awaitable[bool]]
+) -> Optional[str]:
+    """
+    상세 정보 ETag 에 쓰는 버전 (상세 캐시와 함께 삭제되고, 다음 조회 시 새로 만들어짐)
+    Redis 초기화 후에도 이전 버전과 겹치지 않도록 생성 시각을 값으로 사용합니다.
+    버전이 없을 때는 party_exists 로 파티가 있는지 확인한 뒤에만 만듭니다.
+    :return: 버전, 파티가 없거나 Redis 오류면 None
+    """
+    key = CACHE_KEY_PARTY_DETAIL_VERSION.format(party_id=party_id)
+    try:
+        client = RedisManager().client
+        version = await client.get(key)
+        if version is None:
+            if not await party_exists():
+                return None
+            pipe = RedisManager().pipeline()
+            pipe.set(key, time.time_ns(), nx=True, ex=DURATION_PARTY_DETAIL_VERSION)
+            pipe.get(key)
+            _, version = await pipe.execute()
+    except Exception as e:
+        logger.error(
+            f"[Party Detail Cache] version error, party_id:{party_id}, msg:{e}"
+        )
+        return None
+    return version.decode() if version is not None else None
+
+
+async def get_party_list_page(
+    params: Dict[str, Any], load: Callable[[], Awaitable[PartyListPage]]
+) -> PartyListPage:
+    """
+    조건별 목록 페이지를 캐시에서 읽고, 없으면 load 로 한 번만 불러옵니다.
+    파티 생성/수정/마감/삭제 시 버전이 올라가 이전 버전의 페이지는 사용하지 않습니다.
+    """
+    try:
+        version = int(
+            await RedisManager().client.get(CACHE_KEY_PARTY_LIST_VERSION) or 0
+        )
+    except Exception as e:
+        logger.error(f"[Party List Cache] version error, msg:{e}")
+        return await load()
+    params_hash = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return await party_list_cache.get(
+        CACHE_KEY_PARTY_LIST_PAGE.format(version=version, params=params_hash), load
+    )
+
+
+async def invalidate_party_list_pages() -> None:
+    """목록 페이지 캐시 버전을 올려 이전 페이지를 사용하지 않도록 합니다."""
+    try:
+        await RedisManager().client.incr(CACHE_KEY_PARTY_LIST_VERSION)
+    except Exception as e:
+        logger.error(f"[Party List Cache] invalidate error, msg:{e}")
+
+
+async def get_cached_party_cards(
+    party_ids: Iterable[int],
+) -> Dict[int, PartyListDetail]:
+    """
+    목록용 파티 카드(조회자와 무관한 부분)를 MGET 한 번으로 조회합니다.
+    :return: 캐시된 카드 (없는 파티는 제외, Redis 오류 시 빈 dict)
+    """
+    party_ids = list(party_ids)
+    if not party_ids:
+        return {}
+    try:
+        values = await RedisManager().client.mget(
+            [CACHE_KEY_PARTY_CARD.format(party_id=party_id) for party_id in party_ids]
+        )
+    except Exception as e:
+        logger.error(f"[Party Card Cache] get error, msg:{e}")
+        values = [None] * len(party_ids)
+
+    cards = {}
+    for party_id, value in zip(party_ids, values):
+        if value is None:
+            party_card_cache_stats.miss()
+            continue
+        party_card_cache_stats.hit()
+        cards[party_id] = PartyListDetail.model_validate_json(value)
+    return cards
+
+
+async def set_cached_party_cards(cards: Iterable[PartyListDetail]) -> None:
+    """파티 카드를 한 번의 왕복(pipeline)으로 저장"""
+    try:
+        pipe = RedisManager().pipeline()
+        for card in cards:
+            # pydantic-core(Rust) 직렬화로 공백 없는 UTF-8 JSON 을 바로 만듦
+            # (조회는 model_validate_json 으로 dict 변환 없이 검증)
+            pipe.set(
+                CACHE_KEY_PARTY_CARD.format(party_id=card.id),
+                card.model_dump_json(),
+                ex=DURATION_PARTY_CARD,
+            )
+        if len(pipe):
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"[Party Card Cache] set error, msg:{e}")
+
+
+async def invalidate_party_detail(*party_ids: int) -> None:
+    """
+    파티 정보, 참가 상태가 바뀐 파티의 상세/카드 캐시와 상세 ETag 버전 삭제
+    상세 캐시는 세대도 올려, 삭제 전에 시작한 로드가 이전 정보를 다시 저장하지 않도록 합니다.
+    """
+    if not party_ids:
+        return
+    try:
+        pipe = RedisManager().pipeline()
+        for party_id in party_ids:
+            party_detail_cache.add_invalidation(
+                pipe, CACHE_KEY_PARTY_DETAIL.format(party_id=party_id)
+            )
+            pipe.delete(
+                CACHE_KEY_PARTY_CARD.format(party_id=party_id),
+                CACHE_KEY_PARTY_DETAIL_VERSION.format(party_id=party_id),
+            )
+        await pipe.execute()
+    except Exception as e:
+        logger.error(
+            f"[Party Detail Cache] invalidate error, party_ids:{party_ids}, msg:{e}"
+        )
@@ -0,0 +1,111 @@
+import math
+from typing import List, Tuple
+
+# 파티 좌표를 저장하는 geohash 길이 (약 4.8m x 4.8m 셀)
+GEOHASH_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0088
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# geohash 문자보다 큰 문자 (prefix 범위 조회의 상한)
+GEOHASH_PREFIX_UPPER_BOUND = "~"
+
+
+def encode_geohash(
+    latitude: float, longitude: float, precision: int = GEOHASH_PRECISION
+) -> str:
+    """위도/경도를 geohash 로 변환 (prefix 가 같으면 같은 셀 안의 좌표)"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars: List[str] = []
+    bits = 0
+    bit_count = 0
+    is_longitude_bit = True
+    while len(chars) < precision:
+        coordinate_range, value = (
+            (lng_range, longitude) if is_longitude_bit else (lat_range, latitude)
+        )
+        mid = (coordinate_range[0] + coordinate_range[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            coordinate_range[0] = mid
+        else:
+            coordinate_range[1] = mid
+        is_longitude_bit = not is_longitude_bit
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def _geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """geohash 셀의 (위도, 경도) 크기(도)"""
+    total_bits = precision * 5
+    lat_bits = total_bits // 2
+    lng_bits = total_bits - lat_bits
+    return 180.0 / 2**lat_bits, 360.0 / 2**lng_bits
+
+
+def bounding_box_deltas(latitude: float, radius_km: float) -> Tuple[float, float]:
+    """중심에서 반경을 포함하는 사각형까지의 (위도, 경도) 차이(도)"""
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    # 극지방에서 경도 차이가 무한히 커지지 않도록 제한
+    lng_delta = min(
+        lat_delta / max(math.cos(math.radians(latitude)), 0.01),
+        180.0,
+    )
+    return lat_delta, lng_delta
+
+
+def geohash_cover(latitude: float, longitude: float, radius_km: float) -> List[str]:
+    """
+    반경을 포함하는 사각형을 덮는 geohash prefix 목록
+    셀 크기가 사각형의 절반 이상인 가장 긴 prefix 를 골라, 중심 셀과 주변 8개 셀을 반환합니다.
+    """
+    lat_delta, lng_delta = bounding_box_deltas(latitude, radius_km)
+    precision = 1
+    for candidate in range(GEOHASH_PRECISION, 0, -1):
+        lat_size, lng_size = _geohash_cell_size(candidate)
+        if lat_size >= lat_delta and lng_size >= lng_delta:
+            precision = candidate
+            break
+    lat_size, lng_size = _geohash_cell_size(precision)
+
+    cells = set()
+    for lat_step in (-1, 0, 1):
+        cell_latitude = min(max(latitude + lat_step * lat_size, -90.0), 89.999999)
+        for lng_step in (-1, 0, 1):
+            cell_longitude = (longitude + lng_step * lng_size + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(cell_latitude, cell_longitude, precision))
+    return sorted(cells)
+
+
+def haversine_km(
+    latitude: float, longitude: float, other_latitude: float, other_longitude: float
+) -> float:
+    """두 좌표 사이의 대원 거리(km)"""
+    lat1, lng1, lat2, lng2 = map(
+        math.radians, (latitude, longitude, other_latitude, other_longitude)
+    )
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a), 1.0))
+
+
+def haversine_order_sql(latitude: float, longitude: float) -> str:
+    """
+    중심까지의 거리 순서를 주는 SQL 식 (haversine 의 a 값, 거리와 단조 증가)
+    후보 수 제한을 적용하기 전에 DB 에서 가까운 파티부터 정렬하는 데 사용합니다.
+    """
+    latitude, longitude = float(latitude), float(longitude)
+    lat_sin = f"SIN(RADIANS(latitude - ({latitude!r})) / 2)"
+    lng_sin = f"SIN(RADIANS(longitude - ({longitude!r})) / 2)"
+    lat_cos = math.cos(math.radians(latitude))
+    return (
+        f"{lat_sin} * {lat_sin}"
+        f" + {lat_cos!r} * COS(RADIANS(latitude)) * {lng_sin} * {lng_sin}"
+    )
@@ -0,0 +1,287 @@
+"""
+종목, 날짜별 파티 목록 저장소 (Redis sorted set, score: gather_at)
+
+홈 화면의 종목 + 날짜 범위 조회를 SQL 없이 처리하기 위해
+파티 생성/수정/마감/삭제 시 (종목, 날짜) 키에 파티 ID 를 반영합니다.
+키가 없거나 불완전하면(ready 표시 없음) DB 기준으로 다시 만듭니다.
+
+    python -m parties.list_store  # 전체 다시 만들기
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+from os import getenv
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+from tortoise import Tortoise
+
+from common.cache_constants import (
+    CACHE_KEY_PARTY_LIST_DAY,
+    CACHE_KEY_PARTY_LIST_VERSION,
+    DURATION_PARTY_LIST_DAY,
+)
+from common.cache_utils import RedisManager, close_redis, get_cache_stats, init_redis
+from common.config import TIME_ZONE, TORTOISE_ORM, close_log_handlers, logger
+from parties.models import Party
+
+# 저장소로 처리하는 최대 날짜 범위(일), 더 길면 SQL 로 조회
+PARTY_LIST_STORE_MAX_DAYS = int(getenv("PARTY_LIST_STORE_MAX_DAYS", 31))
+PARTY_LIST_STORE_REBUILD_RETRIES = 3
+PARTY_LIST_STORE_REBUILD_BATCH_SIZE = 1000
+
+# 전체 파티 / 모집 중(is_active) 파티 목록
+SCOPE_ALL = "all"
+SCOPE_ACTIVE = "active"
+# DB 기준으로 만든 키에만 있는 멤버 (score 가 gather_at 범위 밖이라 조회되지 않음)
+READY_MEMBER = "ready"
+READY_SCORE = -1
+
+party_list_store_stats = get_cache_stats("party_list_store")
+
+
+class PartyListEntry(NamedTuple):
+    party_id: int
+    sport_id: Optional[int]
+    gather_at: Optional[datetime]
+    is_active: Optional[bool]
+
+    @classmethod
+    def from_party(cls, party: Party) -> "PartyListEntry":
+        return cls(party.id, party.sport_id, party.gather_at, party.is_active)
+
+
+def _local_date(gather_at: datetime) -> date:
+    return gather_at.astimezone(ZoneInfo(TIME_ZONE)).date()
+
+
+def _key(scope: str, sport_id: int, day: date) -> str:
+    return CACHE_KEY_PARTY_LIST_DAY.format(
+        scope=scope, sport_id=sport_id, day=day.isoformat()
+    )
+
+
+def _entry_keys(entry: PartyListEntry) -> List[str]:
+    """파티가 들어가는 키 목록 (종목이나 모임 날짜가 없으면 없음)"""
+    if entry.sport_id is None or entry.gather_at is None:
+        return []
+    day = _local_date(entry.gather_at)
+    keys = [_key(SCOPE_ALL, entry.sport_id, day)]
+    if entry.is_active:
+        keys.append(_key(SCOPE_ACTIVE, entry.sport_id, day))
+    return keys
+
+
+def _add_entries(
+    pipe: Pipeline,  # type: ignore[type-arg]
+    entries: Iterable[PartyListEntry],
+) -> None:
+    for entry in entries:
+        for key in _entry_keys(entry):
+            pipe.zadd(key, {str(entry.party_id): entry.gather_at.timestamp()})
+
+
+def _mark_ready(
+    pipe: Pipeline,  # type: ignore[type-arg]
+    keys: Iterable[str],
+) -> None:
+    # 만료되면 변경 반영으로 ready 표시 없는 키가 생기고, 조회 시 다시 만들어짐
+    for key in keys:
+        pipe.zadd(key, {READY_MEMBER: READY_SCORE})
+        pipe.expire(key, DURATION_PARTY_LIST_DAY)
+
+
+async def update_party_list_store(
+    removed: Iterable[PartyListEntry] = (), added: Iterable[PartyListEntry] = ()
+) -> None:
+    """
+    변경 전 항목을 빼고 변경 후 항목을 넣습니다. (DB 커밋 이후 호출)
+    키가 없으면 ready 표시 없는 키가 생기지만, 조회 시 DB 기준으로 다시 만듭니다.
+    목록 페이지 캐시 버전도 함께 올려 이전 페이지를 사용하지 않도록 합니다.
+    """
+    pipe = RedisManager().pipeline()
+    for entry in removed:
+        if entry.sport_id is None or entry.gather_at is None:
+            continue
+        day = _local_date(entry.gather_at)
+        for scope in (SCOPE_ALL, SCOPE_ACTIVE):
+            pipe.zrem(_key(scope, entry.sport_id, day), entry.party_id)
+    _add_entries(pipe, added)
+    if not len(pipe):
+        return
+    pipe.incr(CACHE_KEY_PARTY_LIST_VERSION)
+    try:
+        await pipe.execute()
+    except Exception as e:
+        logger.error(f"[Party List Store] update error, msg:{e}")
+
+
+async def _rebuild_days(
+    sport_ids: Set[int], days: List[date]
+) -> Optional[List[PartyListEntry]]:
+    """
+    (종목, 날짜) 키를 DB 기준으로 다시 만듭니다.
+    계산 중 파티가 변경되면(WATCH 키 변경) 다시 계산합니다.
+    :return: 해당 종목, 날짜의 파티 목록, 저장하지 못하면 None
+    """
+    keys = [
+        _key(scope, sport_id, day)
+        for scope in (SCOPE_ALL, SCOPE_ACTIVE)
+        for sport_id in sport_ids
+        for day in days
+    ]
+    local_tz = ZoneInfo(TIME_ZONE)
+    gather_at_min = datetime.combine(min(days), datetime.min.time(), local_tz)
+    gather_at_max = datetime.combine(
+        max(days) + timedelta(days=1), datetime.min.time(), local_tz
+    )
+    requested_days = set(days)
+    for _ in range(PARTY_LIST_STORE_REBUILD_RETRIES):
+        try:
+            async with RedisManager().pipeline(transaction=True) as pipe:
+                await pipe.watch(*keys)
+                rows = await Party.filter(
+                    sport_id__in=list(sport_ids),
+                    gather_at__gte=gather_at_min,
+                    gather_at__lt=gather_at_max,
+                ).values_list("id", "sport_id", "gather_at", "is_active")
+                entries = [
+                    entry
+                    for entry in map(PartyListEntry._make, rows)
+                    if _local_date(entry.gather_at) in requested_days
+                ]
+                pipe.multi()
+                pipe.delete(*keys)
+                _mark_ready(pipe, keys)
+                _add_entries(pipe, entries)
+                await pipe.execute()
+                return entries
+        except WatchError:
+            continue
+        except Exception as e:
+            logger.error(f"[Party List Store] rebuild error, msg:{e}")
+            break
+    return None
+
+
+async def get_party_ids_from_list_store(
+    sport_ids: Iterable[int],
+    gather_at_min: datetime,
+    gather_at_max: datetime,
+    active_only: bool = False,
+) -> Optional[List[int]]:
+    """
+    종목, 모임 시각 범위 [gather_at_min, gather_at_max) 의 파티 ID (ID 내림차순)
+    키가 없는 (종목, 날짜)는 DB 기준으로 다시 만듭니다.
+    :return: 파티 ID 목록, 저장소로 처리할 수 없으면 None (SQL 로 조회)
+    """
+    sport_ids = set(sport_ids)
+    first_day = _local_date(gather_at_min)
+    last_day = _local_date(gather_at_max - timedelta(microseconds=1))
+    day_count = (last_day - first_day).days + 1
+    if not sport_ids or not 0 < day_count <= PARTY_LIST_STORE_MAX_DAYS:
+        return None
+    days = [first_day + timedelta(days=offset) for offset in range(day_count)]
+    scope = SCOPE_ACTIVE if active_only else SCOPE_ALL
+    key_specs: List[Tuple[int, date]] = [
+        (sport_id, day) for sport_id in sport_ids for day in days
+    ]
+
+    min_score, max_score = gather_at_min.timestamp(), f"({gather_at_max.timestamp()}"
+    try:
+        pipe = RedisManager().pipeline()
+        for sport_id, day in key_specs:
+            key = _key(scope, sport_id, day)
+            pipe.zscore(key, READY_MEMBER)
+            pipe.zrangebyscore(key, min_score, max_score)
+        results = await pipe.execute()
+    except Exception as e:
+        logger.error(f"[Party List Store] get error, msg:{e}")
+        return None
+
+    party_ids: Set[int] = set()
+    cold_sport_ids: Set[int] = set()
+    cold_days: Dict[date, None] = {}
+    for (sport_id, day), ready, members in zip(key_specs, results[::2], results[1::2]):
+        if ready is None:
+            cold_sport_ids.add(sport_id)
+            cold_days[day] = None
+            continue
+        party_ids.update(int(member) for member in members)
+
+    if cold_sport_ids:
+        party_list_store_stats.miss()
+        entries = await _rebuild_days(cold_sport_ids, list(cold_days))
+        if entries is None:
+            return None
+        # 종목 x 날짜로 다시 만들어 이미 ready 였던 키가 섞여도 set 으로 합치므로 같은 결과
+        party_ids.update(
+            entry.party_id
+            for entry in entries
+            if gather_at_min <= entry.gather_at < gather_at_max
+            and (entry.is_active or not active_only)
+        )
+    else:
+        party_list_store_stats.hit()
+    return sorted(party_ids, reverse=True)
+
+
+async def rebuild_party_list_store(
+    batch_size: int = PARTY_LIST_STORE_REBUILD_BATCH_SIZE,
+) -> int:
+    """
+    저장소 전체를 지우고 DB 기준으로 다시 만듭니다.
+    파티가 없는 (종목, 날짜)는 조회할 때 만들어집니다.
+    :return: 저장한 파티 수
+    """
+    redis = RedisManager()
+    pattern = CACHE_KEY_PARTY_LIST_DAY.format(scope="*", sport_id="*", day="*")
+    stale_keys = [key async for key in redis.client.scan_iter(match=pattern)]
+    for index in range(0, len(stale_keys), batch_size):
+        await redis.delete_value(*stale_keys[index : index + batch_size])
+
+    stored_count = 0
+    last_id = 0
+    while True:
+        rows = (
+            await Party.filter(
+                id__gt=last_id, sport_id__isnull=False, gather_at__isnull=False
+            )
+            .order_by("id")
+            .limit(batch_size)
+            .values_list("id", "sport_id", "gather_at", "is_active")
+        )
+        if not rows:
+            break
+        entries = [PartyListEntry._make(row) for row in rows]
+        ready_keys = {
+            _key(scope, entry.sport_id, _local_date(entry.gather_at))
+            for entry in entries
+            for scope in (SCOPE_ALL, SCOPE_ACTIVE)
+        }
+        pipe = redis.pipeline(transaction=True)
+        _mark_ready(pipe, ready_keys)
+        _add_entries(pipe, entries)
+        await pipe.execute()
+        stored_count += len(entries)
+        last_id = entries[-1].party_id
+    await redis.client.incr(CACHE_KEY_PARTY_LIST_VERSION)
+    logger.info(f"[Party List Store] rebuilt, parties:{stored_count}")
+    return stored_count
+
+
+async def _run_rebuild() -> None:
+    await Tortoise.init(config=TORTOISE_ORM, timezone="Asia/Seoul")
+    await init_redis()
+    try:
+        await rebuild_party_list_store()
+    finally:
+        await close_redis()
+        await Tortoise.close_connections()
+        close_log_handlers()
+
+
+if __name__ == "__main__":
+    asyncio.run(_run_rebuild())
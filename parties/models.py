@@ -1,6 +1,9 @@
 from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
 from enum import IntEnum
+from typing import Iterable, Optional
 from common.models import BaseModel
+from parties.geo import encode_geohash
 
 
 class Party(BaseModel):
@@ -14,6 +17,12 @@ class Party(BaseModel):
     address = fields.CharField(null=True, blank=True, max_length=255)
     longitude = fields.FloatField(null=True, blank=True)
     latitude = fields.FloatField(null=True, blank=True)
+    geohash = fields.CharField(
+        max_length=12,
+        null=True,
+        index=True,
+        description="근처 파티 조회용 좌표 geohash",
+    )
     organizer_user = fields.ForeignKeyField(
         "models.User", related_name="parties", null=True, on_delete=fields.SET_NULL
     )
@@ -29,6 +38,9 @@ class Party(BaseModel):
         related_name="participated_parties",
         through="models.PartyParticipant",
     )
+    approved_count = fields.IntField(default=0, description="승인된 참가자 수")
+    pending_count = fields.IntField(default=0, description="승인 대기 참가자 수")
+    like_count = fields.IntField(default=0, description="좋아요 수")
 
     class Meta:
         table = "parties"
@@ -36,6 +48,25 @@ class Party(BaseModel):
     def __str__(self) -> str:
         return f"{self.id} - {self.title}"
 
+    async def save(
+        self,
+        using_db: Optional[BaseDBAsyncClient] = None,
+        update_fields: Optional[Iterable[str]] = None,
+        force_create: bool = False,
+        force_update: bool = False,
+    ) -> None:
+        # 좌표가 바뀌면 geohash 도 함께 저장
+        self.geohash = (
+            encode_geohash(self.latitude, self.longitude)
+            if self.latitude is not None and self.longitude is not None
+            else None
+        )
+        if update_fields is not None:
+            update_fields = list(update_fields)
+            if {"latitude", "longitude"} & set(update_fields):
+                update_fields.append("geohash")
+        await super().save(using_db, update_fields, force_create, force_update)
+
 
 class ParticipationStatus(IntEnum):
     PENDING = 0
@@ -44,6 +75,10 @@ class ParticipationStatus(IntEnum):
     CANCELLED = 3
 
 
+# 참가한 파티로 집계하는 참가 상태 (사용자 파티 통계)
+PARTICIPATED_STATUSES = (ParticipationStatus.APPROVED, ParticipationStatus.PENDING)
+
+
 class PartyParticipant(BaseModel):
     participant_user = fields.ForeignKeyField(
         "models.User", null=True, on_delete=fields.SET_NULL
@@ -60,7 +95,13 @@ class PartyParticipant(BaseModel):
 
     class Meta:
         table = "party_participants"
-        # unique_together = ("participant_user", "party")
+        unique_together = (("participant_user", "party"),)
+        indexes = (
+            ("party", "status"),
+            ("participant_user", "status"),
+            # 알림 outbox 가 파티원을 사용자 ID 순으로 배치 조회
+            ("party", "participant_user"),
+        )
 
     def __str__(self) -> str:
         return f"{self.id} - {self.party} - {self.participant_user} - {self.status}"
@@ -88,3 +129,4 @@ class PartyLike(BaseModel):
 
     class Meta:
         table = "party_likes"
+        unique_together = (("user", "party"),)
@@ -1,9 +1,14 @@
 from typing import List
 from typing import Optional, Any
 
-from fastapi import APIRouter, status, Depends, Request, HTTPException, Query
+from fastapi import APIRouter, status, Depends, Request, HTTPException, Query, Response
 
 from common.config import logger
+from common.constants import (
+    CACHE_CONTROL_PRIVATE_REVALIDATE,
+    CACHE_CONTROL_REFERENCE_DATA,
+    HEADER_NEXT_CURSOR,
+)
 from common.dependencies import get_current_user
 from common.logging_configs import LoggingAPIRoute
 from common.mixpanel_constants import (
@@ -20,7 +25,13 @@ from common.mixpanel_constants import (
     MIXPANEL_EVENT_CANCEL_LIKE_PARTY,
     MIXPANEL_EVENT_DELETE_PARTY,
 )
-from common.utils import convert_string_to_datetime, track_analytics
+from common.utils import (
+    build_etag,
+    convert_string_to_datetime,
+    get_not_modified_response,
+    get_table_version,
+    track_analytics,
+)
 from parties.dto.request import (
     PartyDetailRequest,
     RefreshTokenRequest,
@@ -43,8 +54,12 @@ from parties.services import (
     PartyListService,
     PartyCommentService,
     PartyLikeService,
+    PARTY_NEAR_DEFAULT_RADIUS_KM,
 )
 from parties.services import PartyParticipateService
+from parties.cache import get_party_detail_version
+from parties.list_store import PartyListEntry, update_party_list_store
+from users.cache import increment_party_statistics
 from users.models import User, Sport, SportName_Pydantic
 
 party_router = APIRouter(
@@ -58,8 +73,18 @@ party_router = APIRouter(
     response_model=List[SportName_Pydantic],
     status_code=status.HTTP_200_OK,
 )
-async def get_sports_list(request: Request) -> Any:
+async def get_sports_list(request: Request, response: Response) -> Any:
     try:
+        row_count, last_modified = await get_table_version(Sport.all())
+        not_modified = get_not_modified_response(
+            request,
+            response,
+            build_etag("sports", row_count, last_modified),
+            CACHE_CONTROL_REFERENCE_DATA,
+            last_modified,
+        )
+        if not_modified is not None:
+            return not_modified
         sports_list = await SportName_Pydantic.from_queryset(Sport.all())
     except Exception as e:
         logger.error(f"[LAMBDA LOG]: Error: {e}")
@@ -90,6 +115,8 @@ async def create_party(
             organizer_user=user,
             notice=request_data.notice,
         )
+        await increment_party_statistics(user.id, created=1)
+        await update_party_list_store(added=[PartyListEntry.from_party(party)])
 
         # analytics tracking
         await track_analytics(
@@ -231,11 +258,27 @@ async def organizer_change_participation_status(
     response_model=PartyDetail,
     status_code=status.HTTP_200_OK,
 )
-async def get_party_details(party_id: int, request: Request) -> PartyDetail:
+async def get_party_details(party_id: int, request: Request, response: Response) -> Any:
     try:
         user = request.state.user
-        service = await PartyDetailService.create(party_id)
-        party_details = await service.get_party_details(user)
+        # 버전을 먼저 읽어 응답보다 새로운 ETag 가 붙지 않도록 함
+        version = await get_party_detail_version(
+            party_id, lambda: Party.filter(id=party_id).exists()
+        )
+        not_modified = get_not_modified_response(
+            request,
+            response,
+            build_etag("party_detail", party_id, version, user.id if user else None)
+            if version is not None
+            else None,
+            CACHE_CONTROL_PRIVATE_REVALIDATE,
+            vary="Authorization",
+        )
+        if not_modified is not None:
+            return not_modified
+        party_details = await PartyDetailService.get_cached_party_details(
+            party_id, user
+        )
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return party_details
@@ -246,13 +289,23 @@ async def get_party_details(party_id: int, request: Request) -> PartyDetail:
 )
 async def get_party_list(
     request: Request,
+    response: Response,
     sport_id: Optional[List[int]] = Query(None),
     is_active: Optional[bool] = None,
     gather_date_min: Optional[str] = None,
     gather_date_max: Optional[str] = None,
     search_query: Optional[str] = None,
     page: int = 1,
+    cursor: Optional[str] = None,
+    near: Optional[str] = None,
+    radius_km: float = PARTY_NEAR_DEFAULT_RADIUS_KM,
 ) -> List[PartyListDetail]:
+    """
+    파티 리스트 api.
+    cursor 를 전달하면 page 대신 keyset 페이지네이션을 사용하며,
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환합니다.
+    near(위도,경도)를 전달하면 radius_km 반경 안의 파티를 가까운 순으로 반환합니다.
+    """
     user = request.state.user
     service = PartyListService(user)
     party_list = await service.get_party_list(
@@ -262,7 +315,12 @@ async def get_party_list(
         gather_date_max=gather_date_max,
         search_query=search_query,
         page=page,
+        cursor=cursor,
+        near=near,
+        radius_km=radius_km,
     )
+    if service.next_cursor:
+        response.headers[HEADER_NEXT_CURSOR] = service.next_cursor
     return party_list
 
 
@@ -272,11 +330,28 @@ async def get_party_list(
     status_code=status.HTTP_200_OK,
 )
 async def get_party_comments(
-    request: Request, party_id: int
-) -> List[PartyCommentDetail]:
+    request: Request, response: Response, party_id: int
+) -> Any:
     user = request.state.user
     try:
         service = PartyCommentService(party_id, user)
+        comment_count, last_modified = await service.get_comments_version()
+        not_modified = get_not_modified_response(
+            request,
+            response,
+            build_etag(
+                "party_comments",
+                party_id,
+                comment_count,
+                last_modified,
+                user.id if user else None,
+            ),
+            CACHE_CONTROL_PRIVATE_REVALIDATE,
+            last_modified,
+            vary="Authorization",
+        )
+        if not_modified is not None:
+            return not_modified
         party_comments = await service.get_comments()
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -408,12 +483,16 @@ async def cancel_liked_party(
     status_code=status.HTTP_200_OK,
 )
 async def get_self_organized_party(
+    response: Response,
     page: int = 1,
+    cursor: Optional[str] = None,
     user: User = Depends(get_current_user),
 ) -> List[PartyListDetail]:
     try:
         service = PartyListService(user)
-        party_list = await service.get_self_organized_parties(page=page)
+        party_list = await service.get_self_organized_parties(page=page, cursor=cursor)
+        if service.next_cursor:
+            response.headers[HEADER_NEXT_CURSOR] = service.next_cursor
         return party_list
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -425,12 +504,16 @@ async def get_self_organized_party(
     status_code=status.HTTP_200_OK,
 )
 async def get_participated_party(
+    response: Response,
     page: int = 1,
+    cursor: Optional[str] = None,
     user: User = Depends(get_current_user),
 ) -> List[PartyListDetail]:
     try:
         service = PartyListService(user)
-        party_list = await service.get_participated_parties(page=page)
+        party_list = await service.get_participated_parties(page=page, cursor=cursor)
+        if service.next_cursor:
+            response.headers[HEADER_NEXT_CURSOR] = service.next_cursor
         return party_list
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,98 @@
+from typing import List, Optional
+
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from common.config import logger
+
+# MySQL: FULLTEXT(ngram) 인덱스, ngram_token_size 기본값 2
+MYSQL_SEARCH_MIN_LENGTH = 2
+# SQLite(테스트 환경): FTS5 trigram 토크나이저는 3글자 이상만 검색 가능
+SQLITE_SEARCH_MIN_LENGTH = 3
+# 관련도 순으로 가져올 최대 검색 결과 수
+PARTY_SEARCH_MAX_RESULTS = 1000
+
+PARTY_SEARCH_FTS_TABLE = "parties_fts"
+
+SQLITE_PARTY_SEARCH_INDEX_SCRIPT = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {PARTY_SEARCH_FTS_TABLE} USING fts5(
+    title, place_name, body, content='parties', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS {PARTY_SEARCH_FTS_TABLE}_ai AFTER INSERT ON parties BEGIN
+    INSERT INTO {PARTY_SEARCH_FTS_TABLE}(rowid, title, place_name, body)
+    VALUES (new.id, new.title, new.place_name, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS {PARTY_SEARCH_FTS_TABLE}_ad AFTER DELETE ON parties BEGIN
+    INSERT INTO {PARTY_SEARCH_FTS_TABLE}({PARTY_SEARCH_FTS_TABLE}, rowid, title, place_name, body)
+    VALUES ('delete', old.id, old.title, old.place_name, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS {PARTY_SEARCH_FTS_TABLE}_au
+AFTER UPDATE OF title, place_name, body ON parties BEGIN
+    INSERT INTO {PARTY_SEARCH_FTS_TABLE}({PARTY_SEARCH_FTS_TABLE}, rowid, title, place_name, body)
+    VALUES ('delete', old.id, old.title, old.place_name, old.body);
+    INSERT INTO {PARTY_SEARCH_FTS_TABLE}(rowid, title, place_name, body)
+    VALUES (new.id, new.title, new.place_name, new.body);
+END;
+"""
+
+
+def _get_connection() -> BaseDBAsyncClient:
+    return Tortoise.get_connection("default")
+
+
+async def ensure_party_search_index() -> None:
+    """
+    SQLite 환경에서 파티 검색용 FTS5 테이블과 동기화 트리거를 생성합니다.
+    MySQL 은 FULLTEXT 인덱스를 migration 으로 관리합니다.
+    """
+    connection = _get_connection()
+    if connection.capabilities.dialect != "sqlite":
+        return
+    await connection.execute_script(SQLITE_PARTY_SEARCH_INDEX_SCRIPT)
+    await connection.execute_script(
+        f"INSERT INTO {PARTY_SEARCH_FTS_TABLE}({PARTY_SEARCH_FTS_TABLE}) VALUES ('rebuild');"
+    )
+
+
+async def search_party_ids(
+    search_query: str, limit: int = PARTY_SEARCH_MAX_RESULTS
+) -> Optional[List[int]]:
+    """
+    제목, 장소명, 본문을 전문 검색하여 관련도 순으로 파티 ID 를 반환합니다.
+    :param search_query: 검색어
+    :param limit: 최대 결과 수
+    :return: 관련도 내림차순 파티 ID 목록,
+        전문 검색으로 처리할 수 없는 경우(짧은 검색어, 인덱스 없음) None
+    """
+    # 검색어는 구문(phrase) 검색으로만 사용하므로 큰따옴표는 제거
+    keyword = search_query.replace('"', " ").strip()
+    connection = _get_connection()
+    dialect = connection.capabilities.dialect
+
+    if dialect == "mysql":
+        if len(keyword) < MYSQL_SEARCH_MIN_LENGTH:
+            return None
+        rows = await connection.execute_query_dict(
+            "SELECT `id` FROM `parties` "
+            "WHERE MATCH(`title`, `place_name`, `body`) AGAINST(%s IN BOOLEAN MODE) "
+            "ORDER BY MATCH(`title`, `place_name`, `body`) AGAINST(%s IN BOOLEAN MODE) DESC, "
+            "`id` DESC LIMIT %s",
+            [f'"{keyword}"', f'"{keyword}"', limit],
+        )
+        return [row["id"] for row in rows]
+
+    if dialect == "sqlite":
+        if len(keyword) < SQLITE_SEARCH_MIN_LENGTH:
+            return None
+        try:
+            rows = await connection.execute_query_dict(
+                f"SELECT rowid AS id FROM {PARTY_SEARCH_FTS_TABLE} "
+                f"WHERE {PARTY_SEARCH_FTS_TABLE} MATCH ? ORDER BY rank, rowid DESC LIMIT ?",
+                [f'"{keyword}"', limit],
+            )
+        except Exception as e:
+            logger.error(f"[Party Search] FTS query failed, fallback to LIKE: {e}")
+            return None
+        return [row["id"] for row in rows]
+
+    return None
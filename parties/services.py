@@ -1,3 +1,4 @@
+from os import getenv
 from typing import Any
 from zoneinfo import ZoneInfo
 from parties.models import (
@@ -6,8 +7,10 @@ from parties.models import (
     ParticipationStatus,
     PartyComment,
     PartyLike,
+    PARTICIPATED_STATUSES,
 )
-from users.models import User
+from users.cache import increment_party_statistics, invalidate_party_statistics
+from users.models import Sport, User
 from datetime import datetime, UTC, timedelta
 from parties.dtos import (
     ParticipantProfile,
@@ -30,12 +33,15 @@ from common.constants import (
     NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CANCELED,
     NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CLOSED,
 )
-from typing import List, Optional, Union
-from tortoise.expressions import Q
+from typing import Dict, List, Optional, Tuple, Union
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F, Q, RawSQL
+from tortoise.transactions import in_transaction
 from fastapi import HTTPException, status
 from parties.dto.request import PartyUpdateRequest
 from notifications.service import NotificationService
-from notifications.dto import NotificationSpecificDto
+from notifications.dto import NotificationBaseDto, NotificationSpecificDto
+from notifications.outbox import enqueue_party_notification
 from notifications.message_format import (
     MESSAGE_FORMAT_PARTY_PARTICIPATE,
     MESSAGE_FORMAT_PARTY_ACCEPTED,
@@ -45,6 +51,131 @@ from notifications.message_format import (
     MESSAGE_FORMAT_PARTY_COMMENT_ADDED,
 )
 from common.config import TIME_ZONE, logger
+from common.utils import (
+    decode_cursor,
+    encode_cursor,
+    gather_queries,
+    get_next_cursor_from_ids,
+    paginate_by_id,
+)
+from parties.geo import (
+    GEOHASH_PREFIX_UPPER_BOUND,
+    bounding_box_deltas,
+    geohash_cover,
+    haversine_km,
+    haversine_order_sql,
+)
+from parties.list_store import (
+    PartyListEntry,
+    get_party_ids_from_list_store,
+    update_party_list_store,
+)
+from parties.search import PARTY_SEARCH_MAX_RESULTS, search_party_ids
+from parties.cache import (
+    PartyListPage,
+    get_cached_party_cards,
+    get_party_detail,
+    get_party_list_page,
+    invalidate_party_detail,
+    set_cached_party_cards,
+)
+
+
+# 근처 파티 조회 반경(km)
+PARTY_NEAR_DEFAULT_RADIUS_KM = float(getenv("PARTY_NEAR_DEFAULT_RADIUS_KM", 5))
+PARTY_NEAR_MAX_RADIUS_KM = float(getenv("PARTY_NEAR_MAX_RADIUS_KM", 50))
+# 거리 계산 대상으로 가져올 최대 후보 수
+PARTY_NEAR_MAX_CANDIDATES = int(getenv("PARTY_NEAR_MAX_CANDIDATES", 1000))
+
+PARTICIPANT_COUNT_FIELDS = {
+    ParticipationStatus.APPROVED: "approved_count",
+    ParticipationStatus.PENDING: "pending_count",
+}
+
+
+async def update_party_participant_counts(
+    party_id: int,
+    old_status: Optional[ParticipationStatus],
+    new_status: Optional[ParticipationStatus],
+) -> None:
+    """
+    참가 상태 변경에 맞춰 파티의 참가자 카운터를 갱신합니다.
+    상태 변경과 같은 트랜잭션 안에서 호출해야 합니다.
+    :param party_id: 파티 ID
+    :param old_status: 변경 전 상태 (신규 신청이면 None)
+    :param new_status: 변경 후 상태
+    """
+    if old_status == new_status:
+        return
+    counter_updates: Dict[str, Any] = {}
+    # PENDING(0)이 falsy 이므로 None 여부로 비교
+    old_field = (
+        PARTICIPANT_COUNT_FIELDS.get(old_status) if old_status is not None else None
+    )
+    new_field = (
+        PARTICIPANT_COUNT_FIELDS.get(new_status) if new_status is not None else None
+    )
+    if old_field:
+        counter_updates[old_field] = F(old_field) - 1
+    if new_field:
+        counter_updates[new_field] = F(new_field) + 1
+    if counter_updates:
+        await Party.filter(id=party_id).update(**counter_updates)
+
+
+def build_party_card(party: Party) -> PartyListDetail:
+    """목록용 파티 카드 (조회자별 값인 is_user_organizer 는 get_party_cards 에서 채움)"""
+    return PartyListDetail(
+        id=party.id,
+        sport_name=party.sport.name,
+        title=party.title,
+        gather_date=party.gather_at.strftime(FORMAT_YYYY_MM_DD)
+        if party.gather_at
+        else "one",
+        gather_time=party.gather_at.strftime(FORMAT_HH_MM) if party.gather_at else "",
+        participants_info=f"{party.approved_count + 1}/{party.participant_limit}",
+        price=party.participant_cost,
+        body=party.body,
+        organizer_profile=UserSimpleProfile(
+            profile_picture=party.organizer_user.profile_image,
+            name=party.organizer_user.name,
+            user_id=party.organizer_user_id,
+        ),
+        posted_date=party.created_at.strftime(FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ)
+        if party.created_at
+        else "",
+        is_active=party.is_active,
+        place_name=party.place_name,
+        place_id=party.place_id,
+        address=party.address,
+        longitude=party.longitude,
+        latitude=party.latitude,
+    )
+
+
+async def get_party_cards(
+    party_ids: List[int], user: Optional[User]
+) -> List[PartyListDetail]:
+    """
+    파티 카드를 캐시에서 한 번에 가져오고, 캐시에 없는 파티만 id__in 한 번으로 조회합니다.
+    party_ids 순서를 유지하며 삭제된 파티는 제외합니다.
+    """
+    cards = await get_cached_party_cards(party_ids)
+    missing_ids = [party_id for party_id in party_ids if party_id not in cards]
+    if missing_ids:
+        parties = await Party.filter(id__in=missing_ids).select_related(
+            "sport", "organizer_user"
+        )
+        missing_cards = [build_party_card(party) for party in parties]
+        await set_cached_party_cards(missing_cards)
+        cards.update((card.id, card) for card in missing_cards)
+
+    party_cards = [cards[party_id] for party_id in party_ids if party_id in cards]
+    for card in party_cards:
+        card.is_user_organizer = (
+            user is not None and card.organizer_profile.user_id == user.id
+        )
+    return party_cards
 
 
 class PartyParticipateService:
@@ -77,17 +208,32 @@ class PartyParticipateService:
         existing_participation = await PartyParticipant.get_or_none(
             participant_user=self.user, party=self.party
         )
-        # TODO 취소된 신청인 경우 재신청 가능하게 만들 것
-        if (
-            existing_participation
-            and existing_participation.status == ParticipationStatus.PENDING
+        if existing_participation and existing_participation.status in (
+            ParticipationStatus.PENDING,
+            ParticipationStatus.APPROVED,
         ):
             raise ValueError("Already applied to the party.")
 
-        await PartyParticipant.create(
-            participant_user=self.user,
-            party=self.party,
-        )
+        if existing_participation:
+            # (사용자, 파티)당 신청은 하나이므로 취소/거절된 신청을 다시 대기 상태로 변경
+            await self._save_participation_status(
+                existing_participation, ParticipationStatus.PENDING
+            )
+        else:
+            try:
+                async with in_transaction():
+                    await PartyParticipant.create(
+                        participant_user=self.user,
+                        party=self.party,
+                    )
+                    await update_party_participant_counts(
+                        self.party.id, None, ParticipationStatus.PENDING
+                    )
+            except IntegrityError:
+                # 동시에 들어온 중복 신청
+                raise ValueError("Already applied to the party.")
+            await invalidate_party_detail(self.party.id)
+            await increment_party_statistics(self.user.id, participated=1)
 
         # 파티장에게 알람 보내기
         notification_service = NotificationService(self.user)
@@ -148,8 +294,7 @@ class PartyParticipateService:
         ):
             raise ValueError("Invalid status change requested by organizer.")
 
-        participation.status = new_status
-        await participation.save()
+        await self._save_participation_status(participation, new_status)
 
         # 파티원에게 알람 보내기
         notification_service = NotificationService(self.user)
@@ -180,8 +325,7 @@ class PartyParticipateService:
         if new_status != ParticipationStatus.CANCELLED:
             raise ValueError("Participants can only cancel their own participation.")
 
-        participation.status = new_status
-        await participation.save()
+        await self._save_participation_status(participation, new_status)
 
         # 파티장에게 알람 보내기
         notification_service = NotificationService()
@@ -200,14 +344,49 @@ class PartyParticipateService:
 
         return participation
 
+    @staticmethod
+    async def _save_participation_status(
+        participation: PartyParticipant, new_status: ParticipationStatus
+    ) -> None:
+        """참가 상태 변경과 파티 참가자 카운터 갱신을 하나의 트랜잭션으로 처리"""
+        async with in_transaction():
+            # 동시 변경 시 카운터가 어긋나지 않도록 현재 상태를 잠금 조회
+            locked_participation = (
+                await PartyParticipant.select_for_update().get_or_none(
+                    id=participation.id
+                )
+            )
+            old_status = (
+                locked_participation.status
+                if locked_participation
+                else participation.status
+            )
+            participation.status = new_status
+            await participation.save(update_fields=["status", "updated_at"])
+            await update_party_participant_counts(
+                participation.party_id, old_status, new_status
+            )
+        # 커밋 이후에 삭제해야 이전 상태가 다시 캐시되지 않음
+        await invalidate_party_detail(participation.party_id)
+        await increment_party_statistics(
+            participation.participant_user_id,
+            participated=int(new_status in PARTICIPATED_STATUSES)
+            - int(old_status in PARTICIPATED_STATUSES),
+        )
+
     async def set_party_deactivated(self, set_to_deactivate: bool = True) -> None:
         if not self.is_user_organizer():
             raise ValueError("Only Party of Organizer can set party status")
+        old_entry = PartyListEntry.from_party(self.party)
         if set_to_deactivate:
             self.party.is_active = False
         else:
             self.party.is_active = True
         await self.party.save()
+        await invalidate_party_detail(self.party.id)
+        await update_party_list_store(
+            removed=[old_entry], added=[PartyListEntry.from_party(self.party)]
+        )
 
 
 class PartyDetailService:
@@ -218,16 +397,60 @@ class PartyDetailService:
 
     @classmethod
     async def create(cls, party_id: int) -> "PartyDetailService":
-        party = (
-            await Party.get_or_none(id=party_id)
-            .select_related("sport", "organizer_user")
-            .prefetch_related("participants")
+        party = await Party.get_or_none(id=party_id).select_related(
+            "sport", "organizer_user"
         )
         if party is None:
             raise ValueError("Party Does Not Exist")
         return cls(party)
 
-    async def get_party_details(self, user: User) -> PartyDetail:
+    @classmethod
+    async def get_cached_party_details(
+        cls, party_id: int, user: Optional[User]
+    ) -> PartyDetail:
+        """
+        조회자와 무관한 상세 정보는 캐시에서 읽고(없으면 DB 조회 후 저장),
+        조회자별 필드만 요청 시점에 덧씌웁니다.
+        공유 링크로 동시에 들어온 요청은 한 번만 DB 에서 불러옵니다.
+        """
+        party_details = await get_party_detail(
+            party_id, lambda: cls._load_party_details(party_id)
+        )
+        return cls.apply_viewer_fields(party_details, user)
+
+    @classmethod
+    async def _load_party_details(cls, party_id: int) -> PartyDetail:
+        service = await cls.create(party_id)
+        return await service.build_party_details()
+
+    @staticmethod
+    def apply_viewer_fields(
+        party_details: PartyDetail, user: Optional[User]
+    ) -> PartyDetail:
+        """조회자별 필드(is_user_organizer, notice) 적용"""
+        organizer_user_id = party_details.organizer_profile.user_id
+        # 공지는 파티장과 승인된 파티원에게만 노출 (파티장도 승인 목록에 포함)
+        approved_user_ids = {
+            participant.user_id
+            for participant in party_details.approved_participants or []
+        }
+        return party_details.model_copy(
+            update={
+                "is_user_organizer": bool(user) and user.id == organizer_user_id,
+                "notice": party_details.notice
+                if user and user.id in approved_user_ids
+                else None,
+            }
+        )
+
+    async def get_party_details(self, user: Optional[User]) -> PartyDetail:
+        return self.apply_viewer_fields(await self.build_party_details(), user)
+
+    async def build_party_details(self) -> PartyDetail:
+        """
+        조회자와 무관한 파티 상세 정보 (캐시 대상)
+        is_user_organizer 는 False, notice 는 원본 값으로 채워집니다.
+        """
         # 필요한 데이터를 가져와서 파싱합니다.
         participants = (
             await PartyParticipant.filter(party=self.party)
@@ -237,7 +460,6 @@ class PartyDetailService:
 
         approved_participants = []
         pending_participants = []
-        participants_id_list = []
 
         # 파티장도 파티원 리스트에 포함
         approved_participants.append(
@@ -271,7 +493,6 @@ class PartyDetailService:
                         participation_id=participant.id,
                     )
                 )
-                participants_id_list.append(participant.participant_user.id)
 
         return PartyDetail(
             id=self.party.id,
@@ -289,19 +510,11 @@ class PartyDetailService:
                 user_id=self.party.organizer_user_id,
             ),
             posted_date=self.party.created_at.strftime(FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ),
-            is_user_organizer=user.id == self.party.organizer_user_id
-            if user
-            else False,
+            is_user_organizer=False,
             pending_participants=pending_participants,
             approved_participants=approved_participants,
             is_active=self.party.is_active,
-            notice=self.party.notice
-            if user
-            and (
-                user.id in participants_id_list
-                or user.id == self.party.organizer_user_id
-            )
-            else None,
+            notice=self.party.notice,
             place_name=self.party.place_name,
             place_id=self.party.place_id,
             address=self.party.address,
@@ -314,6 +527,7 @@ class PartyDetailService:
     ) -> PartyUpdateInfo:
         if self.party.organizer_user_id != user.id:
             raise PermissionError(f"user{user.id} is not party organizer")
+        old_entry = PartyListEntry.from_party(self.party)
 
         if update_info.gather_time and update_info.gather_date:
             try:
@@ -336,31 +550,29 @@ class PartyDetailService:
 
             setattr(self.party, field, value)
 
-        # 업데이트된 내용 저장
-        await self.party.save()
-
-        # 파티원들에게 알람 보내기
-        notification_service = NotificationService()
-        participant_list = await PartyParticipant.filter(
-            party=self.party, status=ParticipationStatus.APPROVED
-        ).all()
-        message_list = []
-        for participant in participant_list:
-            message = MESSAGE_FORMAT_PARTY_DETAILS_CHANGED.format(
-                party=self.party.title
-            )
-            notification_info = NotificationSpecificDto(
-                type=NOTIFICATION_TYPE_PARTY,
-                classification=NOTIFICATION_CLASSIFY_PARTY_DETAILS_UPDATED
-                if self.party.is_active
-                else NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CLOSED,
-                related_id=self.party.id,
-                message=message,
-                is_global=False,
-                target_user_id=participant.participant_user_id,
+        # 업데이트된 내용 저장과 파티원 알림 이벤트 기록을 한 트랜잭션으로 처리
+        # (파티원별 알림은 notification outbox 워커가 생성)
+        async with in_transaction():
+            await self.party.save()
+            await enqueue_party_notification(
+                NotificationBaseDto(
+                    type=NOTIFICATION_TYPE_PARTY,
+                    classification=NOTIFICATION_CLASSIFY_PARTY_DETAILS_UPDATED
+                    if self.party.is_active
+                    else NOTIFICATION_CLASSIFY_PARTY_PARTICIPATION_CLOSED,
+                    related_id=self.party.id,
+                    message=MESSAGE_FORMAT_PARTY_DETAILS_CHANGED.format(
+                        party=self.party.title
+                    ),
+                    is_global=False,
+                ),
+                party_id=self.party.id,
+                participant_statuses=[ParticipationStatus.APPROVED],
             )
-            message_list.append(notification_info)
-        await notification_service.create_notifications(message_list)
+        await invalidate_party_detail(self.party.id)
+        await update_party_list_store(
+            removed=[old_entry], added=[PartyListEntry.from_party(self.party)]
+        )
 
         return PartyUpdateInfo(
             id=self.party.id,
@@ -386,17 +598,33 @@ class PartyDetailService:
         if self.party.organizer_user_id != user.id:
             raise PermissionError("Only the organizer can delete this party.")
 
+        party_id = self.party.id
+        # 삭제로 통계가 바뀌는 사용자 (파티장, 참가자, 좋아요한 사용자)
+        participant_user_ids, liked_user_ids = await gather_queries(
+            PartyParticipant.filter(
+                party=self.party, status__in=PARTICIPATED_STATUSES
+            ).values_list("participant_user_id", flat=True),
+            PartyLike.filter(party=self.party).values_list("user_id", flat=True),
+        )
         await PartyParticipant.filter(party=self.party).delete()
         await PartyComment.filter(party=self.party).delete()
         await PartyLike.filter(party=self.party).delete()
 
         # 파티 최종 삭제
+        party_entry = PartyListEntry.from_party(self.party)
         await self.party.delete()
+        await invalidate_party_detail(party_id)
+        await update_party_list_store(removed=[party_entry])
+        await invalidate_party_statistics(
+            [user.id, *participant_user_ids, *liked_user_ids]
+        )
 
 
 class PartyListService:
     def __init__(self, user: Optional[User] = None) -> None:
         self.user = user
+        # 마지막 조회 결과 이후 페이지를 가리키는 커서 (마지막 페이지면 None)
+        self.next_cursor: Optional[str] = None
 
     async def get_party_list(
         self,
@@ -407,149 +635,331 @@ class PartyListService:
         search_query: Optional[str] = None,
         page: int = 1,
         page_size: int = 8,
+        cursor: Optional[str] = None,
+        near: Optional[str] = None,
+        radius_km: float = PARTY_NEAR_DEFAULT_RADIUS_KM,
     ) -> List[PartyListDetail]:
+        """
+        조건별 페이지(파티 ID, 다음 커서)는 캐시에서 읽고 파티 카드를 덧씌웁니다.
+        같은 조건의 동시 요청은 한 번만 DB 에서 불러옵니다.
+        """
         try:
-            query = Q()
-
-            if sport_id_list is not None:
-                query &= Q(sport_id__in=sport_id_list)
-
-            if is_active:
-                query &= Q(is_active=True)
-
-            if gather_date_min:
-                gather_at_min = datetime.strptime(gather_date_min, FORMAT_YYYY_MM_DD)
-                gather_at_min = gather_at_min.replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                gather_at_min_with_tz = gather_at_min.replace(
-                    tzinfo=ZoneInfo(TIME_ZONE)
-                )
-                query &= Q(gather_at__gte=gather_at_min_with_tz)
-
-            if gather_date_max:
-                gather_at_max = datetime.strptime(gather_date_max, FORMAT_YYYY_MM_DD)
-                gather_at_max += timedelta(days=1)
-                gather_at_max = gather_at_max.replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                gather_at_max_with_tz = gather_at_max.replace(
-                    tzinfo=ZoneInfo(TIME_ZONE)
-                )
-                query &= Q(gather_at__lt=gather_at_max_with_tz)
+            list_page = await get_party_list_page(
+                {
+                    "sport_id_list": sport_id_list,
+                    "is_active": is_active,
+                    "gather_date_min": gather_date_min,
+                    "gather_date_max": gather_date_max,
+                    "search_query": search_query,
+                    "page": page,
+                    "page_size": page_size,
+                    "cursor": cursor,
+                    "near": near,
+                    "radius_km": radius_km,
+                },
+                lambda: self._load_party_list_page(
+                    sport_id_list,
+                    is_active,
+                    gather_date_min,
+                    gather_date_max,
+                    search_query,
+                    page,
+                    page_size,
+                    cursor,
+                    near,
+                    radius_km,
+                ),
+            )
+            self.next_cursor = list_page.next_cursor
+            party_list = await get_party_cards(list_page.party_ids, self.user)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return party_list
 
-            if search_query:
-                # TODO 쿼리 개선 필요
+    async def _load_party_list_page(
+        self,
+        sport_id_list: Optional[List[int]],
+        is_active: Optional[bool],
+        gather_date_min: Optional[str],
+        gather_date_max: Optional[str],
+        search_query: Optional[str],
+        page: int,
+        page_size: int,
+        cursor: Optional[str],
+        near: Optional[str],
+        radius_km: float,
+    ) -> PartyListPage:
+        query = Q()
+
+        if sport_id_list is not None:
+            query &= Q(sport_id__in=sport_id_list)
+
+        if is_active:
+            query &= Q(is_active=True)
+
+        gather_at_min_with_tz: Optional[datetime] = None
+        gather_at_max_with_tz: Optional[datetime] = None
+        if gather_date_min:
+            gather_at_min = datetime.strptime(gather_date_min, FORMAT_YYYY_MM_DD)
+            gather_at_min = gather_at_min.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            gather_at_min_with_tz = gather_at_min.replace(tzinfo=ZoneInfo(TIME_ZONE))
+            query &= Q(gather_at__gte=gather_at_min_with_tz)
+
+        if gather_date_max:
+            gather_at_max = datetime.strptime(gather_date_max, FORMAT_YYYY_MM_DD)
+            gather_at_max += timedelta(days=1)
+            gather_at_max = gather_at_max.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            gather_at_max_with_tz = gather_at_max.replace(tzinfo=ZoneInfo(TIME_ZONE))
+            query &= Q(gather_at__lt=gather_at_max_with_tz)
+
+        ranked_party_ids: Optional[List[int]] = None
+        if search_query:
+            ranked_party_ids = await search_party_ids(search_query)
+            if ranked_party_ids is None:
+                # 전문 검색으로 처리할 수 없는 짧은 검색어는 LIKE 검색
                 query &= (
                     Q(title__icontains=search_query)
                     | Q(place_name__icontains=search_query)
                     | Q(body__icontains=search_query)
                     | Q(sport__name__icontains=search_query)
                 )
-                # query &= (Q(title__icontains=search_query) | Q(body__icontains=search_query) | Q(place_name__icontains=search_query))
+            else:
+                query &= await self._build_search_query(search_query, ranked_party_ids)
 
-            # 페이징 계산
-            offset = (page - 1) * page_size
-            limit = page_size
-
-            parties = (
-                await Party.filter(query)
-                .select_related("sport", "organizer_user")
-                .prefetch_related("participants")
-                .order_by("-id")
-                .offset(offset)
-                .limit(limit)
+        stored_party_ids: Optional[List[int]] = None
+        if (
+            sport_id_list
+            and gather_at_min_with_tz
+            and gather_at_max_with_tz
+            and not search_query
+            and not near
+        ):
+            # 홈 화면(종목 + 날짜 범위) 조회는 종목, 날짜별 목록 저장소 사용
+            stored_party_ids = await get_party_ids_from_list_store(
+                sport_id_list,
+                gather_at_min_with_tz,
+                gather_at_max_with_tz,
+                active_only=bool(is_active),
             )
-            party_list = [await self._build_party_response(party) for party in parties]
-        except Exception as e:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-        return party_list
+
+        if near:
+            # 거리순 조회 (검색어, 종목, 날짜 조건과 함께 사용 가능)
+            party_ids = await self._get_near_party_ids(
+                query, near, radius_km, page, page_size, cursor
+            )
+        elif stored_party_ids is not None:
+            party_ids = await self._get_stored_party_ids(
+                query, stored_party_ids, page, page_size, cursor
+            )
+        elif ranked_party_ids is not None:
+            party_ids = await self._get_searched_party_ids(
+                query, ranked_party_ids, page, page_size, cursor
+            )
+        else:
+            party_ids = await paginate_by_id(
+                Party.filter(query), page=page, page_size=page_size, cursor=cursor
+            ).values_list("id", flat=True)
+            self.next_cursor = get_next_cursor_from_ids(party_ids, page_size)
+        return PartyListPage(party_ids=list(party_ids), next_cursor=self.next_cursor)
+
+    @staticmethod
+    async def _build_search_query(search_query: str, ranked_party_ids: List[int]) -> Q:
+        """전문 검색 결과 또는 종목명이 일치하는 파티 조건"""
+        # 종목 테이블은 작으므로 parties 와 join 하지 않고 ID 를 먼저 조회
+        sport_ids = await Sport.filter(name__icontains=search_query).values_list(
+            "id", flat=True
+        )
+        search_query_condition = Q(id__in=ranked_party_ids)
+        if sport_ids:
+            search_query_condition |= Q(sport_id__in=sport_ids)
+        return search_query_condition
+
+    async def _get_searched_party_ids(
+        self,
+        query: Q,
+        ranked_party_ids: List[int],
+        page: int,
+        page_size: int,
+        cursor: Optional[str],
+    ) -> List[int]:
+        """검색 결과를 관련도 순(종목명만 일치하는 파티는 최신순으로 뒤에)으로 페이징"""
+        candidate_ids = (
+            await Party.filter(query)
+            .order_by("-id")
+            .limit(PARTY_SEARCH_MAX_RESULTS)
+            .values_list("id", flat=True)
+        )
+        ranks = {party_id: rank for rank, party_id in enumerate(ranked_party_ids)}
+        candidate_ids.sort(key=lambda party_id: ranks.get(party_id, len(ranks)))
+
+        offset = (page - 1) * page_size
+        if cursor:
+            offset = decode_cursor(cursor).get("offset", 0)
+            if not isinstance(offset, int) or offset < 0:
+                raise ValueError(f"Invalid cursor: {cursor}")
+        page_ids = candidate_ids[offset : offset + page_size]
+        self.next_cursor = (
+            encode_cursor({"offset": offset + page_size})
+            if len(candidate_ids) > offset + page_size
+            else None
+        )
+        return page_ids
+
+    async def _get_stored_party_ids(
+        self,
+        query: Q,
+        party_ids: List[int],
+        page: int,
+        page_size: int,
+        cursor: Optional[str],
+    ) -> List[int]:
+        """저장소의 파티 ID(내림차순)를 SQL 조회와 같은 커서 형식으로 페이징"""
+        if cursor:
+            last_id = decode_cursor(cursor).get("id")
+            if not isinstance(last_id, int):
+                raise ValueError(f"Invalid cursor: {cursor}")
+            page_ids = [party_id for party_id in party_ids if party_id < last_id][
+                :page_size
+            ]
+        else:
+            page_ids = party_ids[(page - 1) * page_size : page * page_size]
+        self.next_cursor = get_next_cursor_from_ids(page_ids, page_size)
+
+        # 저장소 반영 전에 바뀐 파티가 섞이지 않도록 같은 조건으로 확인
+        matched_ids = set(
+            await Party.filter(query, id__in=page_ids).values_list("id", flat=True)
+        )
+        return [party_id for party_id in page_ids if party_id in matched_ids]
+
+    async def _get_near_party_ids(
+        self,
+        query: Q,
+        near: str,
+        radius_km: float,
+        page: int,
+        page_size: int,
+        cursor: Optional[str],
+    ) -> List[int]:
+        """반경 안의 파티를 거리순(같으면 ID 순)으로 페이징"""
+        try:
+            latitude, longitude = (float(value) for value in near.split(","))
+        except ValueError:
+            raise ValueError(f"Invalid near: {near}, format is lat,lng")
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError(f"Invalid near: {near}, out of range")
+        if not 0 < radius_km <= PARTY_NEAR_MAX_RADIUS_KM:
+            raise ValueError(
+                f"radius_km must be between 0 and {PARTY_NEAR_MAX_RADIUS_KM}"
+            )
+
+        # geohash prefix 범위(인덱스)로 후보를 좁히고, 반경을 포함하는 사각형으로 한 번 더 거름
+        cell_query = Q()
+        for cell in geohash_cover(latitude, longitude, radius_km):
+            cell_query |= Q(
+                geohash__gte=cell, geohash__lt=cell + GEOHASH_PREFIX_UPPER_BOUND
+            )
+        lat_delta, lng_delta = bounding_box_deltas(latitude, radius_km)
+        box_query = Q(
+            latitude__gte=latitude - lat_delta, latitude__lte=latitude + lat_delta
+        )
+        # 날짜 변경선에 걸치면 경도 범위가 나뉘므로 geohash 셀로만 거름
+        if -180 <= longitude - lng_delta and longitude + lng_delta <= 180:
+            box_query &= Q(
+                longitude__gte=longitude - lng_delta,
+                longitude__lte=longitude + lng_delta,
+            )
+        # 후보 수 제한 전에 DB 에서 거리순(같으면 ID 순)으로 정렬해 가까운 파티가 빠지지 않게 함
+        candidates = (
+            await Party.filter(query, cell_query, box_query)
+            .annotate(distance_order=RawSQL(haversine_order_sql(latitude, longitude)))
+            .order_by("distance_order", "id")
+            .limit(PARTY_NEAR_MAX_CANDIDATES)
+            .values_list("id", "latitude", "longitude")
+        )
+        if len(candidates) == PARTY_NEAR_MAX_CANDIDATES:
+            logger.warning(
+                f"[Near Party] candidate limit reached, near:{near}, "
+                f"radius_km:{radius_km}, limit:{PARTY_NEAR_MAX_CANDIDATES}"
+            )
+
+        distances = sorted(
+            (distance, party_id)
+            for party_id, party_latitude, party_longitude in candidates
+            if (
+                distance := haversine_km(
+                    latitude, longitude, party_latitude, party_longitude
+                )
+            )
+            <= radius_km
+        )
+
+        if cursor:
+            last = decode_cursor(cursor)
+            last_distance, last_id = last.get("distance"), last.get("id")
+            if not isinstance(last_distance, (int, float)) or not isinstance(
+                last_id, int
+            ):
+                raise ValueError(f"Invalid cursor: {cursor}")
+            page_items = [
+                item for item in distances if item > (last_distance, last_id)
+            ][:page_size]
+        else:
+            offset = (page - 1) * page_size
+            page_items = distances[offset : offset + page_size]
+        self.next_cursor = (
+            encode_cursor({"distance": page_items[-1][0], "id": page_items[-1][1]})
+            if len(page_items) == page_size
+            else None
+        )
+        return [party_id for _, party_id in page_items]
 
     async def get_self_organized_parties(
-        self, page: int = 1, page_size: int = 10
+        self, page: int = 1, page_size: int = 10, cursor: Optional[str] = None
     ) -> List[PartyListDetail]:
         try:
-            offset = (page - 1) * page_size
-            limit = page_size
-
-            parties = (
-                await Party.filter(organizer_user=self.user)
-                .select_related("sport", "organizer_user")
-                .prefetch_related("participants")
-                .order_by("-id")
-                .offset(offset)
-                .limit(limit)
-            )
-            party_list = [await self._build_party_response(party) for party in parties]
+            party_ids = await paginate_by_id(
+                Party.filter(organizer_user=self.user),
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            ).values_list("id", flat=True)
+            self.next_cursor = get_next_cursor_from_ids(party_ids, page_size)
+            party_list = await get_party_cards(party_ids, self.user)
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         return party_list
 
     async def get_participated_parties(
-        self, page: int = 1, page_size: int = 10
+        self, page: int = 1, page_size: int = 10, cursor: Optional[str] = None
     ) -> List[PartyListDetail]:
         try:
-            offset = (page - 1) * page_size
-            limit = page_size
-            party_participates = (
-                await PartyParticipant.filter(
+            party_participates = await paginate_by_id(
+                PartyParticipant.filter(
                     participant_user=self.user,
                     status__in=[
                         ParticipationStatus.APPROVED,
                         ParticipationStatus.PENDING,
                     ],
-                )
-                .select_related(
-                    "party", "party__sport", "participant_user", "party__organizer_user"
-                )
-                .order_by("-id")
-                .offset(offset)
-                .limit(limit)
+                ),
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            ).values_list("id", "party_id")
+            self.next_cursor = get_next_cursor_from_ids(
+                [participation_id for participation_id, _ in party_participates],
+                page_size,
+            )
+            party_list = await get_party_cards(
+                [party_id for _, party_id in party_participates], self.user
             )
-            party_list = [
-                await self._build_party_response(party_participate.party)
-                for party_participate in party_participates
-            ]
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         return party_list
 
-    async def _build_party_response(self, party: Party) -> PartyListDetail:
-        approved_participants = await PartyParticipant.filter(
-            party=party, status=ParticipationStatus.APPROVED
-        ).count()
-        return PartyListDetail(
-            id=party.id,
-            sport_name=party.sport.name,
-            title=party.title,
-            gather_date=party.gather_at.strftime(FORMAT_YYYY_MM_DD)
-            if party.gather_at
-            else "one",
-            gather_time=party.gather_at.strftime(FORMAT_HH_MM)
-            if party.gather_at
-            else "",
-            participants_info=f"{approved_participants + 1}/{party.participant_limit}",
-            price=party.participant_cost,
-            body=party.body,
-            organizer_profile=UserSimpleProfile(
-                profile_picture=party.organizer_user.profile_image,
-                name=party.organizer_user.name,
-                user_id=party.organizer_user_id,
-            ),
-            posted_date=party.created_at.strftime(FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ)
-            if party.created_at
-            else "",
-            is_user_organizer=self.user.id == party.organizer_user_id
-            if self.user
-            else False,
-            is_active=party.is_active,
-            place_name=party.place_name,
-            place_id=party.place_id,
-            address=party.address,
-            longitude=party.longitude,
-            latitude=party.latitude,
-        )
-
 
 class PartyCommentService:
     def __init__(self, party_id: int, user: Optional[Union[User, None]] = None) -> None:
@@ -565,6 +975,20 @@ class PartyCommentService:
         ]
         return comments_list
 
+    async def get_comments_version(self) -> Tuple[int, Optional[datetime]]:
+        """
+        댓글 목록 ETag 용 (댓글 수, 댓글/작성자 프로필의 마지막 수정 시각)
+        삭제도 is_deleted 수정이므로 수정 시각에 반영됩니다. 댓글 본문은 조회하지 않습니다.
+        """
+        rows = await PartyComment.filter(party_id=self.party_id).values_list(
+            "updated_at", "commenter__updated_at"
+        )
+        last_modified = max(
+            (updated_at for row in rows for updated_at in row if updated_at),
+            default=None,
+        )
+        return len(rows), last_modified
+
     async def _build_party_comment(self, comment: PartyComment) -> PartyCommentDetail:
         return PartyCommentDetail(
             id=comment.id,
@@ -582,57 +1006,33 @@ class PartyCommentService:
         if not content:
             raise ValueError("Party comment must have content")
         try:
-            comment = await PartyComment.create(
-                party_id=self.party_id, commenter=self.user, content=content
-            )
-
-            # 파티원들에게 알람 보내기
-            notification_service = NotificationService()
-            party = await Party.get_or_none(id=self.party_id)
-            participant_list = (
-                await PartyParticipant.filter(
-                    party_id=self.party_id,
-                    status__in=[
-                        ParticipationStatus.APPROVED,
-                        ParticipationStatus.PENDING,
-                    ],
+            party = await Party.get(id=self.party_id)
+            # 댓글 저장과 알림 이벤트 기록을 한 트랜잭션으로 처리
+            # (파티원/파티장별 알림은 notification outbox 워커가 생성)
+            async with in_transaction():
+                comment = await PartyComment.create(
+                    party_id=self.party_id, commenter=self.user, content=content
                 )
-                .select_related("participant_user")
-                .all()
-            )
-            message_list = []
-            for participant in participant_list:
                 # 자기 자신 제외한 사람들에게 알람
-                if not self.user:
-                    break
-                if self.user.id == participant.participant_user_id:
-                    continue
-                message = MESSAGE_FORMAT_PARTY_COMMENT_ADDED.format(
-                    user=self.user.name, party=party.title
-                )
-                notification_info = NotificationSpecificDto(
-                    type=NOTIFICATION_TYPE_PARTY,
-                    classification=NOTIFICATION_CLASSIFY_PARTY_COMMENT,
-                    related_id=self.party_id,
-                    message=message,
-                    is_global=False,
-                    target_user_id=participant.participant_user_id,
-                )
-                message_list.append(notification_info)
-            if self.user and party.organizer_user_id != self.user.id:
-                message = MESSAGE_FORMAT_PARTY_COMMENT_ADDED.format(
-                    user=self.user.name, party=party.title
-                )
-                notification_info = NotificationSpecificDto(
-                    type=NOTIFICATION_TYPE_PARTY,
-                    classification=NOTIFICATION_CLASSIFY_PARTY_COMMENT,
-                    related_id=self.party_id,
-                    message=message,
-                    is_global=False,
-                    target_user_id=party.organizer_user_id,
-                )
-                message_list.append(notification_info)
-            await notification_service.create_notifications(message_list)
+                if self.user:
+                    await enqueue_party_notification(
+                        NotificationBaseDto(
+                            type=NOTIFICATION_TYPE_PARTY,
+                            classification=NOTIFICATION_CLASSIFY_PARTY_COMMENT,
+                            related_id=self.party_id,
+                            message=MESSAGE_FORMAT_PARTY_COMMENT_ADDED.format(
+                                user=self.user.name, party=party.title
+                            ),
+                            is_global=False,
+                        ),
+                        party_id=self.party_id,
+                        participant_statuses=[
+                            ParticipationStatus.APPROVED,
+                            ParticipationStatus.PENDING,
+                        ],
+                        extra_user_ids=[party.organizer_user_id],
+                        exclude_user_id=self.user.id,
+                    )
 
             return PartyCommentDetail(
                 id=comment.id,
@@ -709,6 +1109,8 @@ class PartyCommentService:
 class PartyLikeService:
     def __init__(self, user: User):
         self.user = user
+        # 마지막 조회 결과 이후 페이지를 가리키는 커서 (마지막 페이지면 None)
+        self.next_cursor: Optional[str] = None
 
     async def party_like(self, party_id: int) -> None:
         party_exists = await Party.exists(id=party_id)
@@ -717,7 +1119,14 @@ class PartyLikeService:
             raise ValueError(f"Party-{party_id} is does not exists")
         if is_liked_party:
             raise ValueError(f"Party-{party_id} is already liked")
-        await PartyLike.create(user=self.user, party_id=party_id)
+        try:
+            async with in_transaction():
+                await PartyLike.create(user=self.user, party_id=party_id)
+                await Party.filter(id=party_id).update(like_count=F("like_count") + 1)
+        except IntegrityError:
+            # 동시에 들어온 중복 좋아요
+            raise ValueError(f"Party-{party_id} is already liked")
+        await increment_party_statistics(self.user.id, liked=1)
 
     async def cancel_party_like(self, party_id: int) -> None:
         party_exists = await Party.exists(id=party_id)
@@ -726,51 +1135,23 @@ class PartyLikeService:
             raise ValueError(f"Party-{party_id} is does not exists")
         if not liked_party:
             raise ValueError(f"Party-{party_id} is already liked")
-        await liked_party.delete()
-
-    async def _build_party_info(self, party: Party) -> PartyListDetail:
-        approved_participants = await PartyParticipant.filter(
-            party=party, status=ParticipationStatus.APPROVED
-        ).count()  # TODO 추후 캐시로 처리
-        return PartyListDetail(
-            id=party.id,
-            sport_name=party.sport.name,
-            title=party.title,
-            gather_date=party.gather_at.strftime(FORMAT_YYYY_MM_DD),
-            gather_time=party.gather_at.strftime(FORMAT_HH_MM),
-            participants_info=f"{approved_participants}/{party.participant_limit}",
-            price=party.participant_cost,
-            body=party.body,
-            organizer_profile=UserSimpleProfile(
-                profile_picture=party.organizer_user.profile_image,
-                name=party.organizer_user.name,
-                user_id=party.organizer_user_id,
-            ),
-            posted_date=party.created_at.strftime(FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ),
-            is_user_organizer=False,
-            is_active=party.is_active,
-            place_name=party.place_name,
-            place_id=party.place_id,
-            address=party.address,
-            longitude=party.longitude,
-            latitude=party.latitude,
-        )
+        async with in_transaction():
+            await liked_party.delete()
+            await Party.filter(id=party_id).update(like_count=F("like_count") - 1)
+        await increment_party_statistics(self.user.id, liked=-1)
 
     async def get_liked_parties(
-        self, page: int = 1, page_size: int = 8
+        self, page: int = 1, page_size: int = 8, cursor: Optional[str] = None
     ) -> List[PartyListDetail]:
-        # 페이징 계산
-        offset = (page - 1) * page_size
-        limit = page_size
-        liked_parties = (
-            await PartyLike.filter(user=self.user)
-            .select_related("party", "party__organizer_user", "party__sport")
-            .offset(offset)
-            .limit(limit)
-            .order_by("-id")
+        liked_parties = await paginate_by_id(
+            PartyLike.filter(user=self.user),
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        ).values_list("id", "party_id")
+        self.next_cursor = get_next_cursor_from_ids(
+            [like_id for like_id, _ in liked_parties], page_size
+        )
+        return await get_party_cards(
+            [party_id for _, party_id in liked_parties], self.user
         )
-        liked_party_info_list = [
-            await self._build_party_info(liked_party.party)
-            for liked_party in liked_parties
-        ]
-        return liked_party_info_list
@@ -1,7 +1,128 @@
-from parties.models import Party
+from typing import Dict, List, Tuple
+
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
+
+from common.config import logger
+from parties.cache import invalidate_party_detail, invalidate_party_list_pages
+from parties.list_store import PartyListEntry, update_party_list_store
+from parties.models import Party, PartyParticipant, ParticipationStatus, PartyLike
 from datetime import datetime
 
+PARTY_COUNTER_REPAIR_BATCH_SIZE = 500
+
 
 async def inactive_expired_parties() -> None:
     _now = datetime.now()
-    await Party.filter(gather_at__lte=_now).update(is_active=False)
+    # 실제로 상태가 바뀌는 파티만 골라 상세 캐시, 목록 저장소에 반영
+    expired_entries = [
+        PartyListEntry._make(row)
+        for row in await Party.filter(gather_at__lte=_now, is_active=True).values_list(
+            "id", "sport_id", "gather_at", "is_active"
+        )
+    ]
+    if not expired_entries:
+        return
+    expired_party_ids = [entry.party_id for entry in expired_entries]
+    await Party.filter(id__in=expired_party_ids).update(is_active=False)
+    await invalidate_party_detail(*expired_party_ids)
+    await update_party_list_store(
+        removed=expired_entries,
+        added=[entry._replace(is_active=False) for entry in expired_entries],
+    )
+
+
+async def _count_party_counters(
+    party_ids: List[int],
+) -> Dict[int, Tuple[int, int, int]]:
+    """파티별 (승인, 대기, 좋아요) 수를 GROUP BY 쿼리로 집계"""
+    counters: Dict[int, List[int]] = {party_id: [0, 0, 0] for party_id in party_ids}
+
+    participant_rows = (
+        await PartyParticipant.filter(
+            party_id__in=party_ids,
+            status__in=[ParticipationStatus.APPROVED, ParticipationStatus.PENDING],
+        )
+        .annotate(participant_count=Count("id"))
+        .group_by("party_id", "status")
+        .values_list("party_id", "status", "participant_count")
+    )
+    for party_id, participation_status, participant_count in participant_rows:
+        index = 0 if participation_status == ParticipationStatus.APPROVED else 1
+        counters[party_id][index] = participant_count
+
+    like_rows = (
+        await PartyLike.filter(party_id__in=party_ids)
+        .annotate(like_count=Count("id"))
+        .group_by("party_id")
+        .values_list("party_id", "like_count")
+    )
+    for party_id, like_count in like_rows:
+        counters[party_id][2] = like_count
+
+    return {
+        party_id: (approved, pending, likes)
+        for party_id, (approved, pending, likes) in counters.items()
+    }
+
+
+async def _repair_party_counter(party_id: int) -> bool:
+    """
+    파티 행을 잠근 뒤 다시 집계하고 카운터를 덮어씀
+    참가/좋아요 카운터 갱신도 같은 파티 행을 잠그므로, 집계와 쓰기 사이의 변경이 유실되지 않습니다.
+    :return: 카운터를 보정했는지 여부
+    """
+    async with in_transaction():
+        party = await Party.select_for_update().get_or_none(id=party_id)
+        if party is None:
+            return False
+        actual = (await _count_party_counters([party_id]))[party_id]
+        if (party.approved_count, party.pending_count, party.like_count) == actual:
+            return False
+        await Party.filter(id=party_id).update(
+            approved_count=actual[0],
+            pending_count=actual[1],
+            like_count=actual[2],
+        )
+    return True
+
+
+async def repair_party_counters(
+    batch_size: int = PARTY_COUNTER_REPAIR_BATCH_SIZE,
+) -> int:
+    """
+    비정규화된 파티 카운터(approved_count, pending_count, like_count)를
+    실제 참가/좋아요 데이터 기준으로 다시 맞춥니다.
+    :param batch_size: 한 번에 검사할 파티 수
+    :return: 보정된 파티 수
+    """
+    repaired_count = 0
+    last_id = 0
+    while True:
+        parties = (
+            await Party.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .values_list("id", "approved_count", "pending_count", "like_count")
+        )
+        if not parties:
+            break
+        last_id = parties[-1][0]
+
+        actual_counters = await _count_party_counters([row[0] for row in parties])
+        repaired_party_ids: List[int] = []
+        for party_id, approved_count, pending_count, like_count in parties:
+            actual = actual_counters[party_id]
+            if (approved_count, pending_count, like_count) == actual:
+                continue
+            # 어긋난 파티만 잠금 후 다시 집계해서 보정
+            if await _repair_party_counter(party_id):
+                repaired_party_ids.append(party_id)
+        # 상세/카드 캐시에 보정 전 카운터가 남지 않도록 삭제
+        await invalidate_party_detail(*repaired_party_ids)
+        repaired_count += len(repaired_party_ids)
+
+    if repaired_count:
+        await invalidate_party_list_pages()
+        logger.info(f"[Party Counter] repaired {repaired_count} parties")
+    return repaired_count
@@ -66,7 +66,19 @@ def prepare_db(request: pytest.FixtureRequest, loop: asyncio.AbstractEventLoop)
             pass
         await db_init("sqlite://:memory:")
 
+    async def setup_redis() -> None:
+        from common.cache_utils import get_redis_client, reset_redis_client
+        from users.cache import clear_local_auth_user_cache
+
+        # 테스트마다 이벤트 루프가 달라지므로 클라이언트를 새로 만들고 데이터 초기화
+        reset_redis_client()
+        await get_redis_client().flushdb()
+        reset_redis_client()
+        # 테스트마다 DB 가 초기화되므로 워커 내 사용자 캐시도 비움
+        clear_local_auth_user_cache()
+
     loop.run_until_complete(setup_db())
+    loop.run_until_complete(setup_redis())
 
     def finalizer() -> None:
         from common.test_config import clean_up
@@ -0,0 +1,123 @@
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from common.config import MongoLogHandler
+from users.models import User
+from users.utils import create_access_token
+
+
+class FakeCollection:
+    """insert_many 호출을 기록하는 Mongo 컬렉션 대용"""
+
+    def __init__(self) -> None:
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.released = threading.Event()
+        self.released.set()
+
+    def insert_many(self, documents: List[Dict[str, Any]], ordered: bool) -> None:
+        self.released.wait()
+        self.batches.append(list(documents))
+
+    @property
+    def documents(self) -> List[Dict[str, Any]]:
+        return [document for batch in self.batches for document in batch]
+
+
+class UnreachableCollection:
+    def insert_many(self, documents: List[Dict[str, Any]], ordered: bool) -> None:
+        raise ConnectionError("mongo is unreachable")
+
+
+def _make_logger(handler: MongoLogHandler, name: str) -> logging.Logger:
+    test_logger = logging.getLogger(name)
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+    test_logger.addHandler(handler)
+    return test_logger
+
+
+def test_mongo_log_handler_batches_records(tmp_path: Path) -> None:
+    collection = FakeCollection()
+    handler = MongoLogHandler(
+        collection=collection, batch_size=100, fallback_path=tmp_path / "fallback.log"
+    )
+    test_logger = _make_logger(handler, "test-mongo-batch")
+
+    for index in range(250):
+        test_logger.info(f"message {index}")
+    handler.flush()
+
+    assert len(collection.documents) == 250
+    assert collection.documents[0]["message"] == "message 0"
+    assert max(len(batch) for batch in collection.batches) <= 100
+    handler.close()
+    test_logger.removeHandler(handler)
+
+
+def test_mongo_log_handler_drops_and_falls_back(tmp_path: Path) -> None:
+    # 저장이 막힌 동안 큐가 가득 차면 버리고 개수를 기록
+    collection = FakeCollection()
+    collection.released.clear()
+    handler = MongoLogHandler(
+        collection=collection,
+        batch_size=1,
+        max_queue_size=5,
+        fallback_path=tmp_path / "fallback.log",
+    )
+    test_logger = _make_logger(handler, "test-mongo-drop")
+    for index in range(20):
+        test_logger.info(f"message {index}")
+    assert handler.dropped_count > 0
+    collection.released.set()
+    handler.close()
+    test_logger.removeHandler(handler)
+    assert any("dropped" in document["message"] for document in collection.documents)
+
+    # Mongo 에 연결할 수 없으면 로컬 파일에 기록
+    fallback_path = tmp_path / "unreachable.log"
+    handler = MongoLogHandler(
+        collection=UnreachableCollection(), fallback_path=fallback_path
+    )
+    test_logger = _make_logger(handler, "test-mongo-fallback")
+    test_logger.info("saved to disk")
+    handler.close()
+    test_logger.removeHandler(handler)
+
+    lines = fallback_path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0])["message"] == "saved to disk"
+
+
+@pytest.mark.asyncio
+async def test_logging_api_route_limits_logged_fields(
+    client: AsyncClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    user = await User.create(name="Test User", email="user@example.com")
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'user_id': user.id})}",
+        "User-Agent": "pytest",
+    }
+    with patch("common.logging_configs.API_LOG_BODY_MAX_LENGTH", 10), caplog.at_level(
+        logging.INFO, logger="blue-rally-log"
+    ):
+        response = await client.post(
+            "/api/user/me", json={"introduction": "a" * 100}, headers=headers
+        )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith(("Request Info", "Response Info"))
+    ]
+    assert len(messages) == 2
+    assert all("Bearer" not in message for message in messages)
+    assert all("pytest" in message for message in messages)
+    assert all("truncated" in message for message in messages)
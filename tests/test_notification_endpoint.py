@@ -1,3 +1,6 @@
+import asyncio
+import json
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -5,9 +8,36 @@ from httpx import AsyncClient
 from starlette import status
 from datetime import datetime, timedelta
 
-from common.dependencies import get_current_user
-from notifications.models import Notification, NotificationRead
-from parties.models import Party
+from common.dependencies import get_admin, get_current_user
+from notifications.models import (
+    Notification,
+    NotificationArchive,
+    NotificationOutbox,
+    NotificationRead,
+    NotificationReadWatermark,
+    OutboxStatus,
+)
+from notifications.dto import (
+    NotificationBaseDto,
+    NotificationGlobalCreateDto,
+    NotificationSpecificDto,
+)
+from notifications.outbox import (
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+    enqueue_party_notification,
+    process_notification_outbox,
+    retry_dead_notification_events,
+)
+from notifications.cache import (
+    decrement_unread_count,
+    get_cached_unread_count,
+    increment_unread_counts,
+)
+from notifications.pubsub import NotificationBroker
+from notifications.service import NotificationService
+from notifications.stream import format_sse, notification_event_stream
+from notifications.utils import archive_old_notifications, compact_notification_reads
+from parties.models import Party, PartyParticipant, ParticipationStatus
 from users.models import User, Sport
 
 
@@ -91,8 +121,14 @@ async def test_success_read_notifications(client: AsyncClient) -> None:
     )
     # 응답 검증
     assert response.status_code == 201
-    assert await NotificationRead.filter(notification=noti_1).exists()
-    assert await NotificationRead.filter(notification=noti_2).exists()
+    # 모두 읽었으므로 watermark 로 압축되고 개별 읽음 기록은 남지 않음
+    watermark = await NotificationReadWatermark.get(user=user)
+    assert watermark.last_read_notification_id == noti_2.id
+    assert not await NotificationRead.filter(user=user).exists()
+    response = await client.get("/api/notifications")
+    assert all(
+        notification["is_read"] for notification in response.json()["notifications"]
+    )
 
 
 @pytest.mark.asyncio
@@ -139,3 +175,497 @@ async def test_get_unread_notification_count(client: AsyncClient) -> None:
 
     # Clean up dependency overrides
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_read_notifications_out_of_order(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    other_user = await User.create(name="Other User")
+    notifications = [
+        await Notification.create(
+            type="personal", message=f"알림 {index}", target_user=user
+        )
+        for index in range(5)
+    ]
+    other_notification = await Notification.create(
+        type="personal", message="다른 사용자 알림", target_user=other_user
+    )
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    # 가운데 알림을 먼저 읽으면 watermark 는 그대로, 예외 목록에만 기록
+    response = await client.post(
+        "/api/notifications/read",
+        json={"read_notification_list": [notifications[2].id, other_notification.id]},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await client.get("/api/notifications/count")
+    assert response.json()["count"] == 4
+    assert await NotificationRead.filter(user=user).count() == 1
+
+    # 앞의 알림을 읽으면 연속으로 읽은 구간까지 watermark 이동
+    response = await client.post(
+        "/api/notifications/read",
+        json={"read_notification_list": [notifications[0].id, notifications[1].id]},
+    )
+    watermark = await NotificationReadWatermark.get(user=user)
+    assert watermark.last_read_notification_id == notifications[2].id
+    assert not await NotificationRead.filter(user=user).exists()
+
+    response = await client.get("/api/notifications/count")
+    assert response.json()["count"] == 2
+    response = await client.get("/api/notifications")
+    is_read_by_id = {
+        notification["id"]: notification["is_read"]
+        for notification in response.json()["notifications"]
+    }
+    assert is_read_by_id == {
+        notifications[4].id: False,
+        notifications[3].id: False,
+        notifications[2].id: True,
+        notifications[1].id: True,
+        notifications[0].id: True,
+    }
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_unread_notification_count_from_redis_counter(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # 증감이 카운터에 누적되는지 확인하도록 재계산 직후 카운터 삭제 기간을 끔
+    monkeypatch.setattr("common.cache_utils.COUNTER_REBUILD_SETTLE_SECONDS", 0)
+    user = await User.create(name="Test User")
+    await Notification.create(type="personal", message="알림", target_user=user)
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    # 카운터가 없으면 DB 기준으로 생성
+    response = await client.get("/api/notifications/count")
+    assert response.json()["count"] == 1
+
+    await NotificationService.create_notifications(
+        [
+            NotificationSpecificDto(
+                type="personal",
+                message="새 알림",
+                is_global=False,
+                target_user_id=user.id,
+            ),
+            NotificationBaseDto(type="all", message="전체 공지", is_global=True),
+        ]
+    )
+    with patch.object(
+        NotificationService, "_count_unread_from_db", side_effect=AssertionError
+    ):
+        response = await client.get("/api/notifications/count")
+        assert response.json()["count"] == 3
+
+        # 같은 알림을 두 번 읽어도 한 번만 감소
+        notification_ids = await Notification.all().values_list("id", flat=True)
+        for _ in range(2):
+            response = await client.post(
+                "/api/notifications/read",
+                json={"read_notification_list": [max(notification_ids)]},
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+        response = await client.get("/api/notifications/count")
+        assert response.json()["count"] == 2
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_notifications_cursor_pagination(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    notifications = [
+        await Notification.create(
+            type="personal", message=f"알림 {index}", target_user=user
+        )
+        for index in range(15)
+    ]
+    await NotificationRead.create(user=user, notification=notifications[-2])
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    response = await client.get("/api/notifications")
+    assert response.json()["total_pages"] == 2
+    first_page = response.json()["notifications"]
+    assert [notification["is_read"] for notification in first_page[:3]] == [
+        False,
+        True,
+        False,
+    ]
+    next_cursor = response.headers["X-Next-Cursor"]
+
+    # 커서 모드에서는 전체 페이지 수를 계산하지 않음
+    response = await client.get("/api/notifications", params={"cursor": next_cursor})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total_pages"] is None
+    assert [
+        notification["id"] for notification in response.json()["notifications"]
+    ] == [notification.id for notification in reversed(notifications[:5])]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await client.get("/api/notifications", params={"cursor": "invalid"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_notification_outbox_batches_retries_and_dead_letter() -> None:
+    organizer = await User.create(name="Organizer")
+    party = await Party.create(title="Test Party", organizer_user=organizer)
+    participants = [await User.create(name=f"User {index}") for index in range(5)]
+    for participant in participants:
+        await PartyParticipant.create(
+            party=party,
+            participant_user=participant,
+            status=ParticipationStatus.APPROVED,
+        )
+    event = await enqueue_party_notification(
+        NotificationBaseDto(
+            type="party", message="댓글 알림", related_id=party.id, is_global=False
+        ),
+        party_id=party.id,
+        participant_statuses=[ParticipationStatus.APPROVED],
+        extra_user_ids=[organizer.id],
+        exclude_user_id=participants[0].id,
+    )
+
+    # 두 번째 배치 생성 중 실패하면 첫 배치만 남고 재시도 대기
+    original_bulk_create = Notification.bulk_create
+    calls = []
+
+    def failing_bulk_create(objects, *args, **kwargs):  # type: ignore
+        calls.append(len(objects))
+        if len(calls) == 2:
+            raise RuntimeError("db error")
+        return original_bulk_create(objects, *args, **kwargs)
+
+    with patch.object(Notification, "bulk_create", failing_bulk_create):
+        assert await process_notification_outbox(batch_size=2) == 2
+
+    event = await NotificationOutbox.get(id=event.id)
+    assert (event.status, event.attempts, event.last_error) == (
+        OutboxStatus.PENDING,
+        1,
+        "db error",
+    )
+    assert event.available_at > datetime.now(ZoneInfo("UTC"))
+    # 재시도 시각 전에는 처리하지 않음
+    assert await process_notification_outbox(batch_size=2) == 0
+
+    await NotificationOutbox.filter(id=event.id).update(
+        available_at=datetime.now(ZoneInfo("UTC")) - timedelta(seconds=1)
+    )
+    assert await process_notification_outbox(batch_size=2) == 3
+    assert (await NotificationOutbox.get(id=event.id)).status == OutboxStatus.DONE
+    # 작성자를 제외한 참가자 4명 + 파티장, 중복 없이 한 번씩
+    assert sorted(
+        await Notification.filter(related_id=party.id).values_list(
+            "target_user_id", flat=True
+        )
+    ) == sorted([organizer.id, *(user.id for user in participants[1:])])
+    assert await NotificationService(organizer).get_unread_notification_count() == 1
+
+    # 계속 실패하는 이벤트는 dead-letter 로 이동
+    dead_event = await enqueue_party_notification(
+        NotificationBaseDto(type="party", message="알림", is_global=False),
+        party_id=party.id,
+        participant_statuses=[ParticipationStatus.APPROVED],
+    )
+    with patch.object(
+        Notification, "bulk_create", side_effect=RuntimeError("db error")
+    ):
+        for _ in range(NOTIFICATION_OUTBOX_MAX_ATTEMPTS):
+            await NotificationOutbox.filter(id=dead_event.id).update(
+                available_at=datetime.now(ZoneInfo("UTC")) - timedelta(seconds=1)
+            )
+            await process_notification_outbox()
+    assert (await NotificationOutbox.get(id=dead_event.id)).status == OutboxStatus.DEAD
+
+    assert await retry_dead_notification_events([dead_event.id]) == 1
+    assert await process_notification_outbox() == 5
+
+
+@pytest.mark.asyncio
+async def test_global_notifications_merged_on_read(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    other_user = await User.create(name="Other User")
+    expected_ids = []
+    for index in range(6):
+        personal = await Notification.create(
+            type="personal", message=f"개인 {index}", target_user=user
+        )
+        await Notification.create(
+            type="personal", message=f"다른 사용자 {index}", target_user=other_user
+        )
+        announcement = await NotificationService.create_global_notification(
+            NotificationGlobalCreateDto(type="global", message=f"공지 {index}")
+        )
+        expected_ids += [personal.id, announcement.id]
+    expected_ids.reverse()
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    response = await client.get("/api/notifications")
+    assert response.json()["total_pages"] == 2
+    assert [
+        notification["id"] for notification in response.json()["notifications"]
+    ] == expected_ids[:10]
+    next_cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get("/api/notifications", params={"page": 2})
+    assert [
+        notification["id"] for notification in response.json()["notifications"]
+    ] == expected_ids[10:]
+    response = await client.get("/api/notifications", params={"cursor": next_cursor})
+    assert [
+        notification["id"] for notification in response.json()["notifications"]
+    ] == expected_ids[10:]
+
+    service = NotificationService(user)
+    assert await service._count_unread_from_db() == 12
+    await service.mark_notifications_as_read(expected_ids[-4:])
+    assert await service.get_unread_notification_count() == 8
+    # 전체 공지는 한 건만 저장되고 카운터는 공용 시퀀스로 반영
+    await NotificationService.create_global_notification(
+        NotificationGlobalCreateDto(type="global", message="새 공지")
+    )
+    assert await service.get_unread_notification_count() == 9
+    assert await NotificationService(other_user).get_unread_notification_count() == 13
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_notification_event_stream() -> None:
+    user = await User.create(name="Test User")
+    broker = NotificationBroker(queue_size=2)
+    stream = notification_event_stream(user, broker)
+
+    async def next_event() -> str:
+        return await asyncio.wait_for(anext(stream), timeout=3)
+
+    first_event = await next_event()
+    assert first_event.startswith("retry: ")
+    assert 'event: unread_count\ndata: {"count": 0}' in first_event
+
+    await NotificationService.create_notifications(
+        [
+            NotificationSpecificDto(
+                type="party", message="새 알림", is_global=False, target_user_id=user.id
+            )
+        ]
+    )
+    notification = await Notification.get(target_user=user)
+    notification_event = await next_event()
+    assert notification_event.startswith("event: notification\n")
+    assert json.loads(notification_event.split("data: ")[1])["id"] == notification.id
+    assert await next_event() == format_sse("unread_count_delta", {"delta": 1})
+
+    await NotificationService(user).mark_notifications_as_read([notification.id])
+    assert await next_event() == format_sse("unread_count_delta", {"delta": -1})
+
+    with patch("notifications.stream.NOTIFICATION_STREAM_HEARTBEAT", 0.05):
+        assert await next_event() == ": heartbeat\n\n"
+
+        # 소비하지 않는 동안 대기 이벤트가 넘치면 한 번의 재동기화로 대체
+        for _ in range(3):
+            await NotificationService.create_global_notification(
+                NotificationGlobalCreateDto(type="global", message="공지")
+            )
+        await asyncio.sleep(0.2)
+        events = [await next_event() for _ in range(4)]
+    assert [event.split("\n")[0] for event in events] == [
+        "event: notification",
+        "event: notification",
+        "event: notification",
+        "event: unread_count",
+    ]
+    assert json.loads(events[-1].split("data: ")[1]) == {"count": 3}
+
+    await stream.aclose()
+    assert not broker._queues
+    await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_archive_old_notifications(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    old_notifications = [
+        await Notification.create(
+            type="personal", message=f"오래된 알림 {index}", target_user=user
+        )
+        for index in range(5)
+    ]
+    recent_notification = await Notification.create(
+        type="personal", message="최근 알림", target_user=user
+    )
+    await Notification.filter(
+        id__in=[notification.id for notification in old_notifications]
+    ).update(created_at=datetime.now(ZoneInfo("UTC")) - timedelta(days=200))
+    await NotificationRead.create(user=user, notification=old_notifications[-1])
+    service = NotificationService(user)
+    assert await service.get_unread_notification_count() == 5
+
+    with patch("notifications.utils.NOTIFICATION_ARCHIVE_BATCH_PAUSE", 0):
+        run = await archive_old_notifications(retention_days=180, batch_size=2)
+
+    assert (run.archived_count, run.deleted_read_count, run.batch_count) == (5, 1, 3)
+    assert run.finished_at is not None and run.error is None
+    assert await Notification.filter(target_user=user).values_list("id", flat=True) == [
+        recent_notification.id
+    ]
+    archived = await NotificationArchive.get(id=old_notifications[0].id)
+    assert (archived.message, archived.target_user_id) == ("오래된 알림 0", user.id)
+    assert not await NotificationRead.filter(user=user).exists()
+    # 보관된 읽지 않은 알림은 카운터에서 빠짐
+    assert await service.get_unread_notification_count() == 1
+
+    from main import app
+
+    app.dependency_overrides[get_admin] = lambda: "admin"
+    response = await client.get("/admin/notifications/archive-runs")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[0]["archived_count"] == 5
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_compact_notification_reads_in_batches(client: AsyncClient) -> None:
+    users = [await User.create(name=f"Test User {index}") for index in range(3)]
+    for user in users:
+        notification = await Notification.create(
+            type="personal", message="알림", target_user=user
+        )
+        await NotificationRead.create(user=user, notification=notification)
+
+    with patch("notifications.utils.NOTIFICATION_ARCHIVE_BATCH_PAUSE", 0):
+        assert await compact_notification_reads(batch_size=2) == 3
+
+    # 모든 배치의 읽음 기록이 watermark 로 압축됨
+    assert not await NotificationRead.all().exists()
+    assert (
+        await NotificationReadWatermark.filter(
+            user_id__in=[user.id for user in users]
+        ).count()
+        == 3
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_notifications_returns_unread_count(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    other_user = await User.create(name="Other User")
+    notifications = [
+        await Notification.create(
+            type="personal", message=f"알림 {index}", target_user=user
+        )
+        for index in range(6)
+    ]
+    other_notification = await Notification.create(
+        type="personal", message="다른 사용자 알림", target_user=other_user
+    )
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    response = await client.get("/api/notifications/count")
+    assert response.json()["count"] == 6
+
+    # 같은 요청을 다시 보내도 읽음 기록/카운터가 변하지 않음
+    for _ in range(2):
+        response = await client.post(
+            "/api/notifications/read",
+            json={
+                "read_notification_list": [notifications[4].id, other_notification.id]
+            },
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json() == {"count": 5}
+    assert await NotificationRead.filter(user=user).count() == 1
+
+    # 지정한 ID 이하를 한 번에 읽음 처리
+    response = await client.post(
+        "/api/notifications/read", json={"read_up_to_id": notifications[2].id}
+    )
+    assert response.json() == {"count": 2}
+    watermark = await NotificationReadWatermark.get(user=user)
+    assert watermark.last_read_notification_id == notifications[2].id
+
+    # 최신 알림보다 큰 ID 는 최신 알림까지만 반영
+    response = await client.post(
+        "/api/notifications/read", json={"read_up_to_id": 10**9}
+    )
+    assert response.json() == {"count": 0}
+    watermark = await NotificationReadWatermark.get(user=user)
+    assert watermark.last_read_notification_id == notifications[-1].id
+    assert not await NotificationRead.filter(user=user).exists()
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_read_requests_decrement_once(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    notifications = [
+        await Notification.create(
+            type="personal", message=f"알림 {index}", target_user=user
+        )
+        for index in range(3)
+    ]
+    service = NotificationService(user)
+    assert await service.get_unread_notification_count() == 3
+
+    # 같은 알림을 동시에 읽음 처리해도 카운터는 한 번만 감소
+    read_ids = [notifications[1].id, notifications[2].id]
+    unread_counts = await asyncio.gather(
+        service.mark_notifications_as_read(read_ids),
+        NotificationService(user).mark_notifications_as_read(read_ids),
+    )
+    assert unread_counts == [1, 1]
+    assert await get_cached_unread_count(user.id) == 1
+    assert await NotificationRead.filter(user=user).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_unread_counter_is_rebuilt(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    await Notification.create(type="personal", message="알림", target_user=user)
+    service = NotificationService(user)
+    assert await service.get_unread_notification_count() == 1
+
+    # 중복 감소로 음수가 된 카운터는 사용하지 않고 DB 기준으로 다시 계산
+    assert await decrement_unread_count(user.id, 2) is None
+    assert await get_cached_unread_count(user.id) is None
+    assert await service.get_unread_notification_count() == 1
+    assert await get_cached_unread_count(user.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_late_increment_after_rebuild_is_not_double_counted(
+    client: AsyncClient,
+) -> None:
+    user = await User.create(name="Test User")
+    # 커밋된 알림이 다시 계산에 포함된 뒤, 해당 알림의 증가가 늦게 도착
+    await Notification.create(type="personal", message="알림", target_user=user)
+    service = NotificationService(user)
+    assert await service.get_unread_notification_count() == 1
+    await increment_unread_counts([user.id])
+
+    # 중복 반영될 수 있는 카운터는 삭제하고 DB 기준으로 다시 계산
+    assert await get_cached_unread_count(user.id) is None
+    assert await service.get_unread_notification_count() == 1
@@ -1,9 +1,20 @@
+import asyncio
+from typing import Any, Awaitable
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
 from httpx import AsyncClient
 from starlette import status
+from tortoise import Tortoise
+from tortoise.expressions import F
 
+from common.cache_constants import (
+    CACHE_KEY_PARTY_DETAIL,
+    CACHE_KEY_PARTY_DETAIL_VERSION,
+)
+from common.cache_utils import RedisManager, StaleWhileRevalidateCache
+from common.config import TIME_ZONE
 from common.dependencies import get_current_user
 from users.models import User, Sport
 from datetime import datetime, UTC, timedelta
@@ -16,6 +27,22 @@ from parties.models import (
 )
 from common.constants import FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ, NOTIFICATION_TYPE_PARTY
 from notifications.models import Notification
+from notifications.outbox import process_notification_outbox
+from parties.cache import (
+    get_cached_party_detail,
+    invalidate_party_detail,
+    invalidate_party_list_pages,
+    party_card_cache_stats,
+    party_detail_cache,
+    party_detail_cache_stats,
+)
+from parties.list_store import party_list_store_stats, rebuild_party_list_store
+from parties.services import PartyDetailService
+from parties.utils import (
+    _count_party_counters,
+    inactive_expired_parties,
+    repair_party_counters,
+)
 
 
 @pytest.mark.asyncio
@@ -114,6 +141,8 @@ async def test_success_party_update(client: AsyncClient) -> None:
     assert updated_party.gather_at == datetime.strptime(
         "2024-02-03T08:30:00+09:00", FORMAT_YYYY_MM_DD_T_HH_MM_SS_TZ
     )
+    # 파티원 알림은 outbox 워커가 생성
+    assert await process_notification_outbox() == 1
     assert (
         await Notification.get_or_none(
             related_id=party.id, target_user=participation_user
@@ -461,7 +490,8 @@ async def test_post_party_comment_success(client: AsyncClient) -> None:
     response_data = response.json()
     assert response_data["content"] == comment_content
 
-    # 파티 댓글 알람
+    # 파티 댓글 알람 (작성자인 파티장은 제외)
+    assert await process_notification_outbox() == 1
     assert (
         await Notification.get_or_none(
             related_id=party.id, target_user=participation_user
@@ -852,3 +882,824 @@ async def test_non_organizer_cannot_delete_party(client: AsyncClient) -> None:
 
     # Clean up dependency overrides
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_party_list_query_count_does_not_grow_with_page_size(
+    client: AsyncClient,
+) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image1.jpg"
+    )
+    sport = await Sport.create(name="Freediving")
+
+    async def create_parties(count: int) -> None:
+        for index in range(count):
+            party = await Party.create(
+                title=f"Freediving Party {index}",
+                body="Freediving Party body",
+                organizer_user=organizer_user,
+                gather_at=datetime.now(UTC) + timedelta(days=3),
+                participant_limit=5,
+                participant_cost=200,
+                sport=sport,
+                place_id=123215213,
+                place_name="딥스테이션",
+                address="경기도 용신시 처인구 784-2",
+                longitude=float(37.2805605),
+                latitude=float(127.1997416),
+            )
+            participant_user = await User.create(
+                name=f"Participant {party.id}", profile_image="http://example.com"
+            )
+            await PartyParticipant.create(
+                party=party,
+                participant_user=participant_user,
+                status=ParticipationStatus.APPROVED,
+            )
+
+        # 테스트 데이터는 ORM으로 직접 생성했으므로 카운터와 목록 캐시를 보정
+        await repair_party_counters()
+        await invalidate_party_list_pages()
+
+    async def count_list_queries() -> tuple[int, list[dict[str, Any]]]:
+        connection = Tortoise.get_connection("default")
+        with patch.object(
+            connection, "execute_query", wraps=connection.execute_query
+        ) as mocked_execute_query:
+            response = await client.get("/api/party/list")
+        assert response.status_code == status.HTTP_200_OK
+        return mocked_execute_query.call_count, response.json()
+
+    await create_parties(2)
+    small_page_query_count, small_page = await count_list_queries()
+
+    await create_parties(6)
+    full_page_query_count, full_page = await count_list_queries()
+
+    assert len(small_page) == 2
+    assert len(full_page) == 8
+    assert full_page_query_count == small_page_query_count
+    # 파티장 + 승인된 참가자 1명
+    assert all(party["participants_info"] == "2/5" for party in full_page)
+
+
+@pytest.mark.asyncio
+async def test_party_counters_follow_participation_and_like(
+    client: AsyncClient,
+) -> None:
+    organizer_user = await User.create(name="Organizer User")
+    participant_user = await User.create(name="Participant User")
+    test_party = await Party.create(
+        title="Test Party",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+    )
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: participant_user
+    response = await client.post(f"/api/party/{test_party.id}/participate")
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await client.post(f"/api/party/like/{test_party.id}")
+    assert response.status_code == status.HTTP_201_CREATED
+
+    party = await Party.get(id=test_party.id)
+    assert (party.approved_count, party.pending_count, party.like_count) == (0, 1, 1)
+
+    participation = await PartyParticipant.get(
+        party=test_party, participant_user=participant_user
+    )
+    app.dependency_overrides[get_current_user] = lambda: organizer_user
+    response = await client.post(
+        f"/api/party/organizer/{test_party.id}/status-change/{participation.id}",
+        json={"new_status": ParticipationStatus.APPROVED.value},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    party = await Party.get(id=test_party.id)
+    assert (party.approved_count, party.pending_count) == (1, 0)
+
+    app.dependency_overrides[get_current_user] = lambda: participant_user
+    response = await client.post(
+        f"/api/party/participants/{test_party.id}/status-change",
+        json={"new_status": ParticipationStatus.CANCELLED.value},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = await client.delete(f"/api/party/like/{test_party.id}")
+    assert response.status_code == status.HTTP_200_OK
+
+    party = await Party.get(id=test_party.id)
+    assert (party.approved_count, party.pending_count, party.like_count) == (0, 0, 0)
+
+    # 카운터가 어긋난 경우 보정 작업으로 복구
+    await Party.filter(id=test_party.id).update(approved_count=7, like_count=3)
+    with patch(
+        "parties.utils.invalidate_party_detail", wraps=invalidate_party_detail
+    ) as mocked_invalidate:
+        assert await repair_party_counters() == 1
+    # 보정한 파티의 상세/카드 캐시 삭제
+    mocked_invalidate.assert_called_once_with(test_party.id)
+    party = await Party.get(id=test_party.id)
+    assert (party.approved_count, party.pending_count, party.like_count) == (0, 0, 0)
+
+    # 어긋난 카운터를 찾은 뒤, 보정 전에 커밋된 좋아요도 유실되지 않음
+    await Party.filter(id=test_party.id).update(like_count=3)
+
+    async def count_then_like(party_ids: list[int]) -> Any:
+        counters = await _count_party_counters(party_ids)
+        if not await PartyLike.exists(party_id=test_party.id):
+            await PartyLike.create(user=organizer_user, party=test_party)
+            await Party.filter(id=test_party.id).update(like_count=F("like_count") + 1)
+        return counters
+
+    with patch("parties.utils._count_party_counters", wraps=count_then_like):
+        assert await repair_party_counters() == 1
+    party = await Party.get(id=test_party.id)
+    assert party.like_count == 1
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_party_list_cursor_pagination(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image1.jpg"
+    )
+    sport = await Sport.create(name="Freediving")
+    for index in range(10):
+        await Party.create(
+            title=f"Freediving Party {index}",
+            body="Freediving Party body",
+            organizer_user=organizer_user,
+            gather_at=datetime.now(UTC) + timedelta(days=3),
+            participant_limit=5,
+            sport=sport,
+            place_name="딥스테이션",
+            address="경기도 용신시 처인구 784-2",
+            longitude=float(37.2805605),
+            latitude=float(127.1997416),
+        )
+
+    first_response = await client.get("/api/party/list")
+    assert first_response.status_code == status.HTTP_200_OK
+    first_page = first_response.json()
+    next_cursor = first_response.headers.get("X-Next-Cursor")
+    assert len(first_page) == 8
+    assert next_cursor is not None
+
+    second_response = await client.get(
+        "/api/party/list", params={"cursor": next_cursor}
+    )
+    second_page = second_response.json()
+    assert second_response.status_code == status.HTTP_200_OK
+    assert len(second_page) == 2
+    assert "X-Next-Cursor" not in second_response.headers
+
+    # offset 페이지네이션과 같은 결과
+    offset_response = await client.get("/api/party/list", params={"page": 2})
+    assert [party["id"] for party in offset_response.json()] == [
+        party["id"] for party in second_page
+    ]
+
+    invalid_response = await client.get("/api/party/list", params={"cursor": "invalid"})
+    assert invalid_response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_party_list_near(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image1.jpg"
+    )
+    sport = await Sport.create(name="Freediving")
+    other_sport = await Sport.create(name="Scuba Diving")
+    center_latitude, center_longitude = 37.5665, 126.9780
+
+    async def create_party(title: str, latitude: float, sport: Sport) -> Party:
+        return await Party.create(
+            title=title,
+            body="Freediving Party body",
+            organizer_user=organizer_user,
+            gather_at=datetime.now(UTC) + timedelta(days=3),
+            participant_limit=5,
+            sport=sport,
+            place_name="딥스테이션",
+            address="경기도 용신시 처인구 784-2",
+            longitude=center_longitude,
+            latitude=latitude,
+        )
+
+    # 약 200m 간격으로 멀어지는 파티 (생성 순서와 거리 순서를 반대로)
+    near_parties = [
+        await create_party(
+            f"Near Party {index}", center_latitude + 0.0018 * index, sport
+        )
+        for index in range(10, 0, -1)
+    ]
+    other_sport_party = await create_party(
+        "Other Sport Party", center_latitude - 0.001, other_sport
+    )
+    await create_party("Far Party", center_latitude + 0.2, sport)
+
+    params = {
+        "near": f"{center_latitude},{center_longitude}",
+        "radius_km": 5,
+        "sport_id": sport.id,
+    }
+    first_response = await client.get("/api/party/list", params=params)
+    assert first_response.status_code == status.HTTP_200_OK
+    next_cursor = first_response.headers.get("X-Next-Cursor")
+    assert next_cursor is not None
+    second_response = await client.get(
+        "/api/party/list", params={**params, "cursor": next_cursor}
+    )
+    assert "X-Next-Cursor" not in second_response.headers
+    assert [
+        party["id"] for party in first_response.json() + second_response.json()
+    ] == [party.id for party in reversed(near_parties)]
+
+    # 종목 조건이 없으면 다른 종목 파티도 거리순으로 포함, 반경 밖 파티는 제외
+    response = await client.get(
+        "/api/party/list",
+        params={"near": f"{center_latitude},{center_longitude}", "radius_km": 5},
+    )
+    assert response.json()[0]["id"] == other_sport_party.id
+    assert response.headers.get("X-Next-Cursor") is not None
+
+    for invalid_params in ({"near": "37.5"}, {"near": "37.5,127", "radius_km": 500}):
+        response = await client.get("/api/party/list", params=invalid_params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_party_list_near_over_candidate_limit(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image1.jpg"
+    )
+    sport = await Sport.create(name="Freediving")
+    center_latitude, center_longitude = 37.5665, 126.9780
+    monkeypatch.setattr("parties.services.PARTY_NEAR_MAX_CANDIDATES", 3)
+
+    # 먼 파티부터 생성하고 중심의 남북으로 번갈아 배치 (ID/geohash 순서가 거리순이 아님)
+    parties = [
+        await Party.create(
+            title=f"Party {index}",
+            body="Freediving Party body",
+            organizer_user=organizer_user,
+            gather_at=datetime.now(UTC) + timedelta(days=3),
+            participant_limit=5,
+            sport=sport,
+            place_name="딥스테이션",
+            address="경기도 용신시 처인구 784-2",
+            longitude=center_longitude,
+            latitude=center_latitude + (-1) ** index * 0.0018 * index,
+        )
+        for index in range(8, 0, -1)
+    ]
+
+    response = await client.get(
+        "/api/party/list",
+        params={"near": f"{center_latitude},{center_longitude}", "radius_km": 5},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    # 후보 수 제한을 넘어도 가장 가까운 파티들이 거리순으로 조회됨
+    assert [party["id"] for party in response.json()] == [
+        party.id for party in reversed(parties[-3:])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_party_list_from_list_store(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image1.jpg"
+    )
+    sport = await Sport.create(name="Freediving")
+    gather_day = datetime.now(ZoneInfo(TIME_ZONE)).date() + timedelta(days=3)
+    gather_at = datetime.combine(
+        gather_day, datetime.min.time(), ZoneInfo(TIME_ZONE)
+    ) + timedelta(hours=10)
+    parties = [
+        await Party.create(
+            title=f"Freediving Party {index}",
+            body="Freediving Party body",
+            organizer_user=organizer_user,
+            gather_at=gather_at,
+            sport=sport,
+            place_name="딥스테이션",
+            address="경기도 용신시 처인구 784-2",
+            longitude=127.1997416,
+            latitude=37.2805605,
+        )
+        for index in range(3)
+    ]
+    params = {
+        "sport_id": sport.id,
+        "gather_date_min": gather_day.isoformat(),
+        "gather_date_max": gather_day.isoformat(),
+        "is_active": True,
+    }
+
+    async def get_party_ids() -> list[int]:
+        response = await client.get("/api/party/list", params=params)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        return [party["id"] for party in response.json()]
+
+    # 저장소가 비어 있으면 DB 기준으로 만든 뒤 응답
+    hits, misses = party_list_store_stats.hits, party_list_store_stats.misses
+    assert await get_party_ids() == [party.id for party in reversed(parties)]
+    assert party_list_store_stats.misses == misses + 1
+
+    # 생성/수정은 저장소에 바로 반영 (다시 만들지 않음)
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: organizer_user
+    response = await client.post(
+        "/api/party",
+        json={
+            "title": "New Party",
+            "body": "Freediving Party body",
+            "gather_date": gather_day.isoformat(),
+            "gather_time": "12:00",
+            "place_name": "딥스테이션",
+            "address": "경기도 용신시 처인구 784-2",
+            "longitude": 127.1997416,
+            "latitude": 37.2805605,
+            "sport_id": sport.id,
+        },
+    )
+    new_party_id = response.json()["party_id"]
+    response = await client.post(
+        f"/api/party/{parties[0].id}",
+        json={
+            "gather_date": (gather_day + timedelta(days=1)).isoformat(),
+            "gather_time": "10:00",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    app.dependency_overrides.clear()
+
+    assert await get_party_ids() == [new_party_id, parties[2].id, parties[1].id]
+    assert party_list_store_stats.misses == misses + 1
+
+    assert await rebuild_party_list_store() == 4
+    assert await get_party_ids() == [new_party_id, parties[2].id, parties[1].id]
+    assert party_list_store_stats.misses == misses + 1
+    assert party_list_store_stats.hits == hits + 2
+
+
+@pytest.mark.asyncio
+async def test_party_cards_shared_across_lists(client: AsyncClient) -> None:
+    from main import app
+
+    organizer_user = await User.create(
+        name="Organizer User",
+        email="organizer@example.com",
+        profile_image="http://example.com/image1.jpg",
+    )
+    viewer = await User.create(
+        name="Viewer",
+        email="viewer@example.com",
+        profile_image="http://example.com/2.jpg",
+    )
+    sport = await Sport.create(name="Freediving")
+    parties = [
+        await Party.create(
+            title=f"Freediving Party {index}",
+            body="Freediving Party body",
+            organizer_user=organizer_user,
+            gather_at=datetime.now(UTC) + timedelta(days=3),
+            participant_limit=5,
+            sport=sport,
+            place_name="딥스테이션",
+            address="경기도 용신시 처인구 784-2",
+            longitude=127.1997416,
+            latitude=37.2805605,
+        )
+        for index in range(3)
+    ]
+    for party in parties:
+        await PartyLike.create(user=viewer, party=party)
+
+    # 목록에서 만든 카드를 좋아요 목록이 그대로 사용 (파티 조회 없이 MGET 만)
+    app.dependency_overrides[get_current_user] = lambda: organizer_user
+    response = await client.get("/api/party/me/organized")
+    assert all(party["is_user_organizer"] for party in response.json())
+
+    hits, misses = party_card_cache_stats.hits, party_card_cache_stats.misses
+    app.dependency_overrides[get_current_user] = lambda: viewer
+    response = await client.get("/api/user/party/like")
+    assert [party["id"] for party in response.json()] == [
+        party.id for party in reversed(parties)
+    ]
+    assert not any(party["is_user_organizer"] for party in response.json())
+    assert party_card_cache_stats.hits == hits + 3
+    assert party_card_cache_stats.misses == misses
+
+    # 파티장 프로필이 바뀌면 카드 캐시 삭제
+    app.dependency_overrides[get_current_user] = lambda: organizer_user
+    response = await client.post("/api/user/me", json={"name": "Renamed Organizer"})
+    assert response.status_code == status.HTTP_201_CREATED
+    app.dependency_overrides[get_current_user] = lambda: viewer
+    response = await client.get("/api/user/party/like")
+    assert {party["organizer_profile"]["name"] for party in response.json()} == {
+        "Renamed Organizer"
+    }
+    assert party_card_cache_stats.misses == misses + 3
+
+    # 파티원 프로필이 바뀌면 참가한 파티의 상세 캐시도 삭제
+    await PartyParticipant.create(
+        party=parties[0],
+        participant_user=viewer,
+        status=ParticipationStatus.APPROVED,
+    )
+    await invalidate_party_detail(parties[0].id)
+    await client.get(f"/api/party/details/{parties[0].id}")
+    assert await get_cached_party_detail(parties[0].id) is not None
+    response = await client.post("/api/user/me", json={"name": "Renamed Viewer"})
+    assert response.status_code == status.HTTP_201_CREATED
+    assert await get_cached_party_detail(parties[0].id) is None
+    response = await client.get(f"/api/party/details/{parties[0].id}")
+    assert "Renamed Viewer" in {
+        participant["name"] for participant in response.json()["approved_participants"]
+    }
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_party_list_search(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image1.jpg"
+    )
+    freediving = await Sport.create(name="프리다이빙")
+    scuba = await Sport.create(name="스쿠버다이빙")
+
+    async def create_party(title: str, body: str, sport: Sport) -> Party:
+        return await Party.create(
+            title=title,
+            body=body,
+            organizer_user=organizer_user,
+            gather_at=datetime.now(UTC) + timedelta(days=3),
+            participant_limit=5,
+            sport=sport,
+            place_name="딥스테이션",
+            address="경기도 용신시 처인구 784-2",
+            longitude=float(37.2805605),
+            latitude=float(127.1997416),
+        )
+
+    relevant_party = await create_party(
+        "강습 후 펀다이빙 같이 가요", "펀다이빙 초보 환영, 펀다이빙 장비 대여", scuba
+    )
+    less_relevant_party = await create_party(
+        "주말 모임", "끝나고 펀다이빙도 가능", freediving
+    )
+    sport_only_party = await create_party("스쿠버 정기 모임", "정기 모임", scuba)
+    await create_party("수영장 연습", "프리 연습", freediving)
+
+    response = await client.get("/api/party/list", params={"search_query": "펀다이빙"})
+    assert response.status_code == status.HTTP_200_OK
+    # 관련도 순 정렬
+    assert [party["id"] for party in response.json()] == [
+        relevant_party.id,
+        less_relevant_party.id,
+    ]
+
+    # 종목명 검색
+    response = await client.get(
+        "/api/party/list", params={"search_query": "스쿠버다이빙"}
+    )
+    assert {party["id"] for party in response.json()} == {
+        relevant_party.id,
+        sport_only_party.id,
+    }
+
+    # 전문 검색 최소 길이보다 짧은 검색어는 LIKE 검색
+    response = await client.get("/api/party/list", params={"search_query": "정기"})
+    assert [party["id"] for party in response.json()] == [sport_only_party.id]
+
+    # 수정된 내용도 검색 인덱스에 반영
+    await Party.filter(id=sport_only_party.id).update(body="펀다이빙 정기 모임")
+    # ORM으로 직접 수정했으므로 목록 캐시를 보정
+    await invalidate_party_list_pages()
+    response = await client.get("/api/party/list", params={"search_query": "펀다이빙"})
+    assert sport_only_party.id in {party["id"] for party in response.json()}
+
+
+@pytest.mark.asyncio
+async def test_get_party_details_cache_invalidation(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image.jpg"
+    )
+    participant_user = await User.create(
+        name="Participant User", profile_image="http://example.com/image2.jpg"
+    )
+    test_party = await Party.create(
+        title="Test Party",
+        body="Test Party body",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+        participant_limit=10,
+        sport=await Sport.create(name="Freediving"),
+        notice="파티원 공지",
+        place_name="딥스테이션",
+        address="경기도 용인시 처인구 784-2",
+        longitude=127.1997416,
+        latitude=37.2805605,
+    )
+    stats = party_detail_cache_stats.snapshot()
+
+    response = await client.get(f"/api/party/details/{test_party.id}")
+    assert response.status_code == status.HTTP_200_OK
+    response = await client.get(f"/api/party/details/{test_party.id}")
+    response_data = response.json()
+    assert party_detail_cache_stats.misses == stats["misses"] + 1
+    assert party_detail_cache_stats.hits == stats["hits"] + 1
+    # 캐시에는 공지가 있어도 비로그인 조회자에게는 노출하지 않음
+    assert (await get_cached_party_detail(test_party.id)).notice == "파티원 공지"
+    assert response_data["notice"] is None
+    assert response_data["is_user_organizer"] is False
+
+    # 참가 신청 후 캐시 삭제
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: participant_user
+    response = await client.post(f"/api/party/{test_party.id}/participate")
+    assert response.status_code == status.HTTP_201_CREATED
+    assert await get_cached_party_detail(test_party.id) is None
+
+    response = await client.get(f"/api/party/details/{test_party.id}")
+    assert len(response.json()["pending_participants"]) == 1
+
+    # 만료 처리된 파티의 캐시 삭제
+    await Party.filter(id=test_party.id).update(
+        gather_at=datetime.now(UTC) - timedelta(days=1)
+    )
+    await inactive_expired_parties()
+    response = await client.get(f"/api/party/details/{test_party.id}")
+    assert response.json()["is_active"] is False
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_party_details_coalesces_concurrent_requests(
+    client: AsyncClient,
+) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image.jpg"
+    )
+    test_party = await Party.create(
+        title="Test Party",
+        body="Test Party body",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+        participant_limit=10,
+        sport=await Sport.create(name="Freediving"),
+        place_name="딥스테이션",
+        address="경기도 용인시 처인구 784-2",
+        longitude=127.1997416,
+        latitude=37.2805605,
+    )
+    cache_key = CACHE_KEY_PARTY_DETAIL.format(party_id=test_party.id)
+
+    async def get_details_concurrently() -> int:
+        with patch.object(
+            PartyDetailService,
+            "_load_party_details",
+            wraps=PartyDetailService._load_party_details,
+        ) as mocked_load:
+            responses = await asyncio.gather(
+                *(client.get(f"/api/party/details/{test_party.id}") for _ in range(5))
+            )
+            # 백그라운드 갱신까지 끝난 뒤 로드 횟수 확인
+            await asyncio.gather(*party_detail_cache._refresh_tasks)
+        assert [r.status_code for r in responses] == [status.HTTP_200_OK] * 5
+        assert all(r.json()["title"] == responses[0].json()["title"] for r in responses)
+        return mocked_load.call_count
+
+    # 캐시가 없을 때 동시 요청은 한 번만 불러옴
+    assert await get_details_concurrently() == 1
+
+    # 갱신 시각이 지난 값은 그대로 응답하고 한 번만 백그라운드에서 갱신
+    cached_details, _ = await party_detail_cache.get_entry(cache_key)
+    await Party.filter(id=test_party.id).update(title="Updated Party")
+    await RedisManager().set_value(
+        cache_key,
+        {"value": cached_details.model_dump(), "fresh_until": 0},
+        expire=60,
+    )
+    assert await get_details_concurrently() == 1
+    refreshed_details, fresh_until = await party_detail_cache.get_entry(cache_key)
+    assert refreshed_details.title == "Updated Party"
+    assert fresh_until > datetime.now(UTC).timestamp()
+
+
+@pytest.mark.asyncio
+async def test_party_update_during_detail_load_is_not_overwritten(
+    client: AsyncClient,
+) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image.jpg"
+    )
+    test_party = await Party.create(
+        title="Test Party",
+        body="Test Party body",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+        participant_limit=10,
+        sport=await Sport.create(name="Freediving"),
+        place_name="딥스테이션",
+        address="경기도 용인시 처인구 784-2",
+        longitude=127.1997416,
+        latitude=37.2805605,
+    )
+    details_url = f"/api/party/details/{test_party.id}"
+    load_party_details = PartyDetailService._load_party_details
+    loaded = asyncio.Event()
+    release_load = asyncio.Event()
+
+    async def slow_load(party_id: int) -> Any:
+        party_details = await load_party_details(party_id)
+        loaded.set()
+        await release_load.wait()
+        return party_details
+
+    # 수정 전 정보를 불러온 로드가 수정(캐시 삭제) 이후에 끝남
+    with patch.object(PartyDetailService, "_load_party_details", slow_load):
+        pending = asyncio.ensure_future(client.get(details_url))
+        await loaded.wait()
+        from main import app
+
+        app.dependency_overrides[get_current_user] = lambda: organizer_user
+        response = await client.post(
+            f"/api/party/{test_party.id}", json={"title": "Updated Party"}
+        )
+        app.dependency_overrides.clear()
+        assert response.status_code == status.HTTP_200_OK
+        release_load.set()
+        assert (await pending).json()["title"] == "Test Party"
+
+    assert await get_cached_party_detail(test_party.id) is None
+    response = await client.get(details_url)
+    assert response.json()["title"] == "Updated Party"
+
+
+@pytest.mark.asyncio
+async def test_cache_load_does_not_overwrite_invalidation() -> None:
+    cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(
+        "test_generation", fresh_ttl=60, stale_ttl=60, dumps=str, loads=str
+    )
+    load_started = asyncio.Event()
+    release_load = asyncio.Event()
+
+    async def slow_load() -> str:
+        load_started.set()
+        await release_load.wait()
+        return "old"
+
+    async def invalidate_during_load(pending: Awaitable[Any]) -> Any:
+        task = asyncio.ensure_future(pending)
+        await load_started.wait()
+        await cache.invalidate("test_key")
+        release_load.set()
+        result = await task
+        load_started.clear()
+        release_load.clear()
+        return result
+
+    # 캐시가 없을 때: 로드 중 삭제되면 응답만 하고 저장하지 않음
+    assert await invalidate_during_load(cache.get("test_key", slow_load)) == "old"
+    assert await cache.get_entry("test_key") is None
+
+    # 백그라운드 갱신 중 삭제되어도 이전 값을 다시 쓰지 않음
+    await RedisManager().set_value(
+        "test_key", {"value": "stale", "fresh_until": 0}, expire=60
+    )
+    assert await cache.get("test_key", slow_load) == "stale"
+    await invalidate_during_load(asyncio.gather(*cache._refresh_tasks))
+    assert await cache.get_entry("test_key") is None
+
+    # 삭제가 없으면 그대로 저장
+    async def load() -> str:
+        return "new"
+
+    assert await cache.get("test_key", load) == "new"
+    assert (await cache.get_entry("test_key"))[0] == "new"
+
+
+@pytest.mark.asyncio
+async def test_party_endpoints_conditional_get(client: AsyncClient) -> None:
+    organizer_user = await User.create(
+        name="Organizer User", profile_image="http://example.com/image.jpg"
+    )
+    participant_user = await User.create(
+        name="Participant User", profile_image="http://example.com/image2.jpg"
+    )
+    test_party = await Party.create(
+        title="Test Party",
+        body="Test Party body",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+        participant_limit=10,
+        sport=await Sport.create(name="Freediving"),
+        place_name="딥스테이션",
+        address="경기도 용인시 처인구 784-2",
+        longitude=127.1997416,
+        latitude=37.2805605,
+    )
+
+    async def get_conditionally(url: str, etag: str) -> Any:
+        return await client.get(url, headers={"If-None-Match": etag})
+
+    # 상세: 변경이 없으면 304, 참가 신청으로 캐시가 삭제되면 새 ETag
+    details_url = f"/api/party/details/{test_party.id}"
+    response = await client.get(details_url)
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+    response = await get_conditionally(details_url, etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    # 없는 파티 조회로는 버전 키를 만들지 않음
+    response = await client.get(f"/api/party/details/{test_party.id + 1}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not await RedisManager().client.exists(
+        CACHE_KEY_PARTY_DETAIL_VERSION.format(party_id=test_party.id + 1)
+    )
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: participant_user
+    response = await client.post(f"/api/party/{test_party.id}/participate")
+    assert response.status_code == status.HTTP_201_CREATED
+    app.dependency_overrides.clear()
+
+    response = await get_conditionally(details_url, etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["pending_participants"]) == 1
+    assert response.headers["etag"] != etag
+
+    # 댓글: 댓글이 추가되면 새 ETag
+    comments_url = f"/api/party/{test_party.id}/comment"
+    response = await client.get(comments_url)
+    etag = response.headers["etag"]
+    response = await get_conditionally(comments_url, etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    await PartyComment.create(
+        party=test_party, commenter=participant_user, content="안녕하세요"
+    )
+    response = await get_conditionally(comments_url, etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+
+    # 종목: nginx/클라이언트가 재사용하는 기준 데이터
+    response = await client.get("/api/party/sports")
+    assert response.headers["cache-control"] == "public, max-age=300"
+    response = await get_conditionally("/api/party/sports", response.headers["etag"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_reapply_reuses_participation_row(client: AsyncClient) -> None:
+    organizer_user = await User.create(name="Organizer User")
+    participant_user = await User.create(name="Participant User")
+    test_party = await Party.create(
+        title="Test Party",
+        organizer_user=organizer_user,
+        gather_at=datetime.now(UTC) + timedelta(days=1),
+    )
+
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: participant_user
+    response = await client.post(f"/api/party/{test_party.id}/participate")
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await client.post(f"/api/party/{test_party.id}/participate")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await client.post(
+        f"/api/party/participants/{test_party.id}/status-change",
+        json={"new_status": ParticipationStatus.CANCELLED.value},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # 취소 후 재신청은 기존 신청을 대기 상태로 되돌림
+    response = await client.post(f"/api/party/{test_party.id}/participate")
+    assert response.status_code == status.HTTP_201_CREATED
+    participations = await PartyParticipant.filter(party=test_party)
+    assert [participation.status for participation in participations] == [
+        ParticipationStatus.PENDING
+    ]
+    party = await Party.get(id=test_party.id)
+    assert party.pending_count == 1
+
+    response = await client.post(f"/api/party/like/{test_party.id}")
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await client.post(f"/api/party/like/{test_party.id}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert await PartyLike.filter(party=test_party).count() == 1
+
+    app.dependency_overrides.clear()
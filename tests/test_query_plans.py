@@ -0,0 +1,99 @@
+from typing import List
+
+import pytest
+from tortoise import Tortoise
+from tortoise.queryset import QuerySetSingle, QuerySet
+
+from notifications.models import NotificationRead
+from notifications.service import NotificationService
+from parties.models import Party, ParticipationStatus, PartyLike, PartyParticipant
+from users.models import User
+
+
+async def explain(query: QuerySet | QuerySetSingle) -> List[str]:
+    """SQLite 실행 계획의 detail 목록"""
+    rows = await Tortoise.get_connection("default").execute_query_dict(
+        f"EXPLAIN QUERY PLAN {query.sql()}"
+    )
+    return [row["detail"] for row in rows]
+
+
+def assert_uses_index(plan: List[str], index_name: str) -> None:
+    assert any(index_name in detail for detail in plan), plan
+    assert not any(detail.startswith("SCAN") for detail in plan), plan
+
+
+@pytest.mark.asyncio
+async def test_party_queries_use_indexes() -> None:
+    # 파티 참가자 목록 (알림 대상 조회)
+    assert_uses_index(
+        await explain(
+            PartyParticipant.filter(party_id=1, status=ParticipationStatus.APPROVED)
+        ),
+        "idx_party_parti_party_i_afdb43",
+    )
+    # 알림 outbox 의 파티원 배치 조회 (사용자 ID 순, 정렬 없이 limit)
+    outbox_plan = await explain(
+        PartyParticipant.filter(
+            party_id=1,
+            status__in=(ParticipationStatus.APPROVED, ParticipationStatus.PENDING),
+            participant_user_id__gt=0,
+        )
+        .order_by("participant_user_id")
+        .limit(100)
+    )
+    assert_uses_index(outbox_plan, "idx_party_parti_party_i_af1c5b")
+    assert not any("TEMP B-TREE" in detail for detail in outbox_plan), outbox_plan
+    # 사용자별 참가 파티 수
+    assert_uses_index(
+        await explain(
+            PartyParticipant.filter(
+                participant_user_id=1,
+                status__in=(ParticipationStatus.APPROVED, ParticipationStatus.PENDING),
+            ).count()
+        ),
+        "idx_party_parti_partici_a176fd",
+    )
+    # 신청 여부 / 좋아요 여부 확인은 유니크 키 사용
+    assert_uses_index(
+        await explain(PartyParticipant.get_or_none(participant_user_id=1, party_id=1)),
+        "sqlite_autoindex_party_participants",
+    )
+    assert_uses_index(
+        await explain(PartyLike.filter(user_id=1, party_id=1)),
+        "sqlite_autoindex_party_likes",
+    )
+    # 근처 파티 조회는 geohash prefix 범위 사용
+    assert_uses_index(
+        await explain(
+            Party.filter(
+                geohash__gte="wydm9", geohash__lt="wydm9~", latitude__gte=37.5
+            ).values_list("id", "latitude", "longitude")
+        ),
+        "idx_parties_geohash_913ef9",
+    )
+
+
+@pytest.mark.asyncio
+async def test_notification_queries_use_indexes() -> None:
+    user = await User.create(name="Test User")
+    service = NotificationService(user)
+
+    personal_stream, global_stream = service._notification_streams()
+    assert_uses_index(
+        await explain(personal_stream.filter(id__lt=100).order_by("-id").limit(10)),
+        "idx_notificatio_target__83dc24",
+    )
+    assert_uses_index(
+        await explain(global_stream.filter(id__lt=100).order_by("-id").limit(10)),
+        "idx_notificatio_is_glob_023320",
+    )
+
+    assert_uses_index(
+        await explain(
+            NotificationRead.filter(user=user, notification_id__in=[1, 2]).values_list(
+                "notification_id", flat=True
+            )
+        ),
+        "sqlite_autoindex_notifications_read",
+    )
@@ -15,9 +15,19 @@ from starlette import status
 
 from common.config import AWS_S3_URL
 from common.dependencies import get_current_user
+from common.middlewares import MESSAGE_UPLOAD_TOO_LARGE
 from parties.models import Party, PartyLike, PartyParticipant, ParticipationStatus
 from users.auth import GoogleAuth
-from users.models import User, UserToken, Sport, UserInterestedSport
+from users.cache import auth_user_cache_stats, user_party_statistics_cache_stats
+from users.models import (
+    Certificate,
+    CertificateLevel,
+    User,
+    UserToken,
+    Sport,
+    UserInterestedSport,
+)
+from users.utils import create_access_token
 
 
 @pytest.mark.asyncio
@@ -71,6 +81,44 @@ async def test_social_auth_google(
     assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
 
 
+@patch("users.auth.id_token.verify_oauth2_token", return_value=MOCKED_GOOGLE_USER_INFO)
+@patch("httpx.AsyncClient.post")
+@pytest.mark.asyncio
+async def test_social_auth_profile_image_change_invalidates_party_caches(
+    mock_post: Mock, mock_verify: Mock, client: AsyncClient
+) -> None:
+    mock_post.return_value.json = lambda: {
+        "access_token": "mock_access_token",
+        "id_token": "mock_id_token",
+        "expires_in": 3599,
+        "token_type": "Bearer",
+    }
+    user = await User.create(
+        sns_id=MOCKED_GOOGLE_USER_INFO["sub"],
+        email=MOCKED_GOOGLE_USER_INFO["email"],
+        name="John Doe",
+        profile_image="https://old.profile.image.url",
+    )
+    party = await Party.create(
+        title="Test Party",
+        organizer_user=user,
+        gather_at=datetime.now(ZoneInfo("UTC")) + timedelta(days=1),
+    )
+
+    with patch(
+        "users.services.invalidate_party_detail", new_callable=AsyncMock
+    ) as mocked_invalidate:
+        response = await client.get(
+            "/api/user/auth/google", params={"code": "testcode"}
+        )
+
+    assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+    updated_user = await User.get(id=user.id)
+    assert updated_user.profile_image == MOCKED_GOOGLE_USER_INFO["picture"]
+    # 파티장 프로필 사진이 포함된 파티 상세/카드 캐시 삭제
+    mocked_invalidate.assert_awaited_once_with(party.id)
+
+
 @pytest.mark.asyncio
 async def test_refresh_token_endpoint(client: AsyncClient) -> None:
     # 테스트 데이터 세팅
@@ -166,6 +214,7 @@ async def test_success_get_liked_parties(client: AsyncClient) -> None:
         gather_at=datetime.now() + timedelta(days=2),
         body="Test Party Body",
         organizer_user=organizer,
+        participant_limit=5,
         sport=sport,
         place_id=123215213,
         place_name="딥스테이션",
@@ -201,6 +250,9 @@ async def test_success_get_liked_parties(client: AsyncClient) -> None:
     # 응답 검증
     assert response.status_code == 200
     assert len(response_json) == 2
+    # 다른 목록과 같은 카드를 사용하므로 참가 인원에 파티장 포함
+    assert response_json[1]["id"] == party_1.id
+    assert response_json[1]["participants_info"] == "1/5"
 
     # 오버라이드 초기화
     app.dependency_overrides.clear()
@@ -483,3 +535,188 @@ async def test_get_user_party_statistics(client: AsyncClient) -> None:
 
     # Clean up dependency overrides
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_user_party_statistics_counters(
+    client: AsyncClient, monkeypatch: MonkeyPatch
+) -> None:
+    # 증감이 카운터에 누적되는지 확인하도록 재계산 직후 카운터 삭제 기간을 끔
+    monkeypatch.setattr("common.cache_utils.COUNTER_REBUILD_SETTLE_SECONDS", 0)
+    from main import app
+
+    user = await User.create(email="user@example.com", name="Test User")
+    organizer = await User.create(email="organizer@example.com", name="Organizer")
+    sport = await Sport.create(name="Test Sport")
+    party = await Party.create(
+        title="Organizer's Party",
+        gather_at=datetime.now(ZoneInfo("UTC")) + timedelta(days=2),
+        organizer_user=organizer,
+        sport=sport,
+    )
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    # 카운터가 없으면 DB 기준으로 계산해 저장
+    misses = user_party_statistics_cache_stats.misses
+    response = await client.get("/api/user/party/stats")
+    assert response.json()["participated_count"] == 0
+    assert user_party_statistics_cache_stats.misses == misses + 1
+
+    # 좋아요/참가 신청/취소는 카운터에 바로 반영 (DB 재계산 없음)
+    assert (await client.post(f"/api/party/like/{party.id}")).status_code == 201
+    assert (await client.post(f"/api/party/{party.id}/participate")).status_code == 201
+    response = await client.get("/api/user/party/stats")
+    assert response.json() == {
+        "created_count": 0,
+        "participated_count": 1,
+        "liked_count": 1,
+    }
+    response = await client.post(
+        f"/api/party/participants/{party.id}/status-change",
+        json={"new_status": ParticipationStatus.CANCELLED.value},
+    )
+    assert response.status_code == 200
+    response = await client.get("/api/user/party/stats")
+    assert response.json()["participated_count"] == 0
+    assert user_party_statistics_cache_stats.misses == misses + 1
+
+    # 파티 삭제 시 관련 사용자의 카운터를 삭제해 다시 계산
+    app.dependency_overrides[get_current_user] = lambda: organizer
+    assert (await client.delete(f"/api/party/{party.id}")).status_code == 204
+    app.dependency_overrides[get_current_user] = lambda: user
+    response = await client.get("/api/user/party/stats")
+    assert response.json()["liked_count"] == 0
+    assert user_party_statistics_cache_stats.misses == misses + 2
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_login_access_token_from_cached_uuid(client: AsyncClient) -> None:
+    from common.cache_constants import CACHE_KEY_LOGIN_REDIRECT_UUID
+    from common.cache_utils import RedisManager
+
+    user = await User.create(
+        email="cached@example.com",
+        sns_id="cached_sns_id",
+        name="Cached User",
+        profile_image="https://path/to/image",
+    )
+    await RedisManager().set_value(
+        CACHE_KEY_LOGIN_REDIRECT_UUID.format(uuid="login-uuid"), [user.id, True]
+    )
+
+    response = await client.post(
+        "/api/user/auth/token", json={"user_uid": "login-uuid"}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["is_new_user"] is True
+    assert response.json()["user_info"]["sns_id"] == "cached_sns_id"
+
+    response = await client.post("/api/user/auth/token", json={"user_uid": "unknown"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_uses_user_cache(client: AsyncClient) -> None:
+    user = await User.create(
+        email="user@example.com",
+        name="Test User",
+        profile_image="https://path/to/image",
+    )
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'user_id': user.id})}"
+    }
+    stats = auth_user_cache_stats.snapshot()
+
+    response = await client.get("/api/user/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    response = await client.get("/api/user/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["name"] == "Test User"
+    assert auth_user_cache_stats.misses == stats["misses"] + 1
+    assert auth_user_cache_stats.hits == stats["hits"] + 1
+
+    # 프로필 변경 시 캐시 삭제
+    response = await client.post(
+        "/api/user/me", json={"name": "Updated Name"}, headers=headers
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = await client.get("/api/user/me", headers=headers)
+    assert response.json()["name"] == "Updated Name"
+    assert auth_user_cache_stats.misses == stats["misses"] + 2
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_rejects_invalid_token(client: AsyncClient) -> None:
+    response = await client.get(
+        "/api/user/me", headers={"Authorization": "Bearer invalid-token"}
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json()["detail"].startswith("Could not validate credentials")
+
+
+@pytest.mark.asyncio
+async def test_upload_size_limit(client: AsyncClient) -> None:
+    user = await User.create(name="Test User")
+    from main import app
+
+    app.dependency_overrides[get_current_user] = lambda: user
+    too_large_body = (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="profile_image"; filename="a.jpg"\r\n'
+        b"Content-Type: image/jpeg\r\n\r\n"
+        + b"0" * (10 * 1024 * 1024)
+        + b"\r\n--boundary--\r\n"
+    )
+    headers = {"Content-Type": "multipart/form-data; boundary=boundary"}
+
+    response = await client.post(
+        "/api/user/me/profile-image", content=too_large_body, headers=headers
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert response.json() == {"detail": MESSAGE_UPLOAD_TOO_LARGE}
+
+    # content-length 없는 chunked 업로드도 제한
+    async def chunked_body() -> Any:
+        for offset in range(0, len(too_large_body), 1024 * 1024):
+            yield too_large_body[offset : offset + 1024 * 1024]
+
+    response = await client.post(
+        "/api/user/me/profile-image",
+        content=chunked_body(),
+        headers=headers,
+    )
+    assert "content-length" not in response.request.headers
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    # content-length 초과와 같은 JSON 응답
+    assert response.json() == {"detail": MESSAGE_UPLOAD_TOO_LARGE}
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_certificate_levels_conditional_get(client: AsyncClient) -> None:
+    certificate = await Certificate.create(name="AIDA")
+    await CertificateLevel.create(certificate=certificate, level="Level 1")
+    url = f"/api/user/certificates/{certificate.id}/levels"
+
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["cache-control"] == "public, max-age=300"
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    response = await client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # 레벨이 추가되면 새 ETag 로 다시 응답
+    await CertificateLevel.create(certificate=certificate, level="Level 2")
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 2
@@ -0,0 +1,233 @@
+import time
+from datetime import datetime
+from os import getenv
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from redis.exceptions import WatchError
+
+from common.cache_constants import (
+    CACHE_KEY_AUTH_USER,
+    CACHE_KEY_USER_PARTY_STATISTICS,
+    DURATION_AUTH_USER,
+    DURATION_USER_PARTY_STATISTICS,
+)
+from common.cache_utils import (
+    FIELD_REBUILT_AT,
+    LocalTTLCache,
+    RedisManager,
+    get_cache_stats,
+    is_recently_rebuilt,
+)
+from common.config import logger
+from users.models import User
+
+# 워커 내 캐시: 다른 워커의 변경은 TTL 이 지나야 반영되므로 짧게 유지
+AUTH_USER_CACHE_TTL = float(getenv("AUTH_USER_CACHE_TTL", 30))
+AUTH_USER_CACHE_MAXSIZE = int(getenv("AUTH_USER_CACHE_MAXSIZE", 10000))
+# 멀티 워커 배포에서 워커 간 공유 캐시로 Redis 사용 여부
+AUTH_USER_CACHE_USE_REDIS = getenv("AUTH_USER_CACHE_USE_REDIS", "false") == "true"
+
+_local_user_cache = LocalTTLCache(
+    maxsize=AUTH_USER_CACHE_MAXSIZE, ttl=AUTH_USER_CACHE_TTL
+)
+auth_user_cache_stats = get_cache_stats("auth_user")
+
+# 사용자별 파티 통계 hash 필드
+FIELD_CREATED_COUNT = "created"
+FIELD_PARTICIPATED_COUNT = "participated"
+FIELD_LIKED_COUNT = "liked"
+# DB 기준으로 다시 계산해 저장한 hash 에만 있는 필드 (증가만 된 불완전한 hash 구분)
+FIELD_STATISTICS_SYNCED = "synced"
+PARTY_STATISTICS_FIELDS = (
+    FIELD_CREATED_COUNT,
+    FIELD_PARTICIPATED_COUNT,
+    FIELD_LIKED_COUNT,
+)
+PARTY_STATISTICS_REBUILD_RETRIES = 3
+
+user_party_statistics_cache_stats = get_cache_stats("user_party_statistics")
+
+
+def _serialize_user(user: User) -> Dict[str, Any]:
+    """User 를 DB 컬럼 기준 dict 로 변환 (datetime 은 ISO 문자열)"""
+    row = {}
+    for field_name, column in User._meta.fields_db_projection.items():
+        value = getattr(user, field_name)
+        row[column] = value.isoformat() if isinstance(value, datetime) else value
+    return row
+
+
+def _deserialize_user(row: Dict[str, Any]) -> User:
+    # 요청마다 새 인스턴스를 만들어 요청 간 객체 공유(변경 전파)를 막음
+    return User._init_from_db(**row)
+
+
+async def get_auth_user(user_id: int) -> Optional[User]:
+    """
+    인증 미들웨어용 사용자 조회
+    워커 내 캐시 -> (설정 시) Redis -> DB 순으로 조회합니다.
+    :param user_id: 토큰의 user_id
+    :return: User, 존재하지 않으면 None
+    """
+    row = _local_user_cache.get(user_id)
+    if row is not None:
+        auth_user_cache_stats.hit()
+        return _deserialize_user(row)
+
+    cache_key = CACHE_KEY_AUTH_USER.format(user_id=user_id)
+    if AUTH_USER_CACHE_USE_REDIS:
+        try:
+            row = await RedisManager().get_value(cache_key)
+        except Exception as e:
+            logger.error(f"[Auth User Cache] get error, user_id:{user_id}, msg:{e}")
+        if row is not None:
+            auth_user_cache_stats.hit()
+            _local_user_cache.set(user_id, row)
+            return _deserialize_user(row)
+
+    auth_user_cache_stats.miss()
+    user = await User.get_or_none(id=user_id)
+    if user is None:
+        return None
+
+    row = _serialize_user(user)
+    _local_user_cache.set(user_id, row)
+    if AUTH_USER_CACHE_USE_REDIS:
+        try:
+            await RedisManager().set_value(cache_key, row, expire=DURATION_AUTH_USER)
+        except Exception as e:
+            logger.error(f"[Auth User Cache] set error, user_id:{user_id}, msg:{e}")
+    return user
+
+
+async def invalidate_auth_user(user_id: int) -> None:
+    """프로필 변경, 활성 상태 변경 시 캐시 삭제"""
+    _local_user_cache.delete(user_id)
+    if AUTH_USER_CACHE_USE_REDIS:
+        try:
+            await RedisManager().delete_value(
+                CACHE_KEY_AUTH_USER.format(user_id=user_id)
+            )
+        except Exception as e:
+            logger.error(
+                f"[Auth User Cache] invalidate error, user_id:{user_id}, msg:{e}"
+            )
+
+
+def clear_local_auth_user_cache() -> None:
+    _local_user_cache.clear()
+
+
+def _party_statistics_key(user_id: int) -> str:
+    return CACHE_KEY_USER_PARTY_STATISTICS.format(user_id=user_id)
+
+
+async def increment_party_statistics(
+    user_id: Optional[int], created: int = 0, participated: int = 0, liked: int = 0
+) -> None:
+    """
+    파티 생성/참가 신청/좋아요 변경 시 사용자 통계 카운터 갱신 (DB 커밋 이후 호출)
+    카운터가 없는 사용자는 불완전한 hash 가 생기지만, 조회 시 다시 계산됩니다.
+    다시 계산한 직후의 카운터는 이 변경이 이미 집계되었을 수 있으므로 삭제합니다.
+    """
+    deltas = {
+        FIELD_CREATED_COUNT: created,
+        FIELD_PARTICIPATED_COUNT: participated,
+        FIELD_LIKED_COUNT: liked,
+    }
+    if user_id is None or not any(deltas.values()):
+        return
+    key = _party_statistics_key(user_id)
+    try:
+        pipe = RedisManager().pipeline()
+        for field, delta in deltas.items():
+            if delta:
+                pipe.hincrby(key, field, delta)
+        pipe.hget(key, FIELD_REBUILT_AT)
+        *_, rebuilt_at = await pipe.execute()
+        if is_recently_rebuilt(rebuilt_at):
+            await RedisManager().delete_value(key)
+    except Exception as e:
+        logger.error(
+            f"[User Party Statistics] increment error, user_id:{user_id}, msg:{e}"
+        )
+
+
+async def get_cached_party_statistics(user_id: int) -> Optional[Dict[str, int]]:
+    """
+    Redis 만으로 사용자 파티 통계를 조회합니다.
+    :return: 필드별 개수, 카운터가 없거나 불완전하면 None
+    """
+    try:
+        values = await RedisManager().client.hmget(
+            _party_statistics_key(user_id),
+            FIELD_STATISTICS_SYNCED,
+            *PARTY_STATISTICS_FIELDS,
+        )
+    except Exception as e:
+        logger.error(f"[User Party Statistics] get error, user_id:{user_id}, msg:{e}")
+        return None
+
+    synced, *counts = values
+    if synced is None or any(count is None for count in counts):
+        user_party_statistics_cache_stats.miss()
+        return None
+    user_party_statistics_cache_stats.hit()
+    return {
+        field: max(int(count), 0)
+        for field, count in zip(PARTY_STATISTICS_FIELDS, counts)
+    }
+
+
+async def rebuild_party_statistics(
+    user_id: int, count_from_db: Callable[[], Awaitable[Dict[str, int]]]
+) -> Dict[str, int]:
+    """
+    DB 기준으로 통계 카운터를 다시 계산해 저장합니다.
+    계산 중 카운터가 변경되면(WATCH 키 변경) 다시 계산하고,
+    저장 이후 늦게 도착한 증감은 계산 시각(rebuilt_at)을 보고 카운터를 삭제합니다.
+    """
+    key = _party_statistics_key(user_id)
+    statistics: Optional[Dict[str, int]] = None
+    for _ in range(PARTY_STATISTICS_REBUILD_RETRIES):
+        try:
+            async with RedisManager().pipeline(transaction=True) as pipe:
+                await pipe.watch(key)
+                statistics = await count_from_db()
+                pipe.multi()
+                pipe.delete(key)
+                pipe.hset(
+                    key,
+                    mapping={
+                        **statistics,
+                        FIELD_STATISTICS_SYNCED: 1,
+                        FIELD_REBUILT_AT: time.time(),
+                    },
+                )
+                pipe.expire(key, DURATION_USER_PARTY_STATISTICS)
+                await pipe.execute()
+                return statistics
+        except WatchError:
+            continue
+        except Exception as e:
+            logger.error(
+                f"[User Party Statistics] rebuild error, user_id:{user_id}, msg:{e}"
+            )
+            break
+    # 저장하지 못한 경우에도 마지막으로 계산한 DB 값을 반환
+    return statistics if statistics is not None else await count_from_db()
+
+
+async def invalidate_party_statistics(user_ids: Iterable[Optional[int]]) -> None:
+    """파티 삭제 등 여러 사용자의 통계가 바뀐 경우 카운터 삭제 (조회 시 다시 계산)"""
+    keys = [
+        _party_statistics_key(user_id)
+        for user_id in set(user_ids)
+        if user_id is not None
+    ]
+    if not keys:
+        return
+    try:
+        await RedisManager().delete_value(*keys)
+    except Exception as e:
+        logger.error(f"[User Party Statistics] invalidate error, msg:{e}")
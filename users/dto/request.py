@@ -15,7 +15,9 @@ class AccessTokenRequest(BaseModel):
 
 
 class NotificationReadRequest(BaseModel):
-    read_notification_list: list[int]
+    read_notification_list: list[int] = []
+    # 이 ID 이하의 알림을 모두 읽음 처리
+    read_up_to_id: Optional[int] = None
 
 
 class UserProfileUpdateRequest(BaseModel):
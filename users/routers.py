@@ -2,7 +2,7 @@ import uuid
 import traceback
 from typing import List, Optional, Any
 
-from fastapi import APIRouter, HTTPException, status, Depends, Request
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
 from fastapi import UploadFile
 from fastapi.responses import RedirectResponse
 
@@ -14,6 +14,8 @@ from common.constants import (
     AUTH_PLATFORM_GOOGLE,
     AUTH_PLATFORM_KAKAO,
     AUTH_PLATFORM_NAVER,
+    CACHE_CONTROL_REFERENCE_DATA,
+    HEADER_NEXT_CURSOR,
 )
 from common.dependencies import get_current_user
 from common.logging_configs import LoggingAPIRoute
@@ -25,7 +27,12 @@ from common.mixpanel_constants import (
     MIXPANEL_EVENT_CHANGE_PROFILE_IMAGE,
     MIXPANEL_EVENT_CHANGE_PROFILE,
 )
-from common.utils import track_mixpanel
+from common.utils import (
+    build_etag,
+    get_not_modified_response,
+    get_table_version,
+    track_mixpanel,
+)
 from parties.dtos import PartyListDetail
 from parties.services import PartyLikeService
 from users.auth import GoogleAuth, KakaoAuth, SocialLogin, NaverAuth
@@ -53,7 +60,7 @@ from users.models import (
     CertificateLevel_Pydantic,
     UserToken,
 )
-from users.services import SelfProfileService
+from users.services import SelfProfileService, invalidate_user_profile_caches
 from users.utils import (
     create_refresh_token,
     create_access_token,
@@ -167,6 +174,8 @@ async def social_auth_callback(
                 user.email = user_info.email
                 user.profile_image = user_info.profile_image
                 await user.save()
+                # 프로필 사진이 포함된 인증 사용자, 파티 상세/카드 캐시 삭제
+                await invalidate_user_profile_caches(user)
 
         # Access, Refresh 토큰 생성 및 저장
         access_token = create_access_token(data={"user_id": user.id})
@@ -201,7 +210,7 @@ async def login_access_token(body: AccessTokenRequest) -> AccessTokenResponse:
     user_uuid = body.user_uid
     r = RedisManager()
     cache_key = CACHE_KEY_LOGIN_REDIRECT_UUID.format(uuid=user_uuid)
-    user_id, is_new_user = r.get_value(cache_key)
+    user_id, is_new_user = await r.get_value(cache_key) or (None, False)
     if not user_id:
         logger.error(f"[LOGIN API ERROR]: INVALID uuid: {user_uuid}")
         raise HTTPException(
@@ -278,7 +287,17 @@ async def logout(user: User = Depends(get_current_user)) -> str:
     response_model=List[CertificateName_Pydantic],
     status_code=status.HTTP_200_OK,
 )
-async def certificate_level_list() -> Any:
+async def certificate_level_list(request: Request, response: Response) -> Any:
+    row_count, last_modified = await get_table_version(Certificate.all())
+    not_modified = get_not_modified_response(
+        request,
+        response,
+        build_etag("certificates", row_count, last_modified),
+        CACHE_CONTROL_REFERENCE_DATA,
+        last_modified,
+    )
+    if not_modified is not None:
+        return not_modified
     certificates = await CertificateName_Pydantic.from_queryset(Certificate.all())
     return certificates
 
@@ -288,7 +307,21 @@ async def certificate_level_list() -> Any:
     response_model=List[CertificateLevel_Pydantic],
     status_code=status.HTTP_200_OK,
 )
-async def get_certificate_levels(certificate_id: int) -> Any:
+async def get_certificate_levels(
+    certificate_id: int, request: Request, response: Response
+) -> Any:
+    row_count, last_modified = await get_table_version(
+        CertificateLevel.filter(certificate_id=certificate_id)
+    )
+    not_modified = get_not_modified_response(
+        request,
+        response,
+        build_etag("certificate_levels", certificate_id, row_count, last_modified),
+        CACHE_CONTROL_REFERENCE_DATA,
+        last_modified,
+    )
+    if not_modified is not None:
+        return not_modified
     levels = await CertificateLevel_Pydantic.from_queryset(
         CertificateLevel.filter(certificate_id=certificate_id)
     )
@@ -301,12 +334,17 @@ async def get_certificate_levels(certificate_id: int) -> Any:
     status_code=status.HTTP_200_OK,
 )
 async def get_liked_parties(
+    response: Response,
     user: User = Depends(get_current_user),
     page: int = 1,
+    cursor: Optional[str] = None,
 ) -> List[PartyListDetail]:
     service = PartyLikeService(user)
     try:
-        return await service.get_liked_parties(page=page)
+        liked_parties = await service.get_liked_parties(page=page, cursor=cursor)
+        if service.next_cursor:
+            response.headers[HEADER_NEXT_CURSOR] = service.next_cursor
+        return liked_parties
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
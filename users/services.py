@@ -1,15 +1,41 @@
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 from fastapi import UploadFile
 
 from common.config import AWS_S3_URL
-from common.utils import s3_upload_file
-from parties.models import PartyParticipant, Party, ParticipationStatus, PartyLike
+from common.utils import gather_queries, s3_upload_file
+from parties.cache import invalidate_party_detail
+from parties.models import PartyParticipant, Party, PartyLike, PARTICIPATED_STATUSES
 from users.dto.response import SelfProfileResponse, UserPartyStatisticsResponse
 from users.dtos import SportInfo
 from users.models import User
 from users.models import UserInterestedSport, Sport
+from users.cache import (
+    FIELD_CREATED_COUNT,
+    FIELD_LIKED_COUNT,
+    FIELD_PARTICIPATED_COUNT,
+    get_cached_party_statistics,
+    invalidate_auth_user,
+    rebuild_party_statistics,
+)
+
+
+async def invalidate_user_profile_caches(user: User) -> None:
+    """
+    사용자 이름/프로필 사진 변경 후 캐시 삭제
+    인증 사용자 캐시와, 파티장/파티원 정보가 포함된 파티 상세/카드 캐시를 함께 삭제합니다.
+    """
+    await invalidate_auth_user(user.id)
+    organized_party_ids, participated_party_ids = await gather_queries(
+        Party.filter(organizer_user=user).values_list("id", flat=True),
+        PartyParticipant.filter(participant_user=user).values_list(
+            "party_id", flat=True
+        ),
+    )
+    await invalidate_party_detail(
+        *set(organized_party_ids) | set(participated_party_ids)
+    )
 
 
 class SelfProfileService:
@@ -58,6 +84,7 @@ class SelfProfileService:
                 await UserInterestedSport.create(user=self.user, sport=sport)
 
         await self.user.save()
+        await invalidate_user_profile_caches(self.user)
 
         return await self.get_profile()
 
@@ -74,18 +101,35 @@ class SelfProfileService:
                 self.user.profile_image = full_image_url
 
         await self.user.save()
+        await invalidate_user_profile_caches(self.user)
 
         return await self.get_profile()
 
     async def get_party_statistics(self) -> UserPartyStatisticsResponse:
-        created_count = await Party.filter(organizer_user=self.user).count()
-        participated_count = await PartyParticipant.filter(
-            participant_user=self.user,
-            status__in=(ParticipationStatus.APPROVED, ParticipationStatus.PENDING),
-        ).count()
-        liked_count = await PartyLike.filter(user=self.user).count()
+        """Redis 통계 카운터로 응답하고, 카운터가 없으면 DB 기준으로 다시 계산"""
+        statistics = await get_cached_party_statistics(self.user.id)
+        if statistics is None:
+            statistics = await rebuild_party_statistics(
+                self.user.id, self._count_party_statistics_from_db
+            )
         return UserPartyStatisticsResponse(
-            created_count=created_count,
-            participated_count=participated_count,
-            liked_count=liked_count,
+            created_count=statistics[FIELD_CREATED_COUNT],
+            participated_count=statistics[FIELD_PARTICIPATED_COUNT],
+            liked_count=statistics[FIELD_LIKED_COUNT],
+        )
+
+    async def _count_party_statistics_from_db(self) -> Dict[str, int]:
+        # 서로 독립적인 count 쿼리이므로 동시에 실행
+        created_count, participated_count, liked_count = await gather_queries(
+            Party.filter(organizer_user=self.user).count(),
+            PartyParticipant.filter(
+                participant_user=self.user,
+                status__in=PARTICIPATED_STATUSES,
+            ).count(),
+            PartyLike.filter(user=self.user).count(),
         )
+        return {
+            FIELD_CREATED_COUNT: created_count,
+            FIELD_PARTICIPATED_COUNT: participated_count,
+            FIELD_LIKED_COUNT: liked_count,
+        }